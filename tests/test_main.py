@@ -1,7 +1,11 @@
 """Tests for testzeus_mcp_server.__main__ module."""
 
+import logging
+import os
+import subprocess
 import sys
 from io import StringIO
+from pathlib import Path
 from unittest.mock import MagicMock, patch, Mock
 
 import pytest
@@ -231,4 +235,63 @@ class TestMain:
             sys.stdout = sys.__stdout__
 
             # Each call should increment the call count
-            assert second_call_count == first_call_count + 1
\ No newline at end of file
+            assert second_call_count == first_call_count + 1
+
+
+class TestEventLoop:
+    """Test suite for event loop selection."""
+
+    def test_uvloop_policy_installed_when_available(self):
+        """Test that the uvloop event loop policy is used when uvloop imports."""
+        from testzeus_mcp_server.__main__ import _install_uvloop
+
+        policy = Mock()
+        fake_uvloop = Mock(EventLoopPolicy=Mock(return_value=policy))
+
+        with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+            with patch("asyncio.set_event_loop_policy") as set_policy:
+                _install_uvloop()
+
+        set_policy.assert_called_once_with(policy)
+
+    def test_default_loop_kept_without_uvloop(self):
+        """Test that the default asyncio loop is kept when uvloop is missing."""
+        from testzeus_mcp_server.__main__ import _install_uvloop
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            with patch("asyncio.set_event_loop_policy") as set_policy:
+                _install_uvloop()
+
+        set_policy.assert_not_called()
+
+
+class TestLogging:
+    """Test suite for the TESTZEUS_LOG_LEVEL setting."""
+
+    @staticmethod
+    def _root_level_after_import(level):
+        """Import the package in a fresh interpreter and return the root log level."""
+        env = {k: v for k, v in os.environ.items() if k != "TESTZEUS_LOG_LEVEL"}
+        if level is not None:
+            env["TESTZEUS_LOG_LEVEL"] = level
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import logging, testzeus_mcp_server; print(logging.getLogger().level)",
+            ],
+            env=env,
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return int(result.stdout.strip().splitlines()[-1])
+
+    def test_log_level_defaults_to_warning(self):
+        """Test that only warnings and errors are logged by default."""
+        assert self._root_level_after_import(None) == logging.WARNING
+
+    def test_log_level_set_from_env(self):
+        """Test that TESTZEUS_LOG_LEVEL sets the root log level."""
+        assert self._root_level_after_import("debug") == logging.DEBUG
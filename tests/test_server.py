@@ -5,8 +5,15 @@ Full integration tests would require the actual testzeus_sdk dependency.
 """
 
 import ast
+import asyncio
+import base64
+import inspect
 import json
+import threading
+import time
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -125,6 +132,1012 @@ class TestDateTimeEncoder:
         assert parsed["timestamp"] == "2024-01-01T00:00:00"
 
 
+class TestPayloadSerialization:
+    """Test suite for the orjson-backed payload serializer."""
+
+    def test_dumps_matches_json_output(self):
+        """Test that orjson indented output round-trips like json.dumps."""
+        orjson = pytest.importorskip("orjson")
+
+        data = {
+            "name": "test",
+            "count": 3,
+            "tags": ["a", "b"],
+            "created": datetime(2024, 1, 15, 10, 30, 45),
+            1: "non-string key",
+        }
+        result = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        parsed = json.loads(result)
+
+        assert parsed["created"] == "2024-01-15T10:30:45"
+        assert parsed["1"] == "non-string key"
+        assert parsed["tags"] == ["a", "b"]
+
+    def test_server_uses_dumps_helper(self):
+        """Test that tool payloads go through the shared _dumps helper."""
+        with open("testzeus_mcp_server/server.py") as f:
+            content = f.read()
+            assert "def _dumps(" in content
+            assert "indent=2" not in content
+
+    def test_payloads_are_compact_by_default(self, server):
+        """Test that tool payloads carry no indentation whitespace."""
+        assert server._dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_large_data_content_is_replaced_by_handle(self, server):
+        """Test that list rows summarize large data content and keep small content inline."""
+        small = {"items": [{"key": "user", "value": "alice", "type": "variable"}]}
+        large = {
+            "items": [{"key": f"k{i}", "value": "x" * 20, "type": "variable"} for i in range(30)]
+        }
+
+        assert server._data_handle(small, "test-data://d1") == small
+        handle = server._data_handle(large, "test-data://d1")
+        assert handle["resource"] == "test-data://d1"
+        assert len(handle["summary"]) == server._DATA_SUMMARY_CHARS
+
+    def test_naive_datetimes_are_written_as_utc(self, server):
+        """Test that naive datetimes are serialized with an explicit UTC offset."""
+        payload = {"created": datetime(2024, 1, 15, 10, 30, 45)}
+
+        assert json.loads(server._dumps(payload))["created"] == "2024-01-15T10:30:45+00:00"
+        assert server._dumps_compact(payload) == '{"created":"2024-01-15T10:30:45+00:00"}'
+
+    def test_registered_sdk_models_are_encoded_by_type(self, server):
+        """Test that _dumps serializes registered SDK models and rejects other objects."""
+        from testzeus_sdk.models.tag import Tag
+
+        tag = Tag({"id": "g1", "name": "env", "value": "prod"})
+
+        assert json.loads(server._dumps([tag])) == [
+            {"id": "g1", "name": "env", "value": "prod", "uri": "tag://g1"}
+        ]
+        with pytest.raises(TypeError):
+            server._dumps(object())
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Import the server module with a mocked, unauthenticated TestZeus client."""
+    pytest.importorskip("testzeus_sdk")
+    from testzeus_mcp_server import server
+
+    client = MagicMock()
+    client.ensure_authenticated = AsyncMock()
+    monkeypatch.setattr(server, "testzeus_client", client)
+    monkeypatch.setattr(server, "_auth_ok_until", 0.0)
+    monkeypatch.setattr(server, "_auth_future", None)
+    server._entity_cache.clear()
+    server._prefetched_pages.clear()
+    return server
+
+
+class TestAuthenticationCache:
+    """Test suite for the cached authentication check."""
+
+    async def test_successful_check_is_cached(self, server):
+        """Test that a second call inside the TTL skips the SDK round-trip."""
+        assert await server.ensure_authenticated()
+        assert await server.ensure_authenticated()
+
+        server.testzeus_client.ensure_authenticated.assert_awaited_once()
+
+    async def test_unauthorized_error_resets_cache(self, server):
+        """Test that a 401 from the API forces the next call to re-check."""
+        await server.ensure_authenticated()
+        server._reset_auth_if_unauthorized(ValueError("Token expired. [status 401]"))
+        await server.ensure_authenticated()
+
+        assert server.testzeus_client.ensure_authenticated.await_count == 2
+        server.testzeus_client.logout.assert_called_once()
+
+    async def test_other_errors_keep_cache(self, server):
+        """Test that non-auth failures leave the cached state alone."""
+        await server.ensure_authenticated()
+        server._reset_auth_if_unauthorized(ValueError("Not found. [status 404]"))
+        await server.ensure_authenticated()
+
+        server.testzeus_client.ensure_authenticated.assert_awaited_once()
+
+    def test_check_is_trusted_until_token_is_due_for_refresh(self, server):
+        """Test that the cached check lasts until the refresh margin, not a fixed TTL."""
+        client = server.testzeus_client
+        client.token = self._jwt(time.time() + 3600)
+
+        valid_for = server._auth_valid_for(client)
+
+        expected = 3600 - server._TOKEN_REFRESH_MARGIN
+        assert expected - 5 < valid_for <= expected
+        client.token = "opaque"
+        assert server._auth_valid_for(client) == server._AUTH_TTL
+
+    @staticmethod
+    def _jwt(exp):
+        claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+        return f"header.{claims.rstrip('=')}.signature"
+
+    async def test_expiring_token_is_refreshed(self, server):
+        """Test that a token close to expiry is renewed without a password login."""
+        client = server.testzeus_client
+        client._authenticated = True
+        client.token = self._jwt(time.time() + 60)
+        users = client.pb.collection.return_value
+        users.auth_refresh.return_value = SimpleNamespace(token="fresh")
+
+        await server._refresh_expiring_token(client)
+
+        assert client.token == "fresh"
+        client.logout.assert_not_called()
+
+    async def test_distant_expiry_is_left_alone(self, server):
+        """Test that a long-lived token is not refreshed."""
+        client = server.testzeus_client
+        client._authenticated = True
+        client.token = self._jwt(time.time() + 86400)
+
+        await server._refresh_expiring_token(client)
+
+        client.pb.collection.return_value.auth_refresh.assert_not_called()
+
+    async def test_expired_token_logs_out(self, server):
+        """Test that a lapsed token drops the session so the next call logs in again."""
+        client = server.testzeus_client
+        client._authenticated = True
+        client.token = self._jwt(time.time() - 1)
+
+        await server._refresh_expiring_token(client)
+
+        client.logout.assert_called_once()
+        client.pb.collection.return_value.auth_refresh.assert_not_called()
+
+    async def test_concurrent_callers_share_one_login(self, server, monkeypatch):
+        """Test that simultaneous cold-start calls trigger a single login."""
+        monkeypatch.setattr(server, "ensure_authenticated", AsyncMock(return_value=False))
+
+        async def slow_login():
+            await asyncio.sleep(0.01)
+
+        login = AsyncMock(side_effect=slow_login)
+        monkeypatch.setattr(server, "authenticate_testzeus", login)
+
+        await asyncio.gather(*(server._require_authenticated() for _ in range(5)))
+
+        login.assert_awaited_once()
+        assert server._auth_future is None
+
+    async def test_env_credentials_are_used_as_fallback(self, server, monkeypatch):
+        """Test that credentials read from the environment at startup fill in missing ones."""
+        monkeypatch.setattr(server, "_ENV_EMAIL", "env@example.com")
+        monkeypatch.setattr(server, "_ENV_PASSWORD", "env-secret")
+        monkeypatch.setattr(server, "_ENV_BASE_URL", None)
+
+        await server.authenticate_testzeus()
+
+        assert server.testzeus_client.email == "env@example.com"
+        assert server.testzeus_client.password == "env-secret"
+
+    async def test_reauthentication_reuses_client(self, server, monkeypatch):
+        """Test that logging in again keeps the existing client and its pool."""
+        monkeypatch.setattr(server, "_ENV_BASE_URL", None)
+        client = server.testzeus_client
+
+        result = await server.authenticate_testzeus("user@example.com", "secret")
+
+        assert server.testzeus_client is client
+        assert client.email == "user@example.com"
+        client.logout.assert_called_once()
+        assert "Successfully authenticated" in result
+
+
+class TestHttpClient:
+    """Test suite for the pooled HTTP client handed to the SDK."""
+
+    def test_pooled_client_requests_compressed_responses(self, server, monkeypatch):
+        """Test that responses are requested gzip-encoded, and brotli when available."""
+        monkeypatch.setattr(server, "_http_client", None)
+        client = server._get_http_client()
+        try:
+            accepted = client.headers["Accept-Encoding"]
+            assert "gzip" in accepted
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                pass
+            else:
+                assert "br" in accepted
+        finally:
+            client.close()
+
+    def test_pooled_client_negotiates_http2_when_available(self, server, monkeypatch):
+        """Test that the pool speaks HTTP/2 when h2 is installed, HTTP/1.1 otherwise."""
+        monkeypatch.setattr(server, "_http_client", None)
+        client = server._get_http_client()
+        try:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                expected = False
+            else:
+                expected = True
+            assert client._transport._pool._http2 is expected
+        finally:
+            client.close()
+
+    def test_pooled_client_is_closed_on_shutdown(self, server, monkeypatch):
+        """Test that the shutdown hook closes the pooled client."""
+        monkeypatch.setattr(server, "_http_client", None)
+        client = server._get_http_client()
+
+        server._close_http_client()
+
+        assert client.is_closed
+        assert server._get_http_client() is not client
+
+
+class TestEntityCache:
+    """Test suite for the cached read-only lookups."""
+
+    async def test_get_test_is_served_from_cache(self, server):
+        """Test that repeated get_test calls hit the API once until invalidated."""
+        fields = (
+            "status",
+            "testing_type",
+            "test_feature",
+            "tags",
+            "test_data",
+            "environment",
+            "config",
+            "metadata",
+        )
+        test = SimpleNamespace(
+            id="t1",
+            name="Login",
+            created="",
+            updated="",
+            tenant="",
+            modified_by="",
+            **dict.fromkeys(fields),
+        )
+        server.testzeus_client.tests.get_one = AsyncMock(return_value=test)
+
+        first = await server.get_test("t1")
+        second = await server.get_test("t1")
+        server._invalidate_cached("test", "test_resource")
+        await server.get_test("t1")
+
+        assert first == second
+        assert server.testzeus_client.tests.get_one.await_count == 2
+
+    async def test_update_tag_invalidates_cached_tag(self, server):
+        """Test that get_tag is cached until the tag is updated."""
+        tag = SimpleNamespace(
+            id="g1", name="smoke", value="", tenant="", modified_by="", created="", updated=""
+        )
+        tags = server.testzeus_client.tags
+        tags.get_one = AsyncMock(return_value=tag)
+        tags.update_tag = AsyncMock(return_value=tag)
+
+        await server.get_tag("g1")
+        await server.get_tag("g1")
+        await server.update_tag("g1", value="nightly")
+        await server.get_tag("g1")
+
+        assert tags.get_one.await_count == 2
+
+    async def test_tag_resource_is_cached_until_tag_is_updated(self, server):
+        """Test that the tag:// resource reuses its payload until the tag changes."""
+        tag = SimpleNamespace(
+            id="g1", name="smoke", value="", tenant="", modified_by="", created="", updated=""
+        )
+        tags = server.testzeus_client.tags
+        tags.get_one = AsyncMock(return_value=tag)
+        tags.update_tag = AsyncMock(return_value=tag)
+
+        first = await server.get_tag_resource("g1")
+        assert await server.get_tag_resource("g1") == first
+        await server.update_tag("g1", value="nightly")
+        await server.get_tag_resource("g1")
+
+        assert tags.get_one.await_count == 2
+
+    async def test_waiting_callers_keep_sharing_the_fetch_lock(self, server):
+        """Test that a late caller queues behind earlier waiters instead of fetching alongside."""
+        active = []
+        overlaps = []
+
+        async def fetch():
+            active.append(None)
+            overlaps.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+            return "{}", False
+
+        async def late_caller():
+            await asyncio.sleep(0.015)
+            return await server._cached_payload(("test", "t1"), fetch)
+
+        await asyncio.gather(
+            server._cached_payload(("test", "t1"), fetch),
+            server._cached_payload(("test", "t1"), fetch),
+            late_caller(),
+        )
+
+        assert max(overlaps) == 1
+
+    async def test_concurrent_id_lookups_are_batched(self, server):
+        """Test that ID lookups in the same window share one list request."""
+        from testzeus_sdk.managers.base import BaseManager
+
+        tests = server.testzeus_client.tests
+        tests._is_valid_id = BaseManager._is_valid_id
+        ids = ["a" * 15, "b" * 15, "c" * 15]
+        tests.get_list = AsyncMock(
+            return_value={"items": [SimpleNamespace(id=record_id) for record_id in ids]}
+        )
+
+        records = await asyncio.gather(*(server._load_batched("tests", i) for i in ids))
+
+        assert [record.id for record in records] == ids
+        tests.get_list.assert_awaited_once_with(per_page=3, filters={"id": ids})
+
+    async def test_cancelled_lookup_does_not_cancel_shared_batch(self, server):
+        """Test that cancelling one caller leaves others waiting on the same ID."""
+        from testzeus_sdk.managers.base import BaseManager
+
+        tests = server.testzeus_client.tests
+        tests._is_valid_id = BaseManager._is_valid_id
+        record = SimpleNamespace(id="a" * 15)
+        tests.get_one = AsyncMock(return_value=record)
+
+        cancelled = asyncio.ensure_future(server._load_batched("tests", record.id))
+        waiting = asyncio.ensure_future(server._load_batched("tests", record.id))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await waiting is record
+        assert cancelled.cancelled()
+
+    async def test_running_test_run_is_not_cached(self, server):
+        """Test that in-flight test runs are always fetched fresh."""
+        server.testzeus_client.test_runs.get_expanded = AsyncMock(
+            return_value={"test_run": {"id": "r1", "status": "running"}}
+        )
+
+        await server.get_test_run("r1")
+        await server.get_test_run("r1")
+
+        assert server.testzeus_client.test_runs.get_expanded.await_count == 2
+
+
+class TestRowBuilders:
+    """Test suite for the generated record-to-dict row builders."""
+
+    def test_builder_matches_attribute_access(self, server):
+        """Test that generated rows hold the named attributes, optional ones defaulting."""
+        build_row = server._compile_row_builder(("id", "name", "config?"))
+
+        assert build_row(SimpleNamespace(id="t1", name="Login")) == {
+            "id": "t1",
+            "name": "Login",
+            "config": None,
+        }
+
+    def test_builder_resolves_optional_fields_against_model(self, server):
+        """Test that optional fields the model lacks compile to None without a lookup."""
+        from testzeus_sdk.models.test import Test
+
+        build_row = server._compile_row_builder(("id", "config?", "not_on_model?"), Test)
+
+        assert build_row(SimpleNamespace(id="t1", config={}, not_on_model="x")) == {
+            "id": "t1",
+            "config": {},
+            "not_on_model": None,
+        }
+
+    def test_builder_rejects_non_identifiers(self, server):
+        """Test that field names cannot smuggle code into the generated function."""
+        with pytest.raises(ValueError):
+            server._compile_row_builder(("id", "name); import os; (x"))
+
+    def test_attr_row_reads_model_attributes(self, server):
+        """Test that attrgetter rows map each field to the record's attribute."""
+        from testzeus_sdk.models.test_run import TestRun
+
+        run = TestRun({"id": "r1", "name": "Nightly", "status": "completed"})
+        row = server._test_run_resource_row(run)
+
+        assert row["id"] == "r1"
+        assert row["status"] == "completed"
+        assert row["start_time"] is None
+
+    def test_attr_row_rejects_unknown_fields(self, server):
+        """Test that fields missing from the model are caught when the row is compiled."""
+        from testzeus_sdk.models.test_run import TestRun
+
+        with pytest.raises(ValueError):
+            server._compile_attr_row(TestRun, ("id", "no_such_field"))
+
+    def test_resource_rows_default_attributes_missing_from_model(self, server):
+        """Test that optional fields the SDK model does not define come out as None."""
+        from testzeus_sdk.models.user_integration import UserIntegration
+
+        integration = UserIntegration({"id": "i1", "name": "Slack"})
+        row = server._user_integration_resource_row(integration)
+
+        assert row["id"] == "i1"
+        assert row["scopes"] is None
+
+    def test_dataclass_rows_serialize_like_dicts(self, server):
+        """Test that slotted row dataclasses produce the same JSON as the dicts they replace."""
+        row = server._TestRunRow("r1", "Nightly", "completed", "t1", None, None, "c", "u")
+        expected = {
+            "id": "r1",
+            "name": "Nightly",
+            "status": "completed",
+            "test": "t1",
+            "start_time": None,
+            "end_time": None,
+            "created": "c",
+            "updated": "u",
+        }
+
+        assert server._dumps([row]) == server._dumps([expected])
+
+    def test_tag_rows_follow_model_attributes(self, server):
+        """Test that list_tags rows carry every Tag attribute in order."""
+        from testzeus_sdk.models.tag import Tag
+
+        tag = Tag({"id": "g1", "name": "smoke", "value": "", "tenant": "t", "modified_by": "u"})
+        row = server._TagRow(*server._tag_list_values(tag))
+
+        assert json.loads(server._dumps(row)) == {
+            "id": "g1",
+            "name": "smoke",
+            "value": "",
+            "created": None,
+            "updated": None,
+            "tenant": "t",
+            "modified_by": "u",
+        }
+
+
+class TestMultiPageFetch:
+    """Test suite for fetching several pages in one list call."""
+
+    @staticmethod
+    def _pages(total_pages):
+        async def get_list(page, **kwargs):
+            return {"items": [f"item-{page}"], "total_pages": total_pages}
+
+        return AsyncMock(side_effect=get_list)
+
+    async def test_consecutive_pages_are_merged(self, server):
+        """Test that max_pages pages from the requested one are combined in order."""
+        tags = server.testzeus_client.tags
+        tags.get_list = self._pages(total_pages=5)
+
+        result = await server._get_pages("tags", {"page": 2, "per_page": 10}, 3)
+
+        assert result["items"] == ["item-2", "item-3", "item-4"]
+
+    async def test_fetch_stops_at_last_page(self, server):
+        """Test that no pages past total_pages are requested."""
+        tags = server.testzeus_client.tags
+        tags.get_list = self._pages(total_pages=2)
+
+        result = await server._get_pages("tags", {"page": 1, "per_page": 10}, 20)
+
+        assert result["items"] == ["item-1", "item-2"]
+        assert tags.get_list.await_count == 2
+
+
+class TestBatchTools:
+    """Test suite for the batch variants of single-record tools."""
+
+    async def test_delete_tests_reports_each_outcome(self, server):
+        """Test that one failed delete does not fail the rest of the batch."""
+
+        async def delete(test_id):
+            if test_id == "missing":
+                raise ValueError("not found")
+            return True
+
+        server.testzeus_client.tests.delete = AsyncMock(side_effect=delete)
+
+        result = await server.delete_tests(["t1", "missing", "t2"])
+
+        assert result.startswith("Deleted 2 of 3 tests:")
+        outcomes = json.loads(result.split("\n", 1)[1])
+        assert outcomes[1] == {"id": "missing", "error": "not found"}
+        assert [outcome["id"] for outcome in outcomes] == ["t1", "missing", "t2"]
+
+    async def test_get_records_resolves_ids_with_one_request(self, server):
+        """Test that get_records fetches records of a kind with a single list call."""
+        from testzeus_sdk.managers.base import BaseManager
+        from testzeus_sdk.models.tag import Tag
+
+        tags = server.testzeus_client.tags
+        tags._is_valid_id = BaseManager._is_valid_id
+        ids = ["a" * 15, "b" * 15]
+        tags.get_list = AsyncMock(
+            return_value={"items": [Tag({"id": tag_id, "name": tag_id}) for tag_id in ids]}
+        )
+
+        result = await server.get_records("tag", ids)
+
+        assert result.startswith("Retrieved 2 of 2 tag records:")
+        outcomes = json.loads(result.split("\n", 1)[1])
+        assert [outcome["result"]["id"] for outcome in outcomes] == ids
+        tags.get_list.assert_awaited_once_with(per_page=2, filters={"id": ids})
+
+
+class TestFileUploads:
+    """Test suite for file-upload tools."""
+
+    async def test_upload_runs_off_the_event_loop_thread(self, server, tmp_path):
+        """Test that only the blocking POST leaves the loop thread; lookups stay on it."""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("a,b\n")
+        environments = server.testzeus_client.environments
+        environments.collection_name = "environments"
+        environments.get_one = AsyncMock(
+            return_value=SimpleNamespace(id="e1", is_mobile=lambda: False)
+        )
+        environments._get_id_from_name_or_id = AsyncMock(return_value="e1")
+        environments._add_tenant_id = AsyncMock()
+        environments._add_modified_by = AsyncMock()
+        upload_threads = []
+
+        def update(record_id, data):
+            upload_threads.append(threading.get_ident())
+            assert record_id == "e1"
+            assert data["supporting_data_files+"].files[1].read() == b"a,b\n"
+
+        server.testzeus_client.pb.collection.return_value.update = update
+
+        result = await server.add_environment_file("e1", str(file_path))
+
+        assert upload_threads and upload_threads[0] != threading.get_ident()
+        server.testzeus_client.pb.collection.assert_called_with("environments")
+        assert "Successfully added file" in result
+
+    def test_sdk_update_steps_exist(self, server):
+        """Test that the SDK still has the manager internals _prepare_update relies on."""
+        from testzeus_sdk.managers.base import BaseManager
+
+        for name in ("_get_id_from_name_or_id", "_add_tenant_id", "_add_modified_by"):
+            assert inspect.iscoroutinefunction(getattr(BaseManager, name, None)), name
+
+    async def test_prepare_update_runs_sdk_steps(self, server):
+        """Test that _prepare_update resolves the ID and adds the SDK's audit fields."""
+        from testzeus_sdk.managers.base import BaseManager
+
+        client = MagicMock()
+        client.get_tenant_id.return_value = "tenant1"
+        client.is_authenticated.return_value = True
+        client.get_user_id.return_value = "user1"
+        manager = BaseManager(client, "tags", MagicMock())
+
+        record_id, data = await server._prepare_update(manager, "a" * 15)
+
+        assert record_id == "a" * 15
+        assert data == {"tenant": "tenant1", "modified_by": "user1"}
+
+
+class TestPagePrefetch:
+    """Test suite for speculative next-page fetching in list tools."""
+
+    async def test_next_page_is_prefetched(self, server):
+        """Test that turning the page reuses the request started in the background."""
+        tests = server.testzeus_client.tests
+        tests.get_list = AsyncMock(return_value={"items": [], "total_pages": 3})
+
+        await server._get_list_prefetched("tests", {"page": 1, "per_page": 10})
+        await server._get_list_prefetched("tests", {"page": 2, "per_page": 10})
+        await asyncio.sleep(0)
+
+        pages = [call.kwargs["page"] for call in tests.get_list.await_args_list]
+        assert pages == [1, 2, 3]
+
+    async def test_last_page_does_not_prefetch(self, server):
+        """Test that nothing is prefetched past the final page."""
+        tests = server.testzeus_client.tests
+        tests.get_list = AsyncMock(return_value={"items": [], "total_pages": 1})
+
+        await server._get_list_prefetched("tests", {"page": 1, "per_page": 10})
+
+        assert not server._prefetched_pages
+
+    async def test_starting_a_run_drops_prefetched_test_run_pages(self, server):
+        """Test that a new test run is not hidden behind a prefetched page."""
+        test_runs = server.testzeus_client.test_runs
+        test_runs.get_list = AsyncMock(return_value={"items": [], "total_pages": 3})
+        server.testzeus_client.test_run_groups.create_and_execute = AsyncMock(
+            return_value=SimpleNamespace(id="g1", name="nightly")
+        )
+
+        await server._get_list_prefetched("test_runs", {"page": 1, "per_page": 10})
+        assert server._prefetched_pages
+        await server.run_test("nightly", ["t1"])
+
+        assert not server._prefetched_pages
+
+
+class TestListProjection:
+    """Test suite for field-projected list requests."""
+
+    async def test_fields_are_sent_to_pocketbase(self, server):
+        """Test that a projection bypasses the SDK and still yields models."""
+        from testzeus_sdk.models.test import Test
+
+        tests = server.testzeus_client.tests
+        tests.collection_name = "tests"
+        tests.model_class = Test
+        record = SimpleNamespace(to_dict=lambda: {"id": "t1", "name": "Login"})
+        collection = server.testzeus_client.pb.collection.return_value
+        collection.get_list.return_value = SimpleNamespace(
+            items=[record], page=1, per_page=10, total_items=1, total_pages=1
+        )
+
+        result = await server._get_list(
+            "tests",
+            {"page": 1, "per_page": 10, "filters": {"status": "ready"}, "fields": "id,name"},
+        )
+
+        assert [item.name for item in result["items"]] == ["Login"]
+        query_params = collection.get_list.call_args.kwargs["query_params"]
+        assert query_params["fields"] == "id,name"
+        assert query_params["filter"] == 'status = "ready"'
+        tests.get_list.assert_not_called()
+
+    def test_filter_string_matches_sdk_syntax(self, server):
+        """Test that projected requests build the same filters as the SDK's list calls."""
+        filters = {
+            "status": "ready",
+            "name": ["Login", 'Say "hi"'],
+            "created": {"operator": ">=", "value": "2024-01-01"},
+            "tags": {"operator": "?=", "value": ["smoke", "nightly"]},
+            "$or": [{"is_active": True}, {"priority": {"operator": ">", "value": 2}}],
+        }
+
+        assert server._filter_string(filters) == (
+            'status = "ready"'
+            ' && (name = "Login" || name = "Say \\"hi\\"")'
+            ' && created >= "2024-01-01"'
+            ' && (tags ?= "smoke" || tags ?= "nightly")'
+            " && (is_active = true || priority > 2)"
+        )
+        with pytest.raises(ValueError, match="Invalid filter operator"):
+            server._filter_string({"name": {"operator": "LIKE", "value": "x"}})
+
+    async def test_tests_resource_builds_rows_from_raw_records(self, server):
+        """Test that the tests:// resource projects narrowly and skips model objects."""
+        tests = server.testzeus_client.tests
+        tests.collection_name = "tests"
+        tests.model_class = MagicMock(side_effect=AssertionError("model built"))
+        record = {"id": "t1", "name": "Login", "status": "ready", "test_feature": "F"}
+        collection = server.testzeus_client.pb.collection.return_value
+        collection.get_list.return_value = SimpleNamespace(
+            items=[SimpleNamespace(to_dict=lambda: record)],
+            page=1,
+            per_page=100,
+            total_items=1,
+            total_pages=1,
+        )
+
+        payload = json.loads(await server.list_tests_resource())
+
+        assert payload["tests"][0]["uri"] == "test://t1"
+        assert payload["tests"][0]["testing_type"] == "web"
+        query_params = collection.get_list.call_args.kwargs["query_params"]
+        assert query_params["fields"] == server._TEST_RESOURCE_FIELDS
+
+    async def test_list_resources_are_paged(self, server):
+        """Test that list resources fetch one page and link the next one."""
+        from testzeus_sdk.models.tag import Tag
+
+        tags = server.testzeus_client.tags
+        tags.get_list = AsyncMock(
+            return_value={
+                "items": [Tag({"id": "g1", "name": "env", "value": "prod"})],
+                "page": 2,
+                "total_pages": 3,
+            }
+        )
+
+        (contents,) = await server.mcp.read_resource("tags://page/2")
+        payload = json.loads(contents.content)
+
+        tags.get_list.assert_awaited_once_with(page=2, per_page=server._RESOURCE_PAGE_SIZE)
+        assert payload["tags"][0]["uri"] == "tag://g1"
+        assert payload["next"] == "tags://page/3"
+
+    async def test_resource_page_must_be_positive(self, server):
+        """Test that page 0 is rejected before any request is made."""
+        tags = server.testzeus_client.tags
+        tags.get_list = AsyncMock()
+
+        with pytest.raises(ValueError, match="greater than or equal to 1"):
+            await server.mcp.read_resource("tags://page/0")
+
+        tags.get_list.assert_not_awaited()
+
+    async def test_model_list_resources_serialize_items_directly(self, server):
+        """Test that list resources hand SDK models to the encoder without building rows."""
+        from testzeus_sdk.models.notification_channel import NotificationChannel
+
+        channel = NotificationChannel({"id": "n1", "name": "ops", "emails": {"to": ["a@b.c"]}})
+        channels = server.testzeus_client.notification_channels
+        channels.get_list = AsyncMock(return_value={"items": [channel]})
+
+        payload = json.loads(await server.list_notification_channels_resource())
+
+        (row,) = payload["notification_channels"]
+        assert row["uri"] == "notification-channel://n1"
+        assert row["has_emails"] is True
+        assert row["has_webhooks"] is False
+
+    def test_projections_cover_row_fields(self, server):
+        """Test that list projections request every field the row dataclasses read."""
+        from dataclasses import fields
+
+        for row_class, projection in (
+            (server._TestRow, server._TEST_LIST_FIELDS),
+            (server._TestRunRow, server._TEST_RUN_LIST_FIELDS),
+            (server._TagRow, server._TAG_LIST_FIELDS),
+        ):
+            assert {f.name for f in fields(row_class)} <= set(projection.split(","))
+
+
+class TestListStreaming:
+    """Test suite for streaming list results as progress notifications."""
+
+    async def test_rows_are_sent_in_chunks(self, server):
+        """Test that rows go out ten at a time with running progress."""
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        rows = [{"id": str(i)} for i in range(25)]
+
+        summary = await server._stream_rows(ctx, rows, "tests")
+
+        assert summary.content[0].text == "Streamed 25 tests"
+        assert summary.structuredContent == {"streamed": 25}
+        progress = [call.args for call in ctx.report_progress.await_args_list]
+        assert progress == [(10, 25), (20, 25), (25, 25)]
+        last_chunk = ctx.report_progress.await_args_list[-1].kwargs["message"]
+        assert json.loads(last_chunk) == rows[20:]
+
+    def test_rows_are_returned_as_structured_content(self, server):
+        """Test that list rows are returned both structured and as summary text."""
+        rows = [{"id": "t1"}, {"id": "t2"}]
+
+        result = server._rows_result(rows, "tests")
+
+        assert result.structuredContent == {"items": rows}
+        assert result.content[0].text.startswith("Found 2 tests:")
+
+    def test_structured_rows_match_text_payload(self, server):
+        """Test that structured rows carry the same values as the JSON text."""
+        rows = [{"id": "t1", "created": datetime(2024, 1, 2, 3, 4, 5)}]
+
+        result = server._rows_result(rows, "tests")
+
+        text_rows = json.loads(result.content[0].text.split(":\n", 1)[1])
+        assert result.structuredContent == {"items": text_rows}
+
+    def test_streaming_requires_progress_token(self, server):
+        """Test that streaming is skipped when the client cannot receive it."""
+        ctx = MagicMock()
+        ctx.request_context.meta.progressToken = None
+
+        assert not server._can_stream(None)
+        assert not server._can_stream(ctx)
+
+
+class TestToolSchemas:
+    """Test suite for argument validation declared in tool signatures."""
+
+    async def test_per_page_bounds_are_in_schema(self, server):
+        """Test that list tools advertise and enforce the 1..100 page size."""
+        tools = {tool.name: tool for tool in await server.mcp.list_tools()}
+
+        per_page = tools["list_tests"].inputSchema["properties"]["per_page"]
+
+        assert (per_page["minimum"], per_page["maximum"]) == (1, 100)
+
+    async def test_shared_option_sets_are_advertised(self, server):
+        """Test that tools using a shared Literal alias advertise the same choices."""
+        tools = {tool.name: tool for tool in await server.mcp.list_tools()}
+
+        create = tools["create_test"].inputSchema["properties"]["execution_mode"]
+        suite = tools["create_test_suite"].inputSchema["properties"]["execution_mode"]
+
+        assert create["enum"] == suite["enum"] == ["lenient", "strict"]
+
+    async def test_text_tools_have_no_output_schema(self, server):
+        """Test that text replies are not duplicated as structured content."""
+        tools = {tool.name: tool for tool in await server.mcp.list_tools()}
+
+        assert tools["get_test"].outputSchema is None
+
+    def test_disabled_tools_are_removed(self, server, monkeypatch):
+        """Test that tools named in TESTZEUS_DISABLED_TOOLS are unregistered."""
+        removed = []
+        monkeypatch.setattr(server.mcp, "remove_tool", removed.append)
+        monkeypatch.setenv("TESTZEUS_DISABLED_TOOLS", "create_tags, delete_tag,")
+
+        server._remove_disabled_tools()
+
+        assert removed == ["create_tags", "delete_tag"]
+
+
+class TestUpdatePayloads:
+    """Test suite for building partial-update payloads."""
+
+    def test_only_supplied_fields_are_sent(self, server):
+        """Test that None means unchanged while empty values are still sent."""
+        assert server._provided(name=None, tags=[], value="", metadata={"a": 1}) == {
+            "tags": [],
+            "value": "",
+            "metadata": {"a": 1},
+        }
+
+    async def test_update_tag_can_clear_value(self, server):
+        """Test that update_tag sends an empty value and leaves the name alone."""
+        tag = SimpleNamespace(id="g1", name="env", value="", updated="")
+        server.testzeus_client.tags.update_tag = AsyncMock(return_value=tag)
+
+        await server.update_tag("g1", value="")
+
+        server.testzeus_client.tags.update_tag.assert_awaited_once_with("g1", value="")
+
+
+class TestCompositeTools:
+    """Test suite for tools that chain several SDK calls."""
+
+    async def test_create_and_run_test_runs_created_test(self, server):
+        """Test that the new test's ID is handed to the run group."""
+        server.testzeus_client.tests.create_test = AsyncMock(return_value=SimpleNamespace(id="t1"))
+        group = SimpleNamespace(id="g1", name="Login")
+        server.testzeus_client.test_run_groups.create_and_execute = AsyncMock(return_value=group)
+
+        result = await server.create_and_run_test("Login", "Feature: login")
+
+        call = server.testzeus_client.test_run_groups.create_and_execute.await_args
+        assert call.kwargs["test_ids"] == ["t1"]
+        assert call.kwargs["name"] == "Login"
+        assert "ID: t1" in result and "ID: g1" in result
+
+    async def test_update_test_with_run_starts_group(self, server):
+        """Test that update_test(run=True) runs the updated test."""
+        test = SimpleNamespace(id="t1", name="Login", environment=None)
+        server.testzeus_client.tests.update_test = AsyncMock(return_value=test)
+        group = SimpleNamespace(id="g1", name="Login")
+        server.testzeus_client.test_run_groups.create_and_execute = AsyncMock(return_value=group)
+
+        result = await server.update_test("t1", status="ready", run=True)
+
+        call = server.testzeus_client.test_run_groups.create_and_execute.await_args
+        assert call.kwargs["test_ids"] == ["t1"]
+        assert "updated test 'Login'" in result and "ID: g1" in result
+
+    async def test_update_test_with_run_uses_configured_environment(self, server):
+        """Test that the run uses the test's own environment when the update keeps it."""
+        test = SimpleNamespace(id="t1", name="Login", environment="e1")
+        server.testzeus_client.tests.update_test = AsyncMock(return_value=test)
+        execute = AsyncMock(return_value=SimpleNamespace(id="g1", name="Login"))
+        server.testzeus_client.test_run_groups.create_and_execute = execute
+
+        await server.update_test("t1", status="ready", run=True)
+        assert execute.await_args.kwargs["environment"] == "e1"
+
+        await server.update_test("t1", environment="e2", run=True)
+        assert execute.await_args.kwargs["environment"] == "e2"
+
+    async def test_update_test_without_run_does_not_start_group(self, server):
+        """Test that update_test leaves runs alone by default."""
+        test = SimpleNamespace(id="t1", name="Login")
+        server.testzeus_client.tests.update_test = AsyncMock(return_value=test)
+        server.testzeus_client.test_run_groups.create_and_execute = AsyncMock()
+
+        await server.update_test("t1", status="ready")
+
+        server.testzeus_client.test_run_groups.create_and_execute.assert_not_awaited()
+
+
+class TestToolDecorator:
+    """Test suite for the shared tool wrapper."""
+
+    async def test_errors_are_formatted_and_reported(self, server):
+        """Test that a failing tool returns the formatted error and reports it to ctx."""
+        channels = server.testzeus_client.notification_channels
+        channels.remove_config = AsyncMock(side_effect=ValueError("boom"))
+        ctx = MagicMock()
+        ctx.error = AsyncMock()
+
+        result = await server.remove_notification_config("c1", "slack", ctx=ctx)
+
+        assert result == "Error removing slack config: boom"
+        ctx.error.assert_awaited_once_with(result)
+
+    async def test_failed_login_is_reported_by_the_decorator(self, server, monkeypatch):
+        """Test that a tool run without a client reports the login failure itself."""
+        monkeypatch.setattr(server, "testzeus_client", None)
+        monkeypatch.setattr(server, "_require_authenticated", AsyncMock())
+        ctx = MagicMock()
+        ctx.error = AsyncMock()
+
+        result = await server.list_test_suites(ctx=ctx)
+
+        assert result == f"Error listing test suites: {server._AUTH_FAILED}"
+        ctx.error.assert_awaited_once_with(result)
+
+    async def test_blank_id_is_rejected_before_authenticating(self, server, monkeypatch):
+        """Test that a blank required ID fails fast without a login or SDK call."""
+        require = AsyncMock()
+        monkeypatch.setattr(server, "_require_authenticated", require)
+        server.testzeus_client.tags.get_one = AsyncMock()
+
+        result = await server.delete_tag(" ")
+
+        assert result == "Error deleting tag: tag_id is required"
+        require.assert_not_awaited()
+        server.testzeus_client.tags.get_one.assert_not_awaited()
+
+    async def test_info_notifications_are_opt_in(self, server, monkeypatch):
+        """Test that tool info notifications are only sent when enabled."""
+        server.testzeus_client.tests.delete = AsyncMock()
+        ctx = MagicMock()
+        ctx.info = AsyncMock()
+
+        await server.delete_test("t1", ctx=ctx)
+        ctx.info.assert_not_awaited()
+
+        monkeypatch.setattr(server, "_INFO_NOTIFICATIONS", True)
+        await server.delete_test("t1", ctx=ctx)
+        await asyncio.gather(*server._info_tasks)
+        ctx.info.assert_awaited_once_with("Deleted test: t1")
+
+    async def test_info_notifications_do_not_hold_up_the_tool(self, server, monkeypatch):
+        """Test that a tool returns before its info notification has been sent."""
+        monkeypatch.setattr(server, "_INFO_NOTIFICATIONS", True)
+        server.testzeus_client.tests.delete = AsyncMock()
+        sent = asyncio.Event()
+        ctx = MagicMock()
+        ctx.info = AsyncMock(side_effect=lambda message: sent.set())
+
+        await server.delete_test("t1", ctx=ctx)
+
+        assert not sent.is_set()
+        await asyncio.gather(*server._info_tasks)
+        assert sent.is_set()
+        assert not server._info_tasks
+
+    async def test_fresh_authentication_skips_the_auth_coroutine(self, server, monkeypatch):
+        """Test that within the auth TTL the wrapper goes straight to the tool body."""
+        require = AsyncMock()
+        monkeypatch.setattr(server, "_require_authenticated", require)
+        monkeypatch.setattr(server, "_auth_ok_until", float("inf"))
+        server.testzeus_client.tests.delete = AsyncMock()
+
+        await server.delete_test("t1")
+
+        require.assert_not_awaited()
+        server.testzeus_client.tests.delete.assert_awaited_once_with("t1")
+
+    async def test_unauthenticated_call_logs_in_first(self, server, monkeypatch):
+        """Test that the wrapper authenticates before running the tool body."""
+        monkeypatch.setattr(server, "ensure_authenticated", AsyncMock(return_value=False))
+        login = AsyncMock()
+        monkeypatch.setattr(server, "authenticate_testzeus", login)
+        server.testzeus_client.tests.delete = AsyncMock()
+
+        await server.delete_test("t1")
+
+        login.assert_awaited_once()
+        server.testzeus_client.tests.delete.assert_awaited_once_with("t1")
+
+
 class TestServerConfiguration:
     """Test suite for server configuration and setup."""
 
@@ -203,12 +1216,12 @@ class TestServerDocumentation:
             assert "authenticate_testzeus" in content
             assert "ensure_authenticated" in content
 
-    def test_server_defines_datetime_encoder(self):
-        """Test that server defines DateTimeEncoder class."""
+    def test_server_serializes_datetimes_with_orjson(self):
+        """Test that server leaves datetime encoding to orjson."""
         with open("testzeus_mcp_server/server.py") as f:
             content = f.read()
-            assert "class DateTimeEncoder" in content
-            assert "json.JSONEncoder" in content
+            assert "class DateTimeEncoder" not in content
+            assert "orjson.OPT_NAIVE_UTC" in content
 
     def test_server_has_error_handling(self):
         """Test that server implements error handling."""
@@ -303,6 +1316,13 @@ class TestModuleStructure:
         # Server file should be reasonably large (many tools defined)
         assert size > 10000, f"Server file seems too small: {size} bytes"
 
+    def test_log_level_is_passed_to_fastmcp(self):
+        """Test that the log level reaches FastMCP, which owns the root handler."""
+        with open("testzeus_mcp_server/server.py") as f:
+            content = f.read()
+            assert "logging.basicConfig" not in content
+            assert "log_level=_LOG_LEVEL" in content
+
     def test_init_file_exports_mcp(self):
         """Test that __init__.py exports the mcp instance."""
         with open("testzeus_mcp_server/__init__.py") as f:
@@ -357,7 +1377,7 @@ class TestAPIIntegrationPatterns:
             content = f.read()
             # Should call various SDK methods
             assert "testzeus_client.tests" in content
-            assert "testzeus_client.environments" in content or "environments" in content
+            assert "_client().environments" in content or "environments" in content
 
     def test_pagination_parameters_used(self):
         """Test that pagination is implemented in list operations."""
@@ -410,18 +1430,16 @@ class TestAPIIntegrationPatterns:
             any(keyword.arg == "test_params" for keyword in call.keywords) for call in create_calls
         )
 
-        update_assignments = [
+        update_calls = [
             node
             for node in ast.walk(update_node)
-            if isinstance(node, ast.Assign)
-            and any(
-                isinstance(target, ast.Subscript)
-                and isinstance(target.slice, ast.Constant)
-                and target.slice.value == "test_params"
-                for target in node.targets
-            )
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "_provided"
         ]
-        assert update_assignments
+        assert any(
+            any(keyword.arg == "test_params" for keyword in call.keywords) for call in update_calls
+        )
 
     def test_suite_run_creation_uses_sdk_run_helper(self):
         """Test that suite run creation delegates to the SDK helper."""
@@ -2,11 +2,22 @@
 Main entry point for TestZeus FastMCP Server.
 """
 
+import asyncio
 import sys
 
 
+def _install_uvloop() -> None:
+    """Run the server on uvloop when it is available (it is not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
     """Main entry point for the TestZeus FastMCP Server."""
+    _install_uvloop()
     try:
         from testzeus_mcp_server.server import mcp
 
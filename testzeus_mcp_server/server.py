@@ -21,59 +21,579 @@ still use hardcoded 'lenient' mode for consistent behavior.
 Connected environments can be linked to both tests and environments for enhanced integration.
 """
 
-import json
+import asyncio
+import atexit
+import base64
+import functools
+import importlib.util
+import inspect
 import logging
+import operator
 import os
+import re
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import CallToolResult, TextContent
+from pocketbase.client import FileUpload
+from pydantic import Field
 from testzeus_sdk.client import TestZeusClient
+from testzeus_sdk.managers.base import record_to_dict
+from testzeus_sdk.models.connected_environment import ConnectedEnvironment
+from testzeus_sdk.models.device_pool import DevicePool
+from testzeus_sdk.models.environment import Environment
+from testzeus_sdk.models.hypermind_code_blocks import HypermindCodeBlocks
+from testzeus_sdk.models.notification_channel import NotificationChannel
+from testzeus_sdk.models.tag import Tag
+from testzeus_sdk.models.test import Test
+from testzeus_sdk.models.test_data import TestData
+from testzeus_sdk.models.test_report_run import TestReportRun
+from testzeus_sdk.models.test_report_schedule import TestReportSchedule
+from testzeus_sdk.models.test_run import TestRun
+from testzeus_sdk.models.test_run_group import TestRunGroup
+from testzeus_sdk.models.user_integration import UserIntegration
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 load_dotenv()
 
+# Credentials and API location from the environment (or .env), read once at startup
+_ENV_EMAIL = os.environ.get("TESTZEUS_EMAIL")
+_ENV_PASSWORD = os.environ.get("TESTZEUS_PASSWORD")
+_ENV_BASE_URL = os.environ.get("TESTZEUS_BASE_URL")
+# Per-call info notifications repeat what the tool result already says, so they are
+# only sent when asked for
+_INFO_NOTIFICATIONS = bool(os.environ.get("TESTZEUS_INFO_NOTIFICATIONS"))
+
+
+class _TextToolMCP(FastMCP):
+    """FastMCP whose tools return their text as-is unless they opt into structured output.
+
+    Without this every ``-> str`` tool gets a generated output model, which costs a
+    pydantic model build per tool at import and repeats each reply as structured content.
+    """
+
+    def tool(self, *args: Any, structured_output: bool | None = False, **kwargs: Any):
+        return super().tool(*args, structured_output=structured_output, **kwargs)
+
+
+# Creating FastMCP installs a stderr handler on the root logger (unless the host
+# application configured logging first); TESTZEUS_LOG_LEVEL sets its level
+_LOG_LEVEL = os.getenv("TESTZEUS_LOG_LEVEL", "WARNING").upper()
+if _LOG_LEVEL not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+    _LOG_LEVEL = "WARNING"
+
 # Create the FastMCP server
-mcp = FastMCP("TestZeus MCP Server")
+mcp = _TextToolMCP("TestZeus MCP Server", log_level=_LOG_LEVEL)
+
+# Page size accepted by list tools; FastMCP validates it before the tool body runs
+PerPage = Annotated[int, Field(ge=1, le=100)]
+# Consecutive pages a list tool may fetch in one call
+MaxPages = Annotated[int, Field(ge=1, le=20)]
+# Page number in a paged resource URI
+Page = Annotated[int, Field(ge=1)]
+# Option sets shared by several tool signatures
+ExecutionMode = Literal["lenient", "strict"]
+EntityStatus = Literal["draft", "ready", "deleted"]
+TestingType = Literal["web", "mobile"]
+DeviceType = Literal["browser", "mobile-android", "mobile-ios"]
 
 # Global client instance
 testzeus_client: TestZeusClient | None = None
 
-
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Keep-alive pool shared by every PocketBase request the SDK makes
+_http_client: httpx.Client | None = None
+
+# Serialized payloads of read-only lookups, keyed by (namespace, id_or_name). Agents
+# tend to re-read the same record within one reasoning step, so a short TTL suffices.
+_entity_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+# One lock per key being fetched; an entry lasts while any caller still holds the lock
+_entity_locks: weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+# Test runs in these states no longer change, so their payloads are safe to cache
+_FINAL_RUN_STATUSES = frozenset({"completed", "failed", "crashed", "cancelled"})
+
+# Lookups by ID arriving within this window are fetched with a single list request
+_BATCH_WINDOW = 0.02
+_BATCH_MAX_SIZE = 100
+
+# Rows per progress notification when a list tool streams its results
+_STREAM_CHUNK_SIZE = 10
+
+# PocketBase field projections for list views; get_* lookups still fetch full records
+_TEST_LIST_FIELDS = "id,name,status,testing_type,test_feature,tags,environment,created,updated"
+_TEST_RUN_LIST_FIELDS = "id,name,status,test,start_time,end_time,created,updated"
+_ENVIRONMENT_LIST_FIELDS = (
+    "id,name,device_type,data,tags,created,updated,supporting_data_files,"
+    "supporting_data_files_info,mobile_supporting_data_file,"
+    "mobile_supporting_data_file_info,mobile_device"
+)
+_TEST_DATA_LIST_FIELDS = (
+    "id,name,tags,data,supporting_data_files,supporting_data_files_info,"
+    "created,updated,tenant,modified_by"
+)
+_TAG_LIST_FIELDS = "id,name,value,created,updated,tenant,modified_by"
+# Browse-only list resources fetch just what their rows show
+_TEST_RESOURCE_FIELDS = "id,name,status,testing_type,test_feature"
+_TEST_RUN_RESOURCE_FIELDS = "id,name,status,test"
+_ENVIRONMENT_RESOURCE_FIELDS = (
+    "id,name,device_type,data,supporting_data_files,mobile_supporting_data_file,mobile_device"
+)
+# List resources are served a page at a time; later pages live at ``<scheme>://page/{page}``
+_RESOURCE_PAGE_SIZE = 50
+
+# Pages requested at once when a list tool is asked for several
+_PAGE_FETCH_CONCURRENCY = 8
+# Records handled at once by the batch variants of single-record tools
+_BATCH_TOOL_CONCURRENCY = 16
+
+# Speculatively fetched next pages of list tools, dropped after _PREFETCH_TTL seconds
+_PREFETCH_TTL = 30.0
+_prefetched_pages: dict[tuple[str, int, int, bytes], tuple[float, asyncio.Task]] = {}
+
+# Authentication is assumed good until this monotonic timestamp: until the token is
+# due for refresh, or for _AUTH_TTL seconds when its expiry cannot be read
+_AUTH_TTL = 60.0
+_auth_ok_until: float = 0.0
+# Tokens this close to expiry are refreshed instead of re-posting the password
+_TOKEN_REFRESH_MARGIN = 600.0
+# In-flight login of the shared client, awaited by every caller that needs it
+_auth_future: asyncio.Future | None = None
+
+
+# orjson writes datetimes as ISO 8601 itself; naive ones are taken to be UTC.
+# Payloads are fed back into the model's prompt, so they are compact unless
+# TESTZEUS_PRETTY_JSON is set for debugging.
+_COMPACT_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+_DUMPS_OPTIONS = _COMPACT_OPTIONS | (
+    orjson.OPT_INDENT_2 if os.getenv("TESTZEUS_PRETTY_JSON") else 0
+)
+
+# List rows replace data content longer than this with a summary and a resource URI
+_INLINE_DATA_LIMIT = 512
+_DATA_SUMMARY_CHARS = 80
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool/resource payload to JSON (datetimes as ISO 8601, SDK models by type)."""
+    return orjson.dumps(obj, default=_encode_model, option=_DUMPS_OPTIONS).decode()
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize a payload to JSON without whitespace."""
+    return orjson.dumps(obj, option=_COMPACT_OPTIONS).decode()
+
+
+def _provided(**fields: Any) -> dict[str, Any]:
+    """Return the fields the caller supplied; ``None`` means "leave unchanged"."""
+    return {name: value for name, value in fields.items() if value is not None}
+
+
+@functools.cache
+def _model_attrs(model_class: type) -> frozenset[str]:
+    """Attributes every ``model_class`` instance has, read once from a blank instance."""
+    return frozenset(dir(model_class({})))
+
+
+def _compile_row_builder(
+    fields: tuple[str, ...], model_class: type | None = None
+) -> Callable[[Any], dict[str, Any]]:
+    """Generate a function turning a record into a dict of ``fields``.
+
+    A trailing ``?`` marks an optional attribute that defaults to None. Given the
+    ``model_class``, optional fields are resolved at compile time to a plain load or a
+    constant None. The generated function is a single dict display, so per-row work
+    is just the attribute loads.
+    """
+    known = _model_attrs(model_class) if model_class is not None else None
+    items: list[str] = []
+    for spec in fields:
+        name = spec.rstrip("?")
+        if not name.isidentifier():
+            raise ValueError(f"Invalid field name: {spec!r}")
+        if not spec.endswith("?"):
+            value = f"record.{name}"
+        elif known is None:
+            value = f"getattr(record, {name!r}, None)"
+        else:
+            value = f"record.{name}" if name in known else "None"
+        items.append(f"{name!r}: {value}")
+    namespace: dict[str, Any] = {}
+    exec(f"def build_row(record):\n    return {{{', '.join(items)}}}\n", namespace)
+    return namespace["build_row"]
+
+
+@dataclass(slots=True)
+class _TestRow:
+    """A ``list_tests`` row; orjson serializes slotted dataclasses without a dict."""
+
+    id: str
+    name: str
+    status: str
+    testing_type: str
+    test_feature: str
+    tags: list[str]
+    environment: str
+    created: str
+    updated: str
+
+
+@dataclass(slots=True)
+class _TestRunRow:
+    """A ``list_test_runs`` row."""
+
+    id: str
+    name: str
+    status: str
+    test: str
+    start_time: datetime | None
+    end_time: datetime | None
+    created: str
+    updated: str
+
+
+@dataclass(slots=True)
+class _TagRow:
+    """A ``list_tags`` row."""
+
+    id: str
+    name: str
+    value: str | None
+    created: str
+    updated: str
+    tenant: str
+    modified_by: str
+
+
+_test_list_values = operator.attrgetter(*(f.name for f in fields(_TestRow)))
+_tag_list_values = operator.attrgetter(*(f.name for f in fields(_TagRow)))
+_test_detail_fields = (
+    "id",
+    "name",
+    "status",
+    "testing_type",
+    "test_feature",
+    "tags",
+    "test_data",
+    "environment",
+    "config?",
+    "metadata?",
+    "created",
+    "updated",
+)
+_test_detail_row = _compile_row_builder(_test_detail_fields + ("tenant", "modified_by"), Test)
+_test_resource_row = _compile_row_builder(_test_detail_fields + ("modified_by",), Test)
+
+
+def _compile_attr_row(
+    model_class: type, fields: tuple[str, ...]
+) -> Callable[[Any], dict[str, Any]]:
+    """Generate a row function over ``fields``, checked once against ``model_class``.
+
+    The fields are checked against a blank ``model_class`` instance, so rows can use
+    plain attribute loads instead of per-field ``getattr`` defaults. A generated dict
+    display beats ``dict(zip(fields, attrgetter(*fields)(record)))`` by about 40%.
+    """
+    known = _model_attrs(model_class)
+    missing = [name for name in fields if name not in known]
+    if missing:
+        raise ValueError(f"{model_class.__name__} has no attributes {missing}")
+    return _compile_row_builder(fields)
+
+
+_test_run_resource_row = _compile_attr_row(
+    TestRun,
+    (
+        "id",
+        "name",
+        "status",
+        "test_status",
+        "start_time",
+        "end_time",
+        "tags",
+        "metadata",
+        "created",
+        "updated",
+        "modified_by",
+    ),
+)
+_device_resource_row = _compile_attr_row(
+    DevicePool,
+    (
+        "id",
+        "device_name",
+        "platform",
+        "platform_version",
+        "cloud_provider",
+        "device_type",
+        "is_active",
+        "concurrency_limit",
+        "active_sessions",
+        "automation_name",
+        "device_tier",
+        "created",
+        "updated",
+    ),
+)
+_tag_detail_row = _compile_attr_row(
+    Tag,
+    (
+        "id",
+        "name",
+        "value",
+        "created",
+        "updated",
+        "tenant",
+        "modified_by",
+    ),
+)
+_test_run_group_resource_row = _compile_attr_row(
+    TestRunGroup,
+    (
+        "id",
+        "name",
+        "status",
+        "ctrf_status",
+        "execution_mode",
+        "test_ids",
+        "tags",
+        "environment",
+        "notification_channels",
+        "test_report_run",
+        "created",
+        "updated",
+        "created_by",
+    ),
+)
+_code_block_resource_row = _compile_attr_row(
+    HypermindCodeBlocks,
+    (
+        "id",
+        "name",
+        "status",
+        "tags",
+        "code_files",
+        "created",
+        "updated",
+        "modified_by",
+    ),
+)
+_user_integration_resource_row = _compile_row_builder(
+    (
+        "id",
+        "name",
+        "integration_type?",
+        "connection_status?",
+        "project_id?",
+        "auth_config_id?",
+        "connected_account_id?",
+        "scopes?",
+        "created",
+        "updated",
+    )
+)
+_connected_environment_resource_row = _compile_attr_row(
+    ConnectedEnvironment,
+    (
+        "id",
+        "name",
+        "connection",
+        "created",
+        "updated",
+        "modified_by",
+    ),
+)
+_test_report_run_resource_row = _compile_attr_row(
+    TestReportRun,
+    (
+        "id",
+        "name",
+        "display_name",
+        "status",
+        "schedule",
+        "test_run_group",
+        "trigger_time",
+        "end_time",
+        "ctrf_report",
+        "pdf_report",
+        "csv_report",
+        "zip_report",
+        "ctrf_report_findings",
+        "test_runs",
+        "created",
+        "updated",
+        "tenant",
+        "modified_by",
+    ),
+)
+_notification_channel_resource_row = _compile_attr_row(
+    NotificationChannel,
+    (
+        "id",
+        "name",
+        "display_name",
+        "is_active",
+        "is_default",
+        "emails",
+        "webhooks",
+        "created",
+        "updated",
+        "modified_by",
+    ),
+)
+_test_report_schedule_resource_row = _compile_attr_row(
+    TestReportSchedule,
+    (
+        "id",
+        "name",
+        "is_active",
+        "filter_name_pattern",
+        "filter_time_intervals",
+        "cron_expression",
+        "filter_tags",
+        "filter_tag_pattern",
+        "filter_env",
+        "filter_env_pattern",
+        "filter_test_data",
+        "filter_test_data_pattern",
+        "notification_channels",
+        "created",
+        "updated",
+        "created_by",
+    ),
+)
 
 
 async def ensure_authenticated() -> bool:
-    """Ensure the TestZeus client is authenticated."""
-    global testzeus_client
+    """Ensure the TestZeus client is authenticated.
+
+    A successful check is cached until the token nears expiry (at least ``_AUTH_TTL``
+    seconds) so tool calls skip the round-trip; a 401 from the API clears the cache early.
+    """
+    global _auth_ok_until
     if not testzeus_client:
         return False
+    if time.monotonic() < _auth_ok_until:
+        return True
     try:
+        await _refresh_expiring_token(testzeus_client)
         await testzeus_client.ensure_authenticated()
+        _auth_ok_until = time.monotonic() + _auth_valid_for(testzeus_client)
         return True
     except Exception:
         return False
 
 
+def _token_expiry(token: Any) -> float | None:
+    """Return the ``exp`` claim of a JWT as a Unix timestamp, if it can be read."""
+    if not isinstance(token, str) or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, int | float) else None
+
+
+def _auth_valid_for(client: TestZeusClient) -> float:
+    """Seconds a successful check may be trusted: until the token is due for refresh."""
+    expires = _token_expiry(client.token)
+    if expires is None:
+        return _AUTH_TTL
+    return max(_AUTH_TTL, expires - time.time() - _TOKEN_REFRESH_MARGIN)
+
+
+async def _refresh_expiring_token(client: TestZeusClient) -> None:
+    """Renew a token that is about to expire using the token itself.
+
+    The stored credentials are only posted again if the refresh fails or the token has
+    already lapsed, in which case the client is logged out for a fresh login.
+    """
+    expires = _token_expiry(client.token) if client._authenticated else None
+    if expires is None:
+        return
+    remaining = expires - time.time()
+    if remaining > _TOKEN_REFRESH_MARGIN:
+        return
+    if remaining > 0:
+        try:
+            # PocketBase's client is synchronous; keep the event loop free meanwhile
+            refreshed = await asyncio.to_thread(client.pb.collection("users").auth_refresh)
+            client.token = refreshed.token
+            return
+        except Exception as e:
+            logger.info("Token refresh failed, logging in again: %s", e)
+    _clear_session(client)
+
+
+def _clear_session(client: TestZeusClient) -> None:
+    """Forget the client's token so its next request logs in again."""
+    client.logout()
+    client.pb.auth_store.clear()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # httpx negotiates compression itself: gzip/deflate always, br with httpx[brotli].
+        # With httpx[http2] concurrent requests (page fetches, batch tools) share one
+        # multiplexed connection where the server offers HTTP/2.
+        # Idle connections are kept for minutes rather than httpx's default five seconds,
+        # since tool calls arrive in sporadic bursts; PocketBase sets per-request timeouts.
+        _http_client = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=100, keepalive_expiry=300.0
+            ),
+        )
+    return _http_client
+
+
+@atexit.register
+def _close_http_client() -> None:
+    """Close the pooled HTTP client's connections on interpreter shutdown."""
+    if _http_client is not None:
+        _http_client.close()
+
+
+def _reset_auth_if_unauthorized(error: Exception) -> None:
+    """Drop the cached authentication state when the API rejected our token."""
+    global _auth_ok_until
+    status = getattr(error, "status", None)
+    if status != 401 and "[status 401]" not in str(error):
+        return
+    _auth_ok_until = 0.0
+    if testzeus_client:
+        testzeus_client.logout()
+
+
 async def authenticate_testzeus(
     email: str | None = None,
     password: str | None = None,
     ctx: Context = None,
 ) -> str:
     """Authenticate with TestZeus platform using email and password."""
-    global testzeus_client
+    global testzeus_client, _auth_ok_until
 
     # Fallback to environment variables if arguments aren’t passed
-    email = email or os.getenv("TESTZEUS_EMAIL")
-    password = password or os.getenv("TESTZEUS_PASSWORD")
+    email = email or _ENV_EMAIL
+    password = password or _ENV_PASSWORD
 
     if not email or not password:
         error_msg = "Missing credentials: email and password are required"
@@ -82,10 +602,20 @@ async def authenticate_testzeus(
         return error_msg
 
     try:
-        testzeus_client = TestZeusClient(
-            email=email, password=password, base_url=os.getenv("TESTZEUS_BASE_URL")
-        )
-        await testzeus_client.ensure_authenticated()
+        base_url = _ENV_BASE_URL
+        client = testzeus_client
+        if client is None or (base_url and client.base_url != base_url.rstrip("/")):
+            client = TestZeusClient(email=email, password=password, base_url=base_url)
+            client.pb.http_client.close()
+            client.pb.http_client = _get_http_client()
+            testzeus_client = client
+        else:
+            # Re-login on the existing client so warm connections are kept
+            client.email = email
+            client.password = password
+            _clear_session(client)
+        await client.ensure_authenticated()
+        _auth_ok_until = time.monotonic() + _auth_valid_for(client)
 
         if ctx:
             await ctx.info("Successfully authenticated with TestZeus")
@@ -98,104 +628,586 @@ async def authenticate_testzeus(
         return error_msg
 
 
+async def _login_shared_client() -> None:
+    global _auth_future
+    try:
+        if not await ensure_authenticated():
+            await authenticate_testzeus()
+    finally:
+        _auth_future = None
+
+
+def _auth_is_fresh() -> bool:
+    """Whether the client was authenticated within the TTL."""
+    return testzeus_client is not None and time.monotonic() < _auth_ok_until
+
+
+async def _require_authenticated() -> None:
+    """Log in if needed, letting concurrent callers share a single login.
+
+    The first caller starts the login and the rest await the same future.
+    """
+    global _auth_future
+    if _auth_is_fresh():
+        return
+    if _auth_future is None:
+        _auth_future = asyncio.ensure_future(_login_shared_client())
+    await asyncio.shield(_auth_future)
+
+
+_AUTH_FAILED = "Authentication failed - unable to connect to TestZeus"
+
+
+def require_auth(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Make sure the client is logged in before running a resource or tool."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        if not _auth_is_fresh():
+            await _require_authenticated()
+            if testzeus_client is None:
+                return _AUTH_FAILED
+        return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+class _QuietContext:
+    """Context proxy that drops ``info`` notifications and forwards everything else."""
+
+    __slots__ = ("_ctx",)
+
+    def __init__(self, ctx: Context) -> None:
+        self._ctx = ctx
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+    async def info(self, message: str, **extra: Any) -> None:
+        pass
+
+
+# Info notifications still being sent; held so their tasks are not garbage collected
+_info_tasks: set[asyncio.Task] = set()
+
+
+def _info_sent(task: asyncio.Task) -> None:
+    _info_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Info notification failed: %s", task.exception())
+
+
+class _BackgroundInfoContext(_QuietContext):
+    """Context proxy that sends ``info`` notifications without waiting for them."""
+
+    __slots__ = ()
+
+    async def info(self, message: str, **extra: Any) -> None:
+        task = asyncio.create_task(self._ctx.info(message, **extra))
+        _info_tasks.add(task)
+        task.add_done_callback(_info_sent)
+
+
+def tz_tool(
+    operation: str,
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """Wrap a tool with the shared authentication check and error reporting.
+
+    Any exception raised by the tool, or a failed login, becomes
+    ``"Error <operation>: <message>"``, sent to the client via ``ctx.error`` and
+    returned. ``operation`` may name tool
+    arguments in braces, e.g. ``"removing {config_type} config"``. Unless
+    TESTZEUS_INFO_NOTIFICATIONS is set, the tool's ``ctx.info`` calls send nothing;
+    when it is, they are sent in the background so the tool does not wait on them.
+    A blank required ``*_id``/``*_id_or_name`` argument is reported the same way
+    without authenticating or running the tool.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        signature = inspect.signature(fn)
+        required_ids = [
+            (index, name)
+            for index, (name, param) in enumerate(signature.parameters.items())
+            if param.default is inspect.Parameter.empty
+            and (name.endswith("_id") or name.endswith("_id_or_name"))
+        ]
+
+        async def report(error: Exception, args: tuple, kwargs: dict[str, Any]) -> str:
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            error_msg = f"Error {operation.format_map(arguments)}: {str(error)}"
+            ctx = arguments.get("ctx")
+            if ctx:
+                await ctx.error(error_msg)
+            return error_msg
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            for index, name in required_ids:
+                value = args[index] if index < len(args) else kwargs.get(name)
+                if isinstance(value, str) and not value.strip():
+                    return await report(ValueError(f"{name} is required"), args, kwargs)
+            # Checked inline so an authenticated call does not even create a coroutine
+            if not _auth_is_fresh():
+                await _require_authenticated()
+                if testzeus_client is None:
+                    return await report(ConnectionError(_AUTH_FAILED), args, kwargs)
+            if kwargs.get("ctx") is not None:
+                proxy = _BackgroundInfoContext if _INFO_NOTIFICATIONS else _QuietContext
+                kwargs["ctx"] = proxy(kwargs["ctx"])
+
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                _reset_auth_if_unauthorized(e)
+                return await report(e, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def _cached_payload(
+    key: tuple[str, str],
+    fetch: Callable[[], Awaitable[tuple[str, bool]]],
+) -> str:
+    """Return the cached payload for ``key`` or build it with ``fetch``.
+
+    ``fetch`` returns the payload and whether it may be cached. Concurrent misses for
+    the same key share a single fetch.
+    """
+    payload = _entity_cache.get(key)
+    if payload is not None:
+        return payload
+    lock = _entity_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        payload = _entity_cache.get(key)
+        if payload is None:
+            payload, cacheable = await fetch()
+            if cacheable:
+                _entity_cache[key] = payload
+    return payload
+
+
+def _invalidate_cached(*namespaces: str) -> None:
+    """Drop every cached payload and prefetched page under the given namespaces."""
+    for key in [key for key in _entity_cache if key[0] in namespaces]:
+        _entity_cache.pop(key, None)
+    for key in [key for key in _prefetched_pages if key[0] in namespaces]:
+        _prefetched_pages.pop(key)[1].cancel()
+
+
+def _page_key(collection: str, params: dict[str, Any]) -> tuple[str, int, int, bytes]:
+    query = orjson.dumps([params.get("filters"), params.get("sort")], option=orjson.OPT_SORT_KEYS)
+    return collection, params["page"], params["per_page"], query
+
+
+# Filter syntax accepted by the SDK's list calls, for requests that bypass the SDK
+_FILTER_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+_FILTER_OPERATORS = frozenset(
+    {"=", "!=", ">", ">=", "<", "<=", "~", "!~", "?=", "?!=", "?>", "?>=", "?<", "?<=", "?~", "?!~"}
+)
+
+
+def _filter_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, int | float):
+        return str(value)
+    if value is None:
+        return "null"
+    escaped = str(value).replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _filter_condition(field: str, value: Any) -> str:
+    if not _FILTER_FIELD_RE.match(field):
+        raise ValueError(
+            f'Invalid filter field "{field}". To filter with an operator, use '
+            '{"field": {"operator": "~", "value": "..."}}'
+        )
+    if isinstance(value, dict) and "operator" in value:
+        operator, operand = value["operator"], value["value"]
+        if operator not in _FILTER_OPERATORS:
+            allowed = ", ".join(sorted(_FILTER_OPERATORS))
+            raise ValueError(f'Invalid filter operator "{operator}". Allowed operators: {allowed}')
+        if operator.startswith("?") and isinstance(operand, list):
+            return f"({' || '.join(f'{field} {operator} {_filter_value(v)}' for v in operand)})"
+        return f"{field} {operator} {_filter_value(operand)}"
+    if isinstance(value, list):
+        return f"({' || '.join(f'{field} = {_filter_value(v)}' for v in value)})"
+    return f"{field} = {_filter_value(value)}"
+
+
+def _filter_conditions(filters: dict[str, Any]) -> list[str]:
+    conditions = []
+    for key, value in filters.items():
+        if key not in ("$and", "$or"):
+            conditions.append(_filter_condition(key, value))
+            continue
+        if not isinstance(value, list):
+            continue
+        group = [c for sub in value if isinstance(sub, dict) for c in _filter_conditions(sub)]
+        if len(group) > 1:
+            conditions.append(f"({(' && ' if key == '$and' else ' || ').join(group)})")
+        elif group:
+            conditions.append(group[0])
+    return conditions
+
+
+def _filter_string(filters: dict[str, Any]) -> str:
+    """Build the PocketBase filter expression for a list tool's ``filters``.
+
+    Same syntax as the SDK's list calls: ``{"field": "value"}``, a list of values,
+    ``{"field": {"operator": ">=", "value": 10}}`` and ``$and``/``$or`` groups.
+    """
+    return " && ".join(_filter_conditions(filters))
+
+
+async def _get_list(collection: str, params: dict[str, Any], models: bool = True) -> dict[str, Any]:
+    """Call ``get_list(**params)`` on an SDK manager, honouring a ``fields`` projection.
+
+    The SDK has no ``fields`` argument, so projected requests go to PocketBase directly
+    and are converted to models the same way the manager does. With ``models=False``
+    projected items are left as plain record dicts.
+    """
+    client = testzeus_client
+    manager = getattr(client, collection)
+    fields = params.get("fields")
+    if not fields:
+        return await manager.get_list(**params)
+
+    await client.ensure_authenticated()
+    filters = params.get("filters")
+    sort = params.get("sort")
+    # PocketBase's client is blocking; a worker thread lets concurrent pages overlap
+    result = await asyncio.to_thread(
+        client.pb.collection(manager.collection_name).get_list,
+        params.get("page", 1),
+        params.get("per_page", 30),
+        query_params={
+            "filter": _filter_string(filters) if filters else None,
+            "sort": ",".join(sort) if isinstance(sort, list) else sort,
+            "fields": fields,
+        },
+    )
+    return {
+        "items": [
+            manager.model_class(record_to_dict(item)) if models else record_to_dict(item)
+            for item in result.items
+        ],
+        "page": result.page,
+        "per_page": result.per_page,
+        "total_items": result.total_items,
+        "total_pages": result.total_pages,
+    }
+
+
+async def _get_pages(
+    collection: str, params: dict[str, Any], max_pages: int, prefetch: bool = False
+) -> dict[str, Any]:
+    """Fetch ``max_pages`` consecutive pages from ``params["page"]`` as one result.
+
+    Once the first page reveals ``total_pages`` the rest are requested together, at
+    most ``_PAGE_FETCH_CONCURRENCY`` at a time. A single page may use the prefetching
+    path instead.
+    """
+    if max_pages == 1:
+        return await (_get_list_prefetched if prefetch else _get_list)(collection, params)
+
+    first = await _get_list(collection, params)
+    start = params.get("page", 1)
+    last = min(first.get("total_pages", start), start + max_pages - 1)
+    limit = asyncio.Semaphore(_PAGE_FETCH_CONCURRENCY)
+
+    async def fetch(page: int) -> dict[str, Any]:
+        async with limit:
+            return await _get_list(collection, {**params, "page": page})
+
+    rest = await asyncio.gather(*(fetch(page) for page in range(start + 1, last + 1)))
+    items = list(first.get("items", []))
+    for result in rest:
+        items.extend(result.get("items", []))
+    return {**first, "items": items}
+
+
+async def _for_each(
+    keys: list[str], operation: Callable[[str], Awaitable[Any]]
+) -> list[dict[str, Any]]:
+    """Run ``operation`` for every key concurrently and report each outcome separately.
+
+    At most ``_BATCH_TOOL_CONCURRENCY`` operations run at once. A failure is recorded
+    under its key instead of failing the whole batch.
+    """
+    limit = asyncio.Semaphore(_BATCH_TOOL_CONCURRENCY)
+
+    async def run(key: str) -> Any:
+        async with limit:
+            return await operation(key)
+
+    outcomes = await asyncio.gather(*(run(key) for key in keys), return_exceptions=True)
+    return [
+        {"id": key, "error": str(outcome)}
+        if isinstance(outcome, Exception)
+        else {"id": key, "result": outcome}
+        for key, outcome in zip(keys, outcomes, strict=True)
+    ]
+
+
+async def _prepare_update(manager: Any, id_or_name: str) -> tuple[str, dict[str, Any]]:
+    """Resolve a record ID and the tenant/modified_by fields the SDK's ``update`` adds.
+
+    The only place the server calls manager internals: ``update`` itself posts with a
+    blocking client, so callers that move the POST off the event loop need these
+    steps on their own.
+    """
+    record_id = await manager._get_id_from_name_or_id(id_or_name)
+    data: dict[str, Any] = {}
+    await manager._add_tenant_id(data)
+    await manager._add_modified_by(data)
+    return record_id, data
+
+
+async def _upload(manager: Any, id_or_name: str, field: str, file_path: str) -> None:
+    """Append the file at ``file_path`` to the ``field`` file list of a record.
+
+    This is the SDK's ``add_file``, except that the multipart POST, which PocketBase
+    sends with a blocking client, runs on a worker thread so other tool calls are not
+    stalled for as long as the upload takes. The lookups stay on the event loop.
+    """
+    await testzeus_client.ensure_authenticated()
+    record_id, data = await _prepare_update(manager, id_or_name)
+    collection = testzeus_client.pb.collection(manager.collection_name)
+
+    def post() -> None:
+        with open(file_path, "rb") as file:
+            data[f"{field}+"] = FileUpload(file_path, file)
+            collection.update(record_id, data)
+
+    await asyncio.to_thread(post)
+
+
+def _count_ok(outcomes: list[dict[str, Any]]) -> int:
+    return sum("error" not in outcome for outcome in outcomes)
+
+
+async def _get_list_prefetched(collection: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Run ``_get_list(collection, params)`` and start fetching the next page.
+
+    A page prefetched by an earlier call is used instead of a fresh request.
+    """
+    now = time.monotonic()
+    for key, (started, task) in list(_prefetched_pages.items()):
+        if now - started > _PREFETCH_TTL:
+            del _prefetched_pages[key]
+            task.cancel()
+
+    result = None
+    prefetched = _prefetched_pages.pop(_page_key(collection, params), None)
+    if prefetched is not None:
+        try:
+            result = await prefetched[1]
+        except Exception:
+            result = None
+    if result is None:
+        result = await _get_list(collection, params)
+
+    if params["page"] < result.get("total_pages", 0):
+        next_params = {**params, "page": params["page"] + 1}
+        next_key = _page_key(collection, next_params)
+        if next_key not in _prefetched_pages:
+            task = asyncio.create_task(_get_list(collection, next_params))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            _prefetched_pages[next_key] = (now, task)
+    return result
+
+
+@dataclass
+class _PendingBatch:
+    """ID lookups waiting to be flushed as one list request."""
+
+    futures: dict[str, asyncio.Future] = field(default_factory=dict)
+    handle: asyncio.TimerHandle | None = None
+
+
+_pending_batches: dict[str, _PendingBatch] = {}
+_batch_tasks: set[asyncio.Task] = set()
+
+
+async def _load_batched(collection: str, id_or_name: str) -> Any:
+    """Fetch one record from ``collection`` (an SDK manager name, e.g. ``"tests"``).
+
+    Record IDs requested within ``_BATCH_WINDOW`` of each other are resolved with a
+    single ``id`` filtered list call; names fall back to a regular ``get_one``.
+    """
+    manager = getattr(testzeus_client, collection)
+    if not manager._is_valid_id(id_or_name):
+        return await manager.get_one(id_or_name)
+
+    loop = asyncio.get_running_loop()
+    batch = _pending_batches.setdefault(collection, _PendingBatch())
+    future = batch.futures.get(id_or_name)
+    if future is None:
+        future = batch.futures[id_or_name] = loop.create_future()
+        if len(batch.futures) >= _BATCH_MAX_SIZE:
+            _schedule_batch_flush(collection)
+        elif batch.handle is None:
+            batch.handle = loop.call_later(_BATCH_WINDOW, _schedule_batch_flush, collection)
+    # The future is shared by every caller asking for this ID; one cancelled caller
+    # must not cancel it for the others
+    return await asyncio.shield(future)
+
+
+def _schedule_batch_flush(collection: str) -> None:
+    batch = _pending_batches.pop(collection, None)
+    if batch is None:
+        return
+    if batch.handle is not None:
+        batch.handle.cancel()
+    task = asyncio.ensure_future(_flush_batch(collection, batch))
+    _batch_tasks.add(task)
+    task.add_done_callback(_batch_tasks.discard)
+
+
+async def _flush_batch(collection: str, batch: _PendingBatch) -> None:
+    manager = getattr(testzeus_client, collection)
+    ids = list(batch.futures)
+    try:
+        if len(ids) == 1:
+            records = [await manager.get_one(ids[0])]
+        else:
+            result = await manager.get_list(per_page=len(ids), filters={"id": ids})
+            records = result.get("items", [])
+    except Exception as e:
+        for future in batch.futures.values():
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    found = {record.id: record for record in records}
+    for record_id, future in batch.futures.items():
+        if future.done():
+            continue
+        if record_id in found:
+            future.set_result(found[record_id])
+            continue
+        # Let the single-record lookup produce the usual "not found" error
+        try:
+            future.set_result(await manager.get_one(record_id))
+        except Exception as e:
+            future.set_exception(e)
+
+
+def _can_stream(ctx: Context | None) -> bool:
+    """Whether the caller asked for progress notifications on this request."""
+    if ctx is None:
+        return False
+    meta = ctx.request_context.meta
+    return meta is not None and meta.progressToken is not None
+
+
+async def _stream_rows(ctx: Context, rows: list[Any], noun: str) -> CallToolResult:
+    """Push ``rows`` to the client as progress notifications and return a summary."""
+    total = len(rows)
+    for start in range(0, total, _STREAM_CHUNK_SIZE):
+        chunk = rows[start : start + _STREAM_CHUNK_SIZE]
+        await ctx.report_progress(start + len(chunk), total, message=_dumps_compact(chunk))
+    return CallToolResult(
+        content=[TextContent(type="text", text=f"Streamed {total} {noun}")],
+        structuredContent={"streamed": total},
+    )
+
+
+def _rows_result(rows: list[Any], noun: str) -> CallToolResult:
+    """Return list rows as structured content, with the usual summary text for older clients."""
+    payload = _dumps(rows)
+    # Parse the same JSON back so both forms agree on values pydantic would render
+    # differently (naive datetimes, for one)
+    return CallToolResult(
+        content=[TextContent(type="text", text=f"Found {len(rows)} {noun}:\n{payload}")],
+        structuredContent={"items": orjson.loads(payload)},
+    )
+
+
+def _resource_page(key: str, rows: list[Any], result: dict[str, Any], scheme: str) -> str:
+    """Serialize one page of a list resource, linking the next page when there is one."""
+    page = result.get("page", 1)
+    total_pages = result.get("total_pages", page)
+    payload: dict[str, Any] = {key: rows, "page": page, "total_pages": total_pages}
+    if page < total_pages:
+        payload["next"] = f"{scheme}://page/{page + 1}"
+    return _dumps(payload)
+
+
 # Test Management Tools
 @mcp.tool()
+@tz_tool("listing tests")
 async def list_tests(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
-) -> str:
-    """List all tests in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    stream: bool = False,
+    max_pages: MaxPages = 1,
+) -> CallToolResult:
+    """List all tests in TestZeus.
+
+    With ``stream=True`` rows are pushed as progress notifications in batches of ten
+    and only a summary is returned. ``max_pages`` fetches that many consecutive pages
+    starting at ``page`` in one call.
+    """
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "filters": filters,
+        "sort": sort,
+        "fields": _TEST_LIST_FIELDS,
+    }
+    result = await _get_pages("tests", params, max_pages, prefetch=True)
+    tests = result.get("items", [])
 
-    try:
-        per_page = min(per_page, 100)  # Cap at 100
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.tests.get_list(**params)
-        tests = result.get("items", [])
-
-        test_list = []
-        for test in tests:
-            test_list.append(
-                {
-                    "id": test.id,
-                    "name": test.name,
-                    "status": test.status,
-                    "testing_type": test.testing_type,
-                    "test_feature": test.test_feature,
-                    "tags": test.tags,
-                    "environment": test.environment,
-                    "created": str(test.created),
-                    "updated": str(test.updated),
-                }
-            )
+    test_list = [_TestRow(*_test_list_values(test)) for test in tests]
 
-        if ctx:
-            await ctx.info(f"Found {len(test_list)} tests")
+    if ctx:
+        await ctx.info(f"Found {len(test_list)} tests")
 
-        return f"Found {len(test_list)} tests:\n{json.dumps(test_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing tests: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if stream and _can_stream(ctx):
+        return await _stream_rows(ctx, test_list, "tests")
+
+    return _rows_result(test_list, "tests")
 
 
 @mcp.tool()
+@tz_tool("getting test")
 async def get_test(test_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific test by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
-        test = await testzeus_client.tests.get_one(test_id_or_name)
-        test_data = {
-            "id": test.id,
-            "name": test.name,
-            "status": test.status,
-            "testing_type": test.testing_type,
-            "test_feature": test.test_feature,
-            "tags": test.tags,
-            "test_data": test.test_data,
-            "environment": test.environment,
-            "config": getattr(test, "config", None),
-            "metadata": getattr(test, "metadata", None),
-            "created": str(test.created),
-            "updated": str(test.updated),
-            "tenant": test.tenant,
-            "modified_by": test.modified_by,
-        }
+    async def fetch() -> tuple[str, bool]:
+        test = await _load_batched("tests", test_id_or_name)
+        test_data = _test_detail_row(test)
+        return f"Test details:\n{_dumps(test_data)}", True
 
-        if ctx:
-            await ctx.info(f"Retrieved test: {test.name}")
+    result = await _cached_payload(("test", test_id_or_name), fetch)
 
-        return f"Test details:\n{json.dumps(test_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Retrieved test: {test_id_or_name}")
+
+    return result
 
 
 @mcp.tool()
+@tz_tool("creating test")
 async def create_test(
     name: str,
     test_feature: str,
-    testing_type: Literal["web", "mobile"] = "web",
+    testing_type: TestingType = "web",
     status: str = "draft",
     test_data: list[str] | None = None,
     tags: list[str] | None = None,
     environment: str | None = None,
     test_params: dict[str, Any] | None = None,
     output_schema: dict[str, Any] | None = None,
-    execution_mode: Literal["lenient", "strict"] = "lenient",
+    execution_mode: ExecutionMode = "lenient",
     ctx: Context = None,
 ) -> str:
     """Create a new test in TestZeus.
@@ -205,182 +1217,166 @@ async def create_test(
     if testing_type == "mobile" and not environment:
         return "Error: environment is required when testing_type is 'mobile'"
 
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    test = await testzeus_client.tests.create_test(
+        name=name,
+        test_feature=test_feature,
+        testing_type=testing_type,
+        status=status,
+        test_params=test_params,
+        test_data=test_data,
+        tags=tags,
+        environment=environment,
+        output_schema=output_schema,
+        execution_mode=execution_mode,
+    )
+    _invalidate_cached("tests")
 
-    try:
-        test = await testzeus_client.tests.create_test(
-            name=name,
-            test_feature=test_feature,
-            testing_type=testing_type,
-            status=status,
-            test_params=test_params,
-            test_data=test_data,
-            tags=tags,
-            environment=environment,
-            output_schema=output_schema,
-            execution_mode=execution_mode,
-        )
+    if ctx:
+        await ctx.info(f"Created test: {name}")
 
-        if ctx:
-            await ctx.info(f"Created test: {name}")
-
-        return f"Successfully created test '{name}' with ID: {test.id}"
-    except Exception as e:
-        error_msg = f"Error creating test: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created test '{name}' with ID: {test.id}"
 
 
 @mcp.tool()
+@tz_tool("updating test")
 async def update_test(
     test_id_or_name: str,
     name: str | None = None,
     test_feature: str | None = None,
-    testing_type: Literal["web", "mobile"] | None = None,
+    testing_type: TestingType | None = None,
     status: str | None = None,
     test_data: list[str] | None = None,
     tags: list[str] | None = None,
     environment: str | None = None,
     test_params: dict[str, Any] | None = None,
     output_schema: dict[str, Any] | None = None,
-    execution_mode: Literal["lenient", "strict"] | None = None,
+    execution_mode: ExecutionMode | None = None,
+    run: bool = False,
     ctx: Context = None,
 ) -> str:
     """Update an existing test in TestZeus.
 
-    When testing_type is set to 'mobile', an environment reference is required.
+    When testing_type is set to 'mobile', an environment reference is required. With
+    run=True a test run group named after the test is started once the update lands.
     """
     if testing_type == "mobile" and not environment:
         return "Error: environment is required when testing_type is 'mobile'"
 
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    data = _provided(
+        name=name,
+        test_feature=test_feature,
+        testing_type=testing_type,
+        status=status,
+        test_data=test_data,
+        tags=tags,
+        environment=environment,
+        test_params=test_params,
+        output_schema=output_schema,
+        execution_mode=execution_mode,
+    )
 
-    try:
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if test_feature is not None:
-            data["test_feature"] = test_feature
-        if testing_type:
-            data["testing_type"] = testing_type
-        if status is not None:
-            data["status"] = status
-        if test_data is not None:
-            data["test_data"] = test_data
-        if tags is not None:
-            data["tags"] = tags
-        if environment is not None:
-            data["environment"] = environment
-        if test_params is not None:
-            data["test_params"] = test_params
-        if output_schema is not None:
-            data["output_schema"] = output_schema
-        if execution_mode is not None:
-            data["execution_mode"] = execution_mode
-
-        test = await testzeus_client.tests.update_test(test_id_or_name, **data)
+    test = await testzeus_client.tests.update_test(test_id_or_name, **data)
+    _invalidate_cached("test", "test_resource", "tests")
 
-        if ctx:
-            await ctx.info(f"Updated test: {test.name}")
+    if ctx:
+        await ctx.info(f"Updated test: {test.name}")
+
+    updated_msg = f"Successfully updated test '{test.name}' (ID: {test.id})"
+    if not run:
+        return updated_msg
 
-        return f"Successfully updated test '{test.name}' (ID: {test.id})"
+    try:
+        group = await testzeus_client.test_run_groups.create_and_execute(
+            name=test.name,
+            test_ids=[test.id],
+            execution_mode="lenient",  # Hardcoded to lenient, as in run_test
+            # The environment the test is configured with, unless this update changed it
+            environment=environment or test.environment,
+        )
     except Exception as e:
-        error_msg = f"Error updating test: {str(e)}"
+        _reset_auth_if_unauthorized(e)
+        error_msg = f"{updated_msg}, but error running test: {str(e)}"
         if ctx:
             await ctx.error(error_msg)
         return error_msg
+    _invalidate_cached("test_runs")
+
+    if ctx:
+        await ctx.info(f"Started test run for test: {test.name}")
+
+    return f"{updated_msg}\nSuccessfully started test run '{group.name}' with ID: {group.id}"
 
 
 @mcp.tool()
+@tz_tool("getting test input params")
 async def get_test_input_params(test_id: str, ctx: Context = None) -> str:
     """Get merged input params and defaults for a test."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.tests.get_input_params(test_id)
 
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        result = await testzeus_client.tests.get_input_params(test_id)
+    if ctx:
+        await ctx.info(f"Retrieved input params for test: {test_id}")
 
-        if ctx:
-            await ctx.info(f"Retrieved input params for test: {test_id}")
-
-        return f"Test input params:\n{json.dumps(result, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test input params: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Test input params:\n{_dumps(result)}"
 
 
 @mcp.tool()
+@tz_tool("getting dependent test suites")
 async def get_dependent_test_suites(test_id: str, ctx: Context = None) -> str:
     """Get test suites that reference a test."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.test_suites.get_list(
+        filters={"tests": {"operator": "?=", "value": [test_id]}},
+        page=1,
+        per_page=50,
+    )
+    suite_list = [
+        {
+            "id": suite.id,
+            "name": suite.name,
+            "display_name": getattr(suite, "display_name", None),
+            "status": suite.status,
+            "execution_mode": getattr(suite, "execution_mode", None),
+        }
+        for suite in result.get("items", [])
+    ]
 
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Retrieved dependent suites for test: {test_id}")
 
-    try:
-        result = await testzeus_client.test_suites.get_list(
-            filters={"tests": {"operator": "?=", "value": [test_id]}},
-            page=1,
-            per_page=50,
-        )
-        suite_list = [
-            {
-                "id": suite.id,
-                "name": suite.name,
-                "display_name": getattr(suite, "display_name", None),
-                "status": suite.status,
-                "execution_mode": getattr(suite, "execution_mode", None),
-            }
-            for suite in result.get("items", [])
-        ]
-
-        if ctx:
-            await ctx.info(f"Retrieved dependent suites for test: {test_id}")
-
-        return f"Dependent test suites:\n{json.dumps(suite_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting dependent test suites: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Dependent test suites:\n{_dumps(suite_list)}"
 
 
 @mcp.tool()
+@tz_tool("deleting test")
 async def delete_test(test_id_or_name: str, ctx: Context = None) -> str:
     """Delete a test (sets status to deleted)."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    await testzeus_client.tests.delete(test_id_or_name)
+    _invalidate_cached("test", "test_resource", "tests")
 
-    try:
-        await testzeus_client.tests.delete(test_id_or_name)
+    if ctx:
+        await ctx.info(f"Deleted test: {test_id_or_name}")
 
-        if ctx:
-            await ctx.info(f"Deleted test: {test_id_or_name}")
+    return f"Successfully deleted test '{test_id_or_name}'"
 
-        return f"Successfully deleted test '{test_id_or_name}'"
-    except Exception as e:
-        error_msg = f"Error deleting test: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+
+@mcp.tool()
+@tz_tool("deleting tests")
+async def delete_tests(test_ids_or_names: list[str], ctx: Context = None) -> str:
+    """Delete several tests (sets status to deleted) in one call.
+
+    Each entry reports whether that test was deleted or the error it hit.
+    """
+    outcomes = await _for_each(test_ids_or_names, testzeus_client.tests.delete)
+    _invalidate_cached("test", "test_resource", "tests")
+    deleted = _count_ok(outcomes)
+
+    if ctx:
+        await ctx.info(f"Deleted {deleted} of {len(outcomes)} tests")
+
+    return f"Deleted {deleted} of {len(outcomes)} tests:\n{_dumps(outcomes)}"
 
 
 @mcp.tool()
+@tz_tool("running test")
 async def run_test(
     name: str,
     test_ids: list[str],
@@ -390,28 +1386,86 @@ async def run_test(
     ctx: Context = None,
 ) -> str:
     """Execute tests and start a test run group."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     if test_ids and tags:
         return "Error: test_ids and tags cannot be used together, provide one of them."
 
+    group = await testzeus_client.test_run_groups.create_and_execute(
+        name=name,
+        test_ids=test_ids,
+        execution_mode="lenient",  # Hardcoded to lenient
+        environment=environment,
+        tags=tags,
+        notification_channels=notification_channels,
+    )
+    _invalidate_cached("test_runs")
+
+    if ctx:
+        await ctx.info(f"Started test run for test: {name}")
+
+    return f"Successfully started test run '{group.name}' with ID: {group.id}"
+
+
+@mcp.tool()
+@tz_tool("creating and running test")
+async def create_and_run_test(
+    name: str,
+    test_feature: str,
+    testing_type: TestingType = "web",
+    status: str = "ready",
+    test_data: list[str] | None = None,
+    tags: list[str] | None = None,
+    environment: str | None = None,
+    test_params: dict[str, Any] | None = None,
+    output_schema: dict[str, Any] | None = None,
+    execution_mode: ExecutionMode = "lenient",
+    run_name: str | None = None,
+    notification_channels: list[str] | None = None,
+    ctx: Context = None,
+) -> str:
+    """Create a new test and immediately start a test run group for it.
+
+    Equivalent to create_test followed by run_test in a single call. run_name defaults
+    to the test name; the run uses the test's environment. status defaults to 'ready'
+    rather than create_test's 'draft', since the test is run straight away.
+    """
+    if testing_type == "mobile" and not environment:
+        return "Error: environment is required when testing_type is 'mobile'"
+
+    test = await testzeus_client.tests.create_test(
+        name=name,
+        test_feature=test_feature,
+        testing_type=testing_type,
+        status=status,
+        test_params=test_params,
+        test_data=test_data,
+        tags=tags,
+        environment=environment,
+        output_schema=output_schema,
+        execution_mode=execution_mode,
+    )
+    _invalidate_cached("tests")
+
+    # The run needs the new test's ID, so the two steps cannot overlap
     try:
         group = await testzeus_client.test_run_groups.create_and_execute(
-            name=name,
-            test_ids=test_ids,
-            execution_mode="lenient",  # Hardcoded to lenient
+            name=run_name or name,
+            test_ids=[test.id],
+            execution_mode="lenient",  # Hardcoded to lenient, as in run_test
             environment=environment,
-            tags=tags,
             notification_channels=notification_channels,
         )
+        _invalidate_cached("test_runs")
 
         if ctx:
-            await ctx.info(f"Started test run for test: {name}")
+            await ctx.info(f"Created test {name} and started test run {group.name}")
 
-        return f"Successfully started test run '{group.name}' with ID: {group.id}"
+        return (
+            f"Successfully created test '{name}' with ID: {test.id}\n"
+            f"Successfully started test run '{group.name}' with ID: {group.id}"
+        )
     except Exception as e:
-        error_msg = f"Error running test: {str(e)}"
+        _reset_auth_if_unauthorized(e)
+        error_msg = f"Created test '{name}' with ID: {test.id}, but error running test: {str(e)}"
         if ctx:
             await ctx.error(error_msg)
         return error_msg
@@ -419,231 +1473,179 @@ async def run_test(
 
 # Test Run Management Tools
 @mcp.tool()
+@tz_tool("listing test runs")
 async def list_test_runs(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
-) -> str:
-    """List all test runs in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    stream: bool = False,
+    max_pages: MaxPages = 1,
+) -> CallToolResult:
+    """List all test runs in TestZeus.
+
+    With ``stream=True`` rows are pushed as progress notifications in batches of ten
+    and only a summary is returned. ``max_pages`` fetches that many consecutive pages
+    starting at ``page`` in one call.
+    """
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "filters": filters,
+        "sort": sort,
+        "fields": _TEST_RUN_LIST_FIELDS,
+    }
+    result = await _get_pages("test_runs", params, max_pages, prefetch=True)
+    test_runs = result.get("items", [])
+
+    run_list = [
+        _TestRunRow(
+            run.id,
+            run.name,
+            run.status,
+            run.test,
+            run.start_time,
+            run.end_time,
+            run.created,
+            run.updated,
+        )
+        for run in test_runs
+    ]
 
-    try:
-        per_page = min(per_page, 100)  # Cap at 100
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.test_runs.get_list(**params)
-        test_runs = result.get("items", [])
-
-        run_list = []
-        for run in test_runs:
-            run_list.append(
-                {
-                    "id": run.id,
-                    "name": run.name,
-                    "status": run.status,
-                    "test": run.test,
-                    "start_time": str(getattr(run, "start_time", None)),
-                    "end_time": str(getattr(run, "end_time", None)),
-                    "created": str(run.created),
-                    "updated": str(run.updated),
-                }
-            )
+    if ctx:
+        await ctx.info(f"Found {len(run_list)} test runs")
 
-        if ctx:
-            await ctx.info(f"Found {len(run_list)} test runs")
+    if stream and _can_stream(ctx):
+        return await _stream_rows(ctx, run_list, "test runs")
 
-        return f"Found {len(run_list)} test runs:\n{json.dumps(run_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing test runs: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _rows_result(run_list, "test runs")
 
 
 @mcp.tool()
+@tz_tool("getting test run")
 async def get_test_run(test_run_id: str, ctx: Context = None) -> str:
     """Get a specific test run by ID."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
+    async def fetch() -> tuple[str, bool]:
         details = await testzeus_client.test_runs.get_expanded(test_run_id)
+        status = (details.get("test_run") or {}).get("status")
+        return f"Test run details:\n{_dumps(details)}", status in _FINAL_RUN_STATUSES
 
-        if ctx:
-            await ctx.info(f"Retrieved test run: {details}")
+    result = await _cached_payload(("test_run", test_run_id), fetch)
 
-        return f"Test run details:\n{json.dumps(details, cls=DateTimeEncoder, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Retrieved test run: {test_run_id}")
+
+    return result
 
 
 @mcp.tool()
+@tz_tool("deleting test run")
 async def delete_test_run(test_run_id: str, ctx: Context = None) -> str:
     """Delete a test run."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.test_runs.delete(test_run_id)
+    await testzeus_client.test_runs.delete(test_run_id)
+    _invalidate_cached("test_run", "test_run_resource", "test_runs")
 
-        if ctx:
-            await ctx.info(f"Deleted test run: {test_run_id}")
+    if ctx:
+        await ctx.info(f"Deleted test run: {test_run_id}")
 
-        return f"Successfully deleted test run with ID: {test_run_id}"
-    except Exception as e:
-        error_msg = f"Error deleting test run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully deleted test run with ID: {test_run_id}"
 
 
 # Test Suite Management Tools
 @mcp.tool()
+@tz_tool("listing test suites")
 async def list_test_suites(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all test suites in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        params = {"page": page, "per_page": min(per_page, 100)}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-
-        result = await testzeus_client.test_suites.get_list(**params)
-        suites = result.get("items", [])
-        suite_list = [
-            {
-                "id": suite.id,
-                "name": suite.name,
-                "display_name": getattr(suite, "display_name", None),
-                "status": suite.status,
-                "execution_mode": getattr(suite, "execution_mode", None),
-            }
-            for suite in suites
-        ]
+    result = await testzeus_client.test_suites.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    suites = result.get("items", [])
+    suite_list = [
+        {
+            "id": suite.id,
+            "name": suite.name,
+            "display_name": getattr(suite, "display_name", None),
+            "status": suite.status,
+            "execution_mode": getattr(suite, "execution_mode", None),
+        }
+        for suite in suites
+    ]
 
-        if ctx:
-            await ctx.info(f"Found {len(suite_list)} test suites")
+    if ctx:
+        await ctx.info(f"Found {len(suite_list)} test suites")
 
-        return f"Found {len(suite_list)} test suites:\n{json.dumps(suite_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing test suites: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Found {len(suite_list)} test suites:\n{_dumps(suite_list)}"
 
 
 @mcp.tool()
+@tz_tool("getting test suite")
 async def get_test_suite(test_suite_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific test suite by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    suite = await testzeus_client.test_suites.get_one(test_suite_id_or_name)
+    suite_data = {
+        "id": suite.id,
+        "name": suite.name,
+        "display_name": getattr(suite, "display_name", None),
+        "status": suite.status,
+        "workflow_definition": getattr(suite, "workflow_definition", None),
+        "default_inputs": getattr(suite, "default_inputs", None),
+        "execution_mode": getattr(suite, "execution_mode", None),
+        "environment": getattr(suite, "environment", None),
+        "tags": getattr(suite, "tags", []),
+        "notification_channels": getattr(suite, "notification_channels", []),
+    }
 
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Retrieved test suite: {suite.name}")
 
-    try:
-        suite = await testzeus_client.test_suites.get_one(test_suite_id_or_name)
-        suite_data = {
-            "id": suite.id,
-            "name": suite.name,
-            "display_name": getattr(suite, "display_name", None),
-            "status": suite.status,
-            "workflow_definition": getattr(suite, "workflow_definition", None),
-            "default_inputs": getattr(suite, "default_inputs", None),
-            "execution_mode": getattr(suite, "execution_mode", None),
-            "environment": getattr(suite, "environment", None),
-            "tags": getattr(suite, "tags", []),
-            "notification_channels": getattr(suite, "notification_channels", []),
-        }
-
-        if ctx:
-            await ctx.info(f"Retrieved test suite: {suite.name}")
-
-        return f"Test suite details:\n{json.dumps(suite_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test suite: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Test suite details:\n{_dumps(suite_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating test suite")
 async def create_test_suite(
     name: str,
     workflow_definition: dict[str, Any],
     default_inputs: dict[str, Any] | None = None,
     input_schema: list[dict[str, Any]] | None = None,
     status: str = "draft",
-    execution_mode: Literal["lenient", "strict"] = "lenient",
+    execution_mode: ExecutionMode = "lenient",
     environment: str | None = None,
     tags: list[str] | None = None,
     notification_channels: list[str] | None = None,
     ctx: Context = None,
 ) -> str:
     """Create a new test suite."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        suite = await testzeus_client.test_suites.create(
-            {
-                "name": name,
-                "workflow_definition": workflow_definition,
-                "default_inputs": default_inputs or {},
-                "input_schema": input_schema or [],
-                "status": status,
-                "execution_mode": execution_mode,
-                "environment": environment,
-                "tags": tags or [],
-                "notification_channels": notification_channels or [],
-            }
-        )
+    suite = await testzeus_client.test_suites.create(
+        {
+            "name": name,
+            "workflow_definition": workflow_definition,
+            "default_inputs": default_inputs or {},
+            "input_schema": input_schema or [],
+            "status": status,
+            "execution_mode": execution_mode,
+            "environment": environment,
+            "tags": tags or [],
+            "notification_channels": notification_channels or [],
+        }
+    )
 
-        if ctx:
-            await ctx.info(f"Created test suite: {name}")
+    if ctx:
+        await ctx.info(f"Created test suite: {name}")
 
-        return f"Successfully created test suite '{name}' with ID: {suite.id}"
-    except Exception as e:
-        error_msg = f"Error creating test suite: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created test suite '{name}' with ID: {suite.id}"
 
 
 @mcp.tool()
+@tz_tool("updating test suite")
 async def update_test_suite(
     test_suite_id_or_name: str,
     name: str | None = None,
@@ -651,168 +1653,100 @@ async def update_test_suite(
     default_inputs: dict[str, Any] | None = None,
     input_schema: list[dict[str, Any]] | None = None,
     status: str | None = None,
-    execution_mode: Literal["lenient", "strict"] | None = None,
+    execution_mode: ExecutionMode | None = None,
     environment: str | None = None,
     tags: list[str] | None = None,
     notification_channels: list[str] | None = None,
     ctx: Context = None,
 ) -> str:
     """Update an existing test suite."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data = _provided(
+        name=name,
+        workflow_definition=workflow_definition,
+        default_inputs=default_inputs,
+        input_schema=input_schema,
+        status=status,
+        execution_mode=execution_mode,
+        environment=environment,
+        tags=tags,
+        notification_channels=notification_channels,
+    )
 
-    try:
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if workflow_definition is not None:
-            data["workflow_definition"] = workflow_definition
-        if default_inputs is not None:
-            data["default_inputs"] = default_inputs
-        if input_schema is not None:
-            data["input_schema"] = input_schema
-        if status is not None:
-            data["status"] = status
-        if execution_mode is not None:
-            data["execution_mode"] = execution_mode
-        if environment is not None:
-            data["environment"] = environment
-        if tags is not None:
-            data["tags"] = tags
-        if notification_channels is not None:
-            data["notification_channels"] = notification_channels
-
-        suite = await testzeus_client.test_suites.update(test_suite_id_or_name, data)
+    suite = await testzeus_client.test_suites.update(test_suite_id_or_name, data)
 
-        if ctx:
-            await ctx.info(f"Updated test suite: {suite.name}")
+    if ctx:
+        await ctx.info(f"Updated test suite: {suite.name}")
 
-        return f"Successfully updated test suite '{suite.name}' (ID: {suite.id})"
-    except Exception as e:
-        error_msg = f"Error updating test suite: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully updated test suite '{suite.name}' (ID: {suite.id})"
 
 
 @mcp.tool()
+@tz_tool("deleting test suite")
 async def delete_test_suite(test_suite_id_or_name: str, ctx: Context = None) -> str:
     """Delete a test suite."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        await testzeus_client.test_suites.delete(test_suite_id_or_name)
-        if ctx:
-            await ctx.info(f"Deleted test suite: {test_suite_id_or_name}")
-        return f"Successfully deleted test suite '{test_suite_id_or_name}'"
-    except Exception as e:
-        error_msg = f"Error deleting test suite: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.test_suites.delete(test_suite_id_or_name)
+    if ctx:
+        await ctx.info(f"Deleted test suite: {test_suite_id_or_name}")
+    return f"Successfully deleted test suite '{test_suite_id_or_name}'"
 
 
 @mcp.tool()
+@tz_tool("listing test suite runs")
 async def list_test_suite_runs(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all test suite runs in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        params = {"page": page, "per_page": min(per_page, 100)}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-
-        result = await testzeus_client.test_suite_runs.get_list(**params)
-        runs = result.get("items", [])
-        run_list = [
-            {
-                "id": run.id,
-                "name": run.name,
-                "status": run.status,
-                "test_suite": getattr(run, "test_suite", None),
-                "start_time": str(getattr(run, "start_time", None)),
-                "end_time": str(getattr(run, "end_time", None)),
-            }
-            for run in runs
-        ]
+    result = await testzeus_client.test_suite_runs.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    runs = result.get("items", [])
+    run_list = [
+        {
+            "id": run.id,
+            "name": run.name,
+            "status": run.status,
+            "test_suite": getattr(run, "test_suite", None),
+            "start_time": getattr(run, "start_time", None),
+            "end_time": getattr(run, "end_time", None),
+        }
+        for run in runs
+    ]
 
-        if ctx:
-            await ctx.info(f"Found {len(run_list)} test suite runs")
+    if ctx:
+        await ctx.info(f"Found {len(run_list)} test suite runs")
 
-        return f"Found {len(run_list)} test suite runs:\n{json.dumps(run_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing test suite runs: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Found {len(run_list)} test suite runs:\n{_dumps(run_list)}"
 
 
 @mcp.tool()
+@tz_tool("getting test suite run")
 async def get_test_suite_run(test_suite_run_id: str, ctx: Context = None) -> str:
     """Get a specific test suite run by ID."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        run = await testzeus_client.test_suite_runs.get_one(test_suite_run_id)
-        run_data = {
-            "id": run.id,
-            "name": run.name,
-            "status": run.status,
-            "test_suite": getattr(run, "test_suite", None),
-            "workflow_snapshot": getattr(run, "workflow_snapshot", None),
-            "input_values": getattr(run, "input_values", None),
-            "context_store": getattr(run, "context_store", None),
-            "outputs": getattr(run, "outputs", None),
-            "execution_checkpoint": getattr(run, "execution_checkpoint", None),
-        }
+    run = await testzeus_client.test_suite_runs.get_one(test_suite_run_id)
+    run_data = {
+        "id": run.id,
+        "name": run.name,
+        "status": run.status,
+        "test_suite": getattr(run, "test_suite", None),
+        "workflow_snapshot": getattr(run, "workflow_snapshot", None),
+        "input_values": getattr(run, "input_values", None),
+        "context_store": getattr(run, "context_store", None),
+        "outputs": getattr(run, "outputs", None),
+        "execution_checkpoint": getattr(run, "execution_checkpoint", None),
+    }
 
-        if ctx:
-            await ctx.info(f"Retrieved test suite run: {run.name}")
+    if ctx:
+        await ctx.info(f"Retrieved test suite run: {run.name}")
 
-        return f"Test suite run details:\n{json.dumps(run_data, cls=DateTimeEncoder, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test suite run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Test suite run details:\n{_dumps(run_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating test suite run")
 async def create_test_suite_run(
     name: str,
     test_suite: str,
@@ -822,36 +1756,23 @@ async def create_test_suite_run(
     ctx: Context = None,
 ) -> str:
     """Create a new test suite run in lenient mode."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        run = await testzeus_client.test_suite_runs.run(
-            display_name=name,
-            test_suite=test_suite,
-            input_values=input_values,
-            environment=environment,
-            notification_channels=notification_channels,
-        )
+    run = await testzeus_client.test_suite_runs.run(
+        display_name=name,
+        test_suite=test_suite,
+        input_values=input_values,
+        environment=environment,
+        notification_channels=notification_channels,
+    )
+    _invalidate_cached("test_runs")
 
-        if ctx:
-            await ctx.info(f"Created test suite run: {name}")
+    if ctx:
+        await ctx.info(f"Created test suite run: {name}")
 
-        return f"Successfully created test suite run '{name}' with ID: {run.id}"
-    except Exception as e:
-        error_msg = f"Error creating test suite run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created test suite run '{name}' with ID: {run.id}"
 
 
 @mcp.tool()
+@tz_tool("pausing test suite run")
 async def pause_test_suite_run(
     test_suite_run_id: str,
     mode: Literal["graceful", "immediate"] = "graceful",
@@ -859,196 +1780,115 @@ async def pause_test_suite_run(
     ctx: Context = None,
 ) -> str:
     """Pause a running test suite run."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        result = await testzeus_client.test_suite_runs.pause(
-            test_suite_run_id,
-            mode=mode,
-            reason=reason,
-        )
-        result_msg = f"Pause result:\n{json.dumps(result, indent=2)}"
-        if ctx:
-            await ctx.info(f"Paused test suite run: {test_suite_run_id} (mode={mode})")
-        return result_msg
-    except Exception as e:
-        error_msg = f"Error pausing test suite run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.test_suite_runs.pause(
+        test_suite_run_id,
+        mode=mode,
+        reason=reason,
+    )
+    result_msg = f"Pause result:\n{_dumps(result)}"
+    if ctx:
+        await ctx.info(f"Paused test suite run: {test_suite_run_id} (mode={mode})")
+    return result_msg
 
 
 @mcp.tool()
+@tz_tool("resuming test suite run")
 async def resume_test_suite_run(test_suite_run_id: str, ctx: Context = None) -> str:
     """Resume a paused test suite run."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        result = await testzeus_client.test_suite_runs.resume(test_suite_run_id)
-        result_msg = f"Resume result:\n{json.dumps(result, indent=2)}"
-        if ctx:
-            await ctx.info(f"Resumed test suite run: {test_suite_run_id}")
-        return result_msg
-    except Exception as e:
-        error_msg = f"Error resuming test suite run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.test_suite_runs.resume(test_suite_run_id)
+    result_msg = f"Resume result:\n{_dumps(result)}"
+    if ctx:
+        await ctx.info(f"Resumed test suite run: {test_suite_run_id}")
+    return result_msg
 
 
 @mcp.tool()
-async def cancel_test_suite_run(test_suite_run_id: str, ctx: Context = None) -> str:
-    """Cancel a running test suite run."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        result = await testzeus_client.test_suite_runs.cancel(test_suite_run_id)
-        result_msg = f"Cancel result:\n{json.dumps(result, indent=2)}"
-        if ctx:
-            await ctx.info(f"Cancelled test suite run: {test_suite_run_id}")
-        return result_msg
-    except Exception as e:
-        error_msg = f"Error cancelling test suite run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def list_test_suite_node_runs(
-    page: int = 1,
-    per_page: int = 50,
-    ctx: Context = None,
-    filters: dict[str, Any] | None = None,
-    sort: str | list[str] | None = None,
-) -> str:
-    """List all test suite node runs in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        params = {"page": page, "per_page": min(per_page, 100)}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-
-        result = await testzeus_client.test_suite_node_runs.get_list(**params)
-        node_runs = result.get("items", [])
-        node_run_list = [
-            {
-                "id": node_run.id,
-                "test_suite_run": getattr(node_run, "test_suite_run", None),
-                "node_id": getattr(node_run, "node_id", None),
-                "status": getattr(node_run, "status", None),
-                "test_run": getattr(node_run, "test_run", None),
-            }
-            for node_run in node_runs
-        ]
-        result_msg = (
-            f"Found {len(node_run_list)} test suite node runs:\n"
-            f"{json.dumps(node_run_list, indent=2)}"
-        )
-        if ctx:
-            await ctx.info(f"Found {len(node_run_list)} test suite node runs")
-        return result_msg
-    except Exception as e:
-        error_msg = f"Error listing test suite node runs: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+@tz_tool("cancelling test suite run")
+async def cancel_test_suite_run(test_suite_run_id: str, ctx: Context = None) -> str:
+    """Cancel a running test suite run."""
+    result = await testzeus_client.test_suite_runs.cancel(test_suite_run_id)
+    result_msg = f"Cancel result:\n{_dumps(result)}"
+    if ctx:
+        await ctx.info(f"Cancelled test suite run: {test_suite_run_id}")
+    return result_msg
 
 
 @mcp.tool()
-async def list_test_suite_schedules(
+@tz_tool("listing test suite node runs")
+async def list_test_suite_node_runs(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
-    """List all test suite schedules in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    """List all test suite node runs in TestZeus."""
+    result = await testzeus_client.test_suite_node_runs.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    node_runs = result.get("items", [])
+    node_run_list = [
+        {
+            "id": node_run.id,
+            "test_suite_run": getattr(node_run, "test_suite_run", None),
+            "node_id": getattr(node_run, "node_id", None),
+            "status": getattr(node_run, "status", None),
+            "test_run": getattr(node_run, "test_run", None),
+        }
+        for node_run in node_runs
+    ]
+    result_msg = f"Found {len(node_run_list)} test suite node runs:\n{_dumps(node_run_list)}"
+    if ctx:
+        await ctx.info(f"Found {len(node_run_list)} test suite node runs")
+    return result_msg
 
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
 
-    try:
-        params = {"page": page, "per_page": min(per_page, 100)}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-
-        result = await testzeus_client.test_suite_schedules.get_list(**params)
-        schedules = result.get("items", [])
-        schedule_list = [
-            {
-                "id": schedule.id,
-                "name": getattr(schedule, "name", None),
-                "test_suite": getattr(schedule, "test_suite", None),
-                "cron_expression": getattr(schedule, "cron_expression", None),
-                "is_active": getattr(schedule, "is_active", None),
-            }
-            for schedule in schedules
-        ]
-        result_msg = (
-            f"Found {len(schedule_list)} test suite schedules:\n"
-            f"{json.dumps(schedule_list, indent=2)}"
-        )
-        if ctx:
-            await ctx.info(f"Found {len(schedule_list)} test suite schedules")
-        return result_msg
-    except Exception as e:
-        error_msg = f"Error listing test suite schedules: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+@mcp.tool()
+@tz_tool("listing test suite schedules")
+async def list_test_suite_schedules(
+    page: int = 1,
+    per_page: PerPage = 50,
+    ctx: Context = None,
+    filters: dict[str, Any] | None = None,
+    sort: str | list[str] | None = None,
+) -> str:
+    """List all test suite schedules in TestZeus."""
+    result = await testzeus_client.test_suite_schedules.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    schedules = result.get("items", [])
+    schedule_list = [
+        {
+            "id": schedule.id,
+            "name": getattr(schedule, "name", None),
+            "test_suite": getattr(schedule, "test_suite", None),
+            "cron_expression": getattr(schedule, "cron_expression", None),
+            "is_active": getattr(schedule, "is_active", None),
+        }
+        for schedule in schedules
+    ]
+    result_msg = f"Found {len(schedule_list)} test suite schedules:\n{_dumps(schedule_list)}"
+    if ctx:
+        await ctx.info(f"Found {len(schedule_list)} test suite schedules")
+    return result_msg
 
 
 # Environment Management Tools
 @mcp.tool()
+@tz_tool("listing environments")
 async def list_environments(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
-) -> str:
+    stream: bool = False,
+    max_pages: MaxPages = 1,
+) -> CallToolResult:
     """List environments with pagination, sorting, and filtering.
 
-    Secret-typed values in data content are masked in the output.
+    Secret-typed values in data content are masked in the output. Large data content
+    is shortened to a summary; use get_environment for the full record.
 
     Args:
         page: 1-based page number.
@@ -1058,60 +1898,54 @@ async def list_environments(
             Operators: =, !=, >, >=, <, <=, ~ (contains), !~ (not contains).
             A list ORs values. Group with {"$and": [...]} / {"$or": [...]}.
         sort: Field name to sort by; prefix with '-' for descending (e.g. "-created").
+        stream: Push rows as progress notifications in batches of ten and return
+            only a summary. Ignored when the client sent no progress token.
+        max_pages: Fetch this many consecutive pages starting at page (max 20).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "filters": filters,
+        "sort": sort,
+        "fields": _ENVIRONMENT_LIST_FIELDS,
+    }
+    result = await _get_pages("environments", params, max_pages, prefetch=True)
+    environments = result.get("items", [])
 
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.environments.get_list(**params)
-        environments = result.get("items", [])
-
-        env_list = []
-        for env in environments:
-            env_list.append(_serialize_environment(env, detail=False))
+    env_list = [_serialize_environment(env, detail=False) for env in environments]
 
-        if ctx:
-            await ctx.info(f"Found {len(env_list)} environments")
+    if ctx:
+        await ctx.info(f"Found {len(env_list)} environments")
 
-        return f"Found {len(env_list)} environments:\n{json.dumps(env_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing environments: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if stream and _can_stream(ctx):
+        return await _stream_rows(ctx, env_list, "environments")
+
+    return _rows_result(env_list, "environments")
 
 
 @mcp.tool()
+@tz_tool("getting environment")
 async def get_environment(environment_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific environment by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
-        env = await testzeus_client.environments.get_one(environment_id_or_name)
+    async def fetch() -> tuple[str, bool]:
+        env = await _load_batched("environments", environment_id_or_name)
         env_data = _serialize_environment(env, detail=True)
+        return f"Environment details:\n{_dumps(env_data)}", True
 
-        if ctx:
-            await ctx.info(f"Retrieved environment: {env.name}")
+    result = await _cached_payload(("environment", environment_id_or_name), fetch)
 
-        return f"Environment details:\n{json.dumps(env_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Retrieved environment: {environment_id_or_name}")
+
+    return result
 
 
 @mcp.tool()
+@tz_tool("creating environment")
 async def create_environment(
     name: str,
-    device_type: Literal["browser", "mobile-android", "mobile-ios"] = "browser",
+    device_type: DeviceType = "browser",
     data_content: dict[str, Any] | str | None = None,
     tags: list[str] | None = None,
     supporting_data_files: str | None = None,
@@ -1149,42 +1983,35 @@ async def create_environment(
     if validation_error:
         return validation_error
 
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        env = await testzeus_client.environments.create_environment(
-            name=name,
-            device_type=device_type,
-            data=data_content,
-            tags=tags,
-            supporting_data_files=supporting_data_files,
-            mobile_supporting_data_file=mobile_supporting_data_file,
-            mobile_device=mobile_device,
-            connected_environments=connected_environments,
-            email_manager=email_manager,
-            source_code_integrations=source_code_integrations,
-            agent_grounding_prompt=agent_grounding_prompt,
-        )
+    env = await testzeus_client.environments.create_environment(
+        name=name,
+        device_type=device_type,
+        data=data_content,
+        tags=tags,
+        supporting_data_files=supporting_data_files,
+        mobile_supporting_data_file=mobile_supporting_data_file,
+        mobile_device=mobile_device,
+        connected_environments=connected_environments,
+        email_manager=email_manager,
+        source_code_integrations=source_code_integrations,
+        agent_grounding_prompt=agent_grounding_prompt,
+    )
+    _invalidate_cached("environments")
 
-        created = _serialize_environment(env, detail=True)
+    created = _serialize_environment(env, detail=True)
 
-        if ctx:
-            await ctx.info(f"Created environment: {name}")
+    if ctx:
+        await ctx.info(f"Created environment: {name}")
 
-        return f"Successfully created environment:\n{json.dumps(created, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error creating environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created environment:\n{_dumps(created)}"
 
 
 @mcp.tool()
+@tz_tool("updating environment")
 async def update_environment(
     environment_id: str,
     name: str | None = None,
-    device_type: Literal["browser", "mobile-android", "mobile-ios"] | None = None,
+    device_type: DeviceType | None = None,
     data_content: dict[str, Any] | str | None = None,
     tags: list[str] | None = None,
     supporting_data_files: str | None = None,
@@ -1211,9 +2038,6 @@ async def update_environment(
     agent_grounding_prompt is a JSON object with 'test_creation' and/or
     'test_execution' string keys; keys not provided keep their current value.
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     update_args = (
         name,
         device_type,
@@ -1230,156 +2054,127 @@ async def update_environment(
     if all(arg is None for arg in update_args):
         return "Error updating environment: provide at least one field to update"
 
-    try:
-        device_fields_touched = any(
-            v is not None
-            for v in (
-                supporting_data_files,
-                mobile_supporting_data_file,
-                mobile_device,
-                connected_environments,
-                email_manager,
-            )
+    device_fields_touched = any(
+        v is not None
+        for v in (
+            supporting_data_files,
+            mobile_supporting_data_file,
+            mobile_device,
+            connected_environments,
+            email_manager,
         )
-        if device_fields_touched or device_type is not None:
-            effective_device_type = device_type
-            if effective_device_type is None:
-                existing = await testzeus_client.environments.get_one(environment_id)
-                effective_device_type = existing.device_type or "browser"
-            validation_error = _validate_environment_device_fields(
-                effective_device_type,
-                supporting_data_files=supporting_data_files,
-                mobile_supporting_data_file=mobile_supporting_data_file,
-                mobile_device=mobile_device,
-                connected_environments=connected_environments,
-                email_manager=email_manager,
-            )
-            if validation_error:
-                return validation_error
-
-        env = await testzeus_client.environments.update_environment(
-            environment_id,
-            name=name,
-            device_type=device_type,
-            env_data=data_content,
-            tags=tags,
+    )
+    if device_fields_touched or device_type is not None:
+        effective_device_type = device_type
+        if effective_device_type is None:
+            existing = await testzeus_client.environments.get_one(environment_id)
+            effective_device_type = existing.device_type or "browser"
+        validation_error = _validate_environment_device_fields(
+            effective_device_type,
             supporting_data_files=supporting_data_files,
             mobile_supporting_data_file=mobile_supporting_data_file,
             mobile_device=mobile_device,
             connected_environments=connected_environments,
             email_manager=email_manager,
-            source_code_integrations=source_code_integrations,
-            agent_grounding_prompt=agent_grounding_prompt,
         )
+        if validation_error:
+            return validation_error
+
+    env = await testzeus_client.environments.update_environment(
+        environment_id,
+        name=name,
+        device_type=device_type,
+        env_data=data_content,
+        tags=tags,
+        supporting_data_files=supporting_data_files,
+        mobile_supporting_data_file=mobile_supporting_data_file,
+        mobile_device=mobile_device,
+        connected_environments=connected_environments,
+        email_manager=email_manager,
+        source_code_integrations=source_code_integrations,
+        agent_grounding_prompt=agent_grounding_prompt,
+    )
+    _invalidate_cached("environment", "environment_resource", "environments")
 
-        updated = _serialize_environment(env, detail=True)
-
-        if ctx:
-            await ctx.info(f"Updated environment: {env.name}")
+    updated = _serialize_environment(env, detail=True)
 
-        return f"Successfully updated environment:\n{json.dumps(updated, indent=2)}"
+    if ctx:
+        await ctx.info(f"Updated environment: {env.name}")
 
-    except Exception as e:
-        error_msg = f"Error updating environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully updated environment:\n{_dumps(updated)}"
 
 
 @mcp.tool()
+@tz_tool("deleting environment")
 async def delete_environment(environment_id: str, ctx: Context = None) -> str:
     """Delete an environment by its 15-character ID or exact name.
 
     The response identifies exactly which environment was deleted (name and ID).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        # Resolve first so the response can state exactly what was deleted,
-        # especially when a name (not an ID) was provided.
-        env = await testzeus_client.environments.get_one(environment_id)
-        await testzeus_client.environments.delete(env.id)
-
-        matched_note = ""
-        if env.id != environment_id:
-            matched_note = f" (matched by name from '{environment_id}')"
+    # Resolve first so the response can state exactly what was deleted,
+    # especially when a name (not an ID) was provided.
+    env = await testzeus_client.environments.get_one(environment_id)
+    await testzeus_client.environments.delete(env.id)
+    _invalidate_cached("environment", "environment_resource", "environments")
 
-        if ctx:
-            await ctx.info(f"Deleted environment: {env.name} ({env.id})")
+    matched_note = ""
+    if env.id != environment_id:
+        matched_note = f" (matched by name from '{environment_id}')"
 
-        return f"Successfully deleted environment '{env.name}' with ID: {env.id}{matched_note}"
+    if ctx:
+        await ctx.info(f"Deleted environment: {env.name} ({env.id})")
 
-    except Exception as e:
-        error_msg = f"Error deleting environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully deleted environment '{env.name}' with ID: {env.id}{matched_note}"
 
 
 @mcp.tool()
+@tz_tool("removing all environment files")
 async def remove_all_environment_files(environment_id: str, ctx: Context = None) -> str:
     """Remove all environment files."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.environments.remove_all_files(environment_id)
-        if ctx:
-            await ctx.info(f"Removed all environment files with ID: {environment_id}")
-        return f"Successfully removed all environment files with ID: {environment_id}"
-    except Exception as e:
-        error_msg = f"Error removing all environment files: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.environments.remove_all_files(environment_id)
+    _invalidate_cached("environment", "environment_resource", "environments")
+    if ctx:
+        await ctx.info(f"Removed all environment files with ID: {environment_id}")
+    return f"Successfully removed all environment files with ID: {environment_id}"
 
 
 @mcp.tool()
+@tz_tool("adding environment file")
 async def add_environment_file(environment_id: str, file_path: str, ctx: Context = None) -> str:
     """Add a environment file."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.environments.add_file(environment_id, file_path)
-        if ctx:
-            await ctx.info(f"Added file to environment: {environment_id}")
-        return f"Successfully added file to environment with ID: {environment_id}"
-    except Exception as e:
-        error_msg = f"Error adding environment file: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    environment = await testzeus_client.environments.get_one(environment_id)
+    if environment.is_mobile():
+        raise ValueError(
+            f"Cannot add supporting_data_files to a {environment.device_type} environment"
+        )
+    await _upload(testzeus_client.environments, environment.id, "supporting_data_files", file_path)
+    _invalidate_cached("environment", "environment_resource", "environments")
+    if ctx:
+        await ctx.info(f"Added file to environment: {environment_id}")
+    return f"Successfully added file to environment with ID: {environment_id}"
 
 
 @mcp.tool()
+@tz_tool("removing environment file")
 async def remove_environment_file(environment_id: str, file_path: str, ctx: Context = None) -> str:
     """Remove a environment file.
 
     file_path may be the stored file name, the original upload name, or a
     local path to the originally uploaded file.
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.environments.remove_file(environment_id, file_path)
-        if ctx:
-            await ctx.info(f"Removed file from environment: {environment_id}")
-        return f"Successfully removed file from environment with ID: {environment_id}"
-    except Exception as e:
-        error_msg = f"Error removing environment file: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.environments.remove_file(environment_id, file_path)
+    _invalidate_cached("environment", "environment_resource", "environments")
+    if ctx:
+        await ctx.info(f"Removed file from environment: {environment_id}")
+    return f"Successfully removed file from environment with ID: {environment_id}"
 
 
 # Device Pool tools (read-only)
 @mcp.tool()
+@tz_tool("listing device pool")
 async def list_device_pool(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
@@ -1390,57 +2185,13 @@ async def list_device_pool(
     cloud_provider (browserstack/saucelabs/local),
     device_type (real/virtual), and is_active (true/false).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.device_pool.get_list(**params)
-        devices = result.get("items", [])
-
-        device_list = []
-        for device in devices:
-            device_list.append(
-                {
-                    "id": device.id,
-                    "device_name": device.device_name,
-                    "platform": device.platform,
-                    "platform_version": device.platform_version,
-                    "cloud_provider": device.cloud_provider,
-                    "device_type": device.device_type,
-                    "is_active": device.is_active,
-                    "concurrency_limit": device.concurrency_limit,
-                    "active_sessions": device.active_sessions,
-                    "automation_name": device.automation_name,
-                    "device_tier": device.device_tier,
-                }
-            )
-
-        if ctx:
-            await ctx.info(f"Found {len(device_list)} devices")
-
-        return f"Found {len(device_list)} devices:\n{json.dumps(device_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing device pool: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def get_device_pool_entry(device_id: str, ctx: Context = None) -> str:
-    """Get a specific device from the pool by ID."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.device_pool.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    devices = result.get("items", [])
 
-    try:
-        device = await testzeus_client.device_pool.get_one(device_id)
-        device_data = {
+    device_list = [
+        {
             "id": device.id,
             "device_name": device.device_name,
             "platform": device.platform,
@@ -1452,19 +2203,41 @@ async def get_device_pool_entry(device_id: str, ctx: Context = None) -> str:
             "active_sessions": device.active_sessions,
             "automation_name": device.automation_name,
             "device_tier": device.device_tier,
-            "created": str(device.created),
-            "updated": str(device.updated),
         }
+        for device in devices
+    ]
 
-        if ctx:
-            await ctx.info(f"Retrieved device: {device.device_name}")
+    if ctx:
+        await ctx.info(f"Found {len(device_list)} devices")
 
-        return f"Device details:\n{json.dumps(device_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting device: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Found {len(device_list)} devices:\n{_dumps(device_list)}"
+
+
+@mcp.tool()
+@tz_tool("getting device")
+async def get_device_pool_entry(device_id: str, ctx: Context = None) -> str:
+    """Get a specific device from the pool by ID."""
+    device = await testzeus_client.device_pool.get_one(device_id)
+    device_data = {
+        "id": device.id,
+        "device_name": device.device_name,
+        "platform": device.platform,
+        "platform_version": device.platform_version,
+        "cloud_provider": device.cloud_provider,
+        "device_type": device.device_type,
+        "is_active": device.is_active,
+        "concurrency_limit": device.concurrency_limit,
+        "active_sessions": device.active_sessions,
+        "automation_name": device.automation_name,
+        "device_tier": device.device_tier,
+        "created": device.created,
+        "updated": device.updated,
+    }
+
+    if ctx:
+        await ctx.info(f"Retrieved device: {device.device_name}")
+
+    return f"Device details:\n{_dumps(device_data)}"
 
 
 def _format_files(files_info: Any, stored: Any) -> list:
@@ -1525,50 +2298,66 @@ def _validate_environment_device_fields(
     return None
 
 
+# Environment models define every field below, so no getattr defaults are needed
+_environment_browser_detail_row = _compile_attr_row(
+    Environment, ("connected_environments", "email_manager")
+)
+_environment_detail_row = _compile_attr_row(
+    Environment, ("source_code_integrations", "agent_grounding_prompt", "tenant", "modified_by")
+)
+
+
 def _serialize_environment(env: Any, *, detail: bool = False) -> dict[str, Any]:
     """Serialize an environment, omitting fields that do not apply to device_type."""
-    device_type = getattr(env, "device_type", None) or "browser"
+    device_type = env.device_type or "browser"
     is_mobile = _is_mobile_device_type(device_type)
 
     data: dict[str, Any] = {
         "id": env.id,
         "name": env.name,
         "device_type": device_type,
-        "data": _mask_secret_values(env.data_content),
+        "data": (
+            _mask_secret_values(env.data_content)
+            if detail
+            else _data_handle(env.data_content, f"environment://{env.id}")
+        ),
         "tags": env.tags,
-        "created": str(env.created),
-        "updated": str(env.updated),
+        "created": env.created,
+        "updated": env.updated,
     }
 
     if is_mobile:
         data["mobile_supporting_data_file"] = _format_files(
-            getattr(env, "mobile_supporting_data_file_info", None),
-            getattr(env, "mobile_supporting_data_file", None),
+            env.mobile_supporting_data_file_info, env.mobile_supporting_data_file
         )
-        data["mobile_device"] = getattr(env, "mobile_device", None)
+        data["mobile_device"] = env.mobile_device
     else:
         data["supporting_data_files"] = _format_supporting_files(env)
         if detail:
-            data["connected_environments"] = getattr(env, "connected_environments", None)
+            data.update(_environment_browser_detail_row(env))
             data["browser_auth_file"] = _format_files(
-                getattr(env, "browser_auth_file_info", None),
-                getattr(env, "browser_auth_file", None),
+                env.browser_auth_file_info, env.browser_auth_file
             )
-            data["email_manager"] = getattr(env, "email_manager", None)
 
     if detail:
-        data["source_code_integrations"] = getattr(env, "source_code_integrations", None)
-        data["agent_grounding_prompt"] = getattr(env, "agent_grounding_prompt", None)
-        data["tenant"] = getattr(env, "tenant", None)
-        data["modified_by"] = getattr(env, "modified_by", None)
+        data.update(_environment_detail_row(env))
 
     return data
 
 
+def _data_handle(content: Any, resource: str) -> Any:
+    """Return masked data content, or a short summary and resource URI when it is large."""
+    content = _mask_secret_values(content)
+    text = _dumps_compact(content)
+    if len(text) <= _INLINE_DATA_LIMIT:
+        return content
+    return {"summary": text[:_DATA_SUMMARY_CHARS], "resource": resource}
+
+
 def _mask_secret_values(content: Any) -> Any:
     """Mask the values of secret-typed items in test data content before display."""
     if isinstance(content, dict) and isinstance(content.get("items"), list):
-        masked_items = []
+        masked_items: list[Any] = []
         for item in content["items"]:
             if isinstance(item, dict) and item.get("type") == "secret":
                 item = {**item, "value": "********"}
@@ -1577,43 +2366,45 @@ def _mask_secret_values(content: Any) -> Any:
     return content
 
 
+def _test_data_detail_row(test_data: TestData) -> dict[str, Any]:
+    """A ``get_test_data`` record, with secret values masked."""
+    return {
+        "id": test_data.id,
+        "name": test_data.name,
+        "tags": test_data.tags,
+        "created": test_data.created,
+        "updated": test_data.updated,
+        "tenant": test_data.tenant,
+        "modified_by": test_data.modified_by,
+        "data_content": _mask_secret_values(test_data.data_content),
+        "metadata": test_data.metadata,
+        "agent_grounding_prompt": test_data.agent_grounding_prompt,
+        "supporting_data_files": _format_supporting_files(test_data),
+    }
+
+
 @mcp.tool()
+@tz_tool("getting test data")
 async def get_test_data(test_data_id: str, ctx: Context = None) -> str:
     """Get a specific test data record by its 15-character ID or exact name.
 
     Secret-typed values in the data content are masked in the output.
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
-        test = await testzeus_client.test_data.get_one(test_data_id)
-        test_data = {
-            "id": test.id,
-            "name": test.name,
-            "tags": test.tags,
-            "created": str(test.created),
-            "updated": str(test.updated),
-            "tenant": test.tenant,
-            "modified_by": test.modified_by,
-            "data_content": _mask_secret_values(test.data_content),
-            "metadata": test.metadata,
-            "agent_grounding_prompt": test.agent_grounding_prompt,
-            "supporting_data_files": _format_supporting_files(test),
-        }
+    async def fetch() -> tuple[str, bool]:
+        test_data = await testzeus_client.test_data.get_one(test_data_id)
+        return f"Test data details:\n{_dumps(_test_data_detail_row(test_data))}", True
 
-        if ctx:
-            await ctx.info(f"Retrieved test data: {test.name}")
+    result = await _cached_payload(("test_data", test_data_id), fetch)
 
-        return f"Test data details:\n{json.dumps(test_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Retrieved test data: {test_data_id}")
+
+    return result
 
 
 @mcp.tool()
+@tz_tool("creating test data")
 async def create_test_data(
     name: str,
     content: dict[str, Any] | str | None = None,
@@ -1630,75 +2421,57 @@ async def create_test_data(
     agent_grounding_prompt is a JSON object with 'test_creation' and/or
     'test_execution' string keys; missing keys default to "".
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        test_data = await testzeus_client.test_data.create_test_data(
-            name=name,
-            content=content,
-            tags=tags,
-            type="test",
-            supporting_data_files=supporting_data_files,
-            agent_grounding_prompt=agent_grounding_prompt,
-        )
-
-        created = {
-            "id": test_data.id,
-            "name": test_data.name,
-            "tags": test_data.tags,
-            "data_content": _mask_secret_values(test_data.data_content),
-            "agent_grounding_prompt": test_data.agent_grounding_prompt,
-            "created": str(test_data.created),
-        }
+    test_data = await testzeus_client.test_data.create_test_data(
+        name=name,
+        content=content,
+        tags=tags,
+        type="test",
+        supporting_data_files=supporting_data_files,
+        agent_grounding_prompt=agent_grounding_prompt,
+    )
 
-        if ctx:
-            await ctx.info(f"Created test data: {name}")
+    created = {
+        "id": test_data.id,
+        "name": test_data.name,
+        "tags": test_data.tags,
+        "data_content": _mask_secret_values(test_data.data_content),
+        "agent_grounding_prompt": test_data.agent_grounding_prompt,
+        "created": test_data.created,
+    }
 
-        return f"Successfully created test data:\n{json.dumps(created, indent=2)}"
+    if ctx:
+        await ctx.info(f"Created test data: {name}")
 
-    except Exception as e:
-        error_msg = f"Error creating test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created test data:\n{_dumps(created)}"
 
 
 @mcp.tool()
+@tz_tool("deleting test data")
 async def delete_test_data(test_data_id: str, ctx: Context = None) -> str:
     """Delete a test data record by its 15-character ID or exact name.
 
     The response identifies exactly which record was deleted (name and ID).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        # Resolve first so the response can state exactly what was deleted,
-        # especially when a name (not an ID) was provided.
-        test_data = await testzeus_client.test_data.get_one(test_data_id)
-        await testzeus_client.test_data.delete(test_data.id)
-
-        matched_note = ""
-        if test_data.id != test_data_id:
-            matched_note = f" (matched by name from '{test_data_id}')"
+    # Resolve first so the response can state exactly what was deleted,
+    # especially when a name (not an ID) was provided.
+    test_data = await testzeus_client.test_data.get_one(test_data_id)
+    await testzeus_client.test_data.delete(test_data.id)
+    _invalidate_cached("test_data", "test_data_resource")
 
-        if ctx:
-            await ctx.info(f"Deleted test data: {test_data.name} ({test_data.id})")
+    matched_note = ""
+    if test_data.id != test_data_id:
+        matched_note = f" (matched by name from '{test_data_id}')"
 
-        return (
-            f"Successfully deleted test data '{test_data.name}' "
-            f"with ID: {test_data.id}{matched_note}"
-        )
+    if ctx:
+        await ctx.info(f"Deleted test data: {test_data.name} ({test_data.id})")
 
-    except Exception as e:
-        error_msg = f"Error deleting test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return (
+        f"Successfully deleted test data '{test_data.name}' with ID: {test_data.id}{matched_note}"
+    )
 
 
 @mcp.tool()
+@tz_tool("updating test data")
 async def update_test_data(
     test_data_id: str,
     name: str | None = None,
@@ -1717,9 +2490,6 @@ async def update_test_data(
     agent_grounding_prompt is a JSON object with 'test_creation' and/or
     'test_execution' string keys; keys not provided keep their current value.
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     update_args = (name, content, tags, supporting_data_files, agent_grounding_prompt)
     if all(arg is None for arg in update_args):
         return (
@@ -1727,48 +2497,45 @@ async def update_test_data(
             "(name, content, tags, supporting_data_files, or agent_grounding_prompt)"
         )
 
-    try:
-        test_data = await testzeus_client.test_data.update_test_data(
-            test_data_id,
-            name=name,
-            content=content,
-            tags=tags,
-            supporting_data_files=supporting_data_files,
-            agent_grounding_prompt=agent_grounding_prompt,
-        )
-
-        updated = {
-            "id": test_data.id,
-            "name": test_data.name,
-            "tags": test_data.tags,
-            "data_content": _mask_secret_values(test_data.data_content),
-            "agent_grounding_prompt": test_data.agent_grounding_prompt,
-            "updated": str(test_data.updated),
-        }
-
-        if ctx:
-            await ctx.info(f"Updated test data: {test_data.name}")
+    test_data = await testzeus_client.test_data.update_test_data(
+        test_data_id,
+        name=name,
+        content=content,
+        tags=tags,
+        supporting_data_files=supporting_data_files,
+        agent_grounding_prompt=agent_grounding_prompt,
+    )
+    _invalidate_cached("test_data", "test_data_resource")
+
+    updated = {
+        "id": test_data.id,
+        "name": test_data.name,
+        "tags": test_data.tags,
+        "data_content": _mask_secret_values(test_data.data_content),
+        "agent_grounding_prompt": test_data.agent_grounding_prompt,
+        "updated": test_data.updated,
+    }
 
-        return f"Successfully updated test data:\n{json.dumps(updated, indent=2)}"
+    if ctx:
+        await ctx.info(f"Updated test data: {test_data.name}")
 
-    except Exception as e:
-        error_msg = f"Error updating test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully updated test data:\n{_dumps(updated)}"
 
 
 @mcp.tool()
+@tz_tool("listing test data")
 async def list_test_data(
     page: int = 1,
-    per_page: int = 10,
+    per_page: PerPage = 10,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
+    max_pages: MaxPages = 1,
 ) -> str:
     """List test data with pagination, sorting, and filtering.
 
-    Secret-typed values in data content are masked in the output.
+    Secret-typed values in data content are masked in the output. Large data content
+    is shortened to a summary; use get_test_data for the full record.
 
     Args:
         page: 1-based page number.
@@ -1778,104 +2545,96 @@ async def list_test_data(
             Operators: =, !=, >, >=, <, <=, ~ (contains), !~ (not contains).
             A list ORs values. Group with {"$and": [...]} / {"$or": [...]}.
         sort: Field name to sort by; prefix with '-' for descending (e.g. "-created").
+        max_pages: Fetch this many consecutive pages starting at page (max 20).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.test_data.get_list(**params)
-        test_data_full_list = result.get("items", [])
-
-        test_data_list = []
-        for test_data in test_data_full_list:
-            test_data_list.append(
-                {
-                    "id": test_data.id,
-                    "name": test_data.name,
-                    "tags": test_data.tags,
-                    "data_content": _mask_secret_values(test_data.data_content),
-                    "supporting_data_files": _format_supporting_files(test_data),
-                    "created": str(test_data.created),
-                    "updated": str(test_data.updated),
-                    "tenant": test_data.tenant,
-                    "modified_by": test_data.modified_by,
-                }
-            )
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "filters": filters,
+        "sort": sort,
+        "fields": _TEST_DATA_LIST_FIELDS,
+    }
+    result = await _get_pages("test_data", params, max_pages)
+    test_data_full_list = result.get("items", [])
 
-        if ctx:
-            await ctx.info(f"Found {len(test_data_list)} test data")
+    test_data_list = [
+        {
+            "id": test_data.id,
+            "name": test_data.name,
+            "tags": test_data.tags,
+            "data_content": _data_handle(test_data.data_content, f"test-data://{test_data.id}"),
+            "supporting_data_files": _format_supporting_files(test_data),
+            "created": test_data.created,
+            "updated": test_data.updated,
+            "tenant": test_data.tenant,
+            "modified_by": test_data.modified_by,
+        }
+        for test_data in test_data_full_list
+    ]
 
-        return f"Found {len(test_data_list)} test data:\n{json.dumps(test_data_list, indent=2)}"
+    if ctx:
+        await ctx.info(f"Found {len(test_data_list)} test data")
 
-    except Exception as e:
-        error_msg = f"Error listing test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Found {len(test_data_list)} test data:\n{_dumps(test_data_list)}"
 
 
 @mcp.tool()
+@tz_tool("removing all test data files")
 async def remove_all_test_data_files(test_data_id: str, ctx: Context = None) -> str:
     """Remove all test data files."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.test_data.remove_all_files(test_data_id)
-        if ctx:
-            await ctx.info(f"Removed all test data files for test data: {test_data_id}")
-        return f"Successfully removed all test data files for test data with ID: {test_data_id}"
-    except Exception as e:
-        error_msg = f"Error removing all test data files: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.test_data.remove_all_files(test_data_id)
+    _invalidate_cached("test_data", "test_data_resource")
+    if ctx:
+        await ctx.info(f"Removed all test data files for test data: {test_data_id}")
+    return f"Successfully removed all test data files for test data with ID: {test_data_id}"
 
 
 @mcp.tool()
+@tz_tool("adding file to test data")
 async def add_test_data_file(test_data_id: str, file_path: str, ctx: Context = None) -> str:
     """Add a test data file."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    await _upload(testzeus_client.test_data, test_data_id, "supporting_data_files", file_path)
+    _invalidate_cached("test_data", "test_data_resource")
+    if ctx:
+        await ctx.info(f"Added file to test data: {test_data_id}")
+    return f"Successfully added file to test data with ID: {test_data_id}"
 
-    try:
-        await testzeus_client.test_data.add_file(test_data_id, file_path)
-        if ctx:
-            await ctx.info(f"Added file to test data: {test_data_id}")
-        return f"Successfully added file to test data with ID: {test_data_id}"
-    except Exception as e:
-        error_msg = f"Error adding file to test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+
+@mcp.tool()
+@tz_tool("adding files to test data")
+async def add_test_data_files(test_data_id: str, file_paths: list[str], ctx: Context = None) -> str:
+    """Add several test data files in one call.
+
+    Each entry reports whether that file was added or the error it hit.
+    """
+
+    async def add(file_path: str) -> bool:
+        await _upload(testzeus_client.test_data, test_data_id, "supporting_data_files", file_path)
+        return True
+
+    outcomes = await _for_each(file_paths, add)
+    _invalidate_cached("test_data", "test_data_resource")
+    summary = f"Added {_count_ok(outcomes)} of {len(outcomes)} files to test data"
+
+    if ctx:
+        await ctx.info(f"{summary}: {test_data_id}")
+
+    return f"{summary} with ID {test_data_id}:\n{_dumps(outcomes)}"
 
 
 @mcp.tool()
+@tz_tool("removing file from test data")
 async def remove_test_data_file(test_data_id: str, file_path: str, ctx: Context = None) -> str:
     """Remove a test data file.
 
     file_path may be the stored file name, the original upload name, or a
     local path to the originally uploaded file.
-    """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.test_data.remove_file(test_data_id, file_path)
-        if ctx:
-            await ctx.info(f"Removed file from test data: {test_data_id}")
-        return f"Successfully removed file from test data with ID: {test_data_id}"
-    except Exception as e:
-        error_msg = f"Error removing file from test data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    """
+    await testzeus_client.test_data.remove_file(test_data_id, file_path)
+    _invalidate_cached("test_data", "test_data_resource")
+    if ctx:
+        await ctx.info(f"Removed file from test data: {test_data_id}")
+    return f"Successfully removed file from test data with ID: {test_data_id}"
 
 
 # ============================================================================
@@ -1884,225 +2643,149 @@ async def remove_test_data_file(test_data_id: str, file_path: str, ctx: Context
 
 
 @mcp.tool()
+@tz_tool("listing hypermind code blocks")
 async def list_hypermind_code_blocks(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all hypermind code blocks in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.hypermind_code_blocks.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    code_blocks = result.get("items", [])
 
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.hypermind_code_blocks.get_list(**params)
-        code_blocks = result.get("items", [])
-
-        code_block_list = []
-        for block in code_blocks:
-            code_block_list.append(
-                {
-                    "id": block.id,
-                    "name": block.name,
-                    "status": block.status,
-                    "tags": block.tags,
-                    "code_files": block.code_files,
-                    "created": str(block.created),
-                    "updated": str(block.updated),
-                }
-            )
+    code_block_list = [
+        {
+            "id": block.id,
+            "name": block.name,
+            "status": block.status,
+            "tags": block.tags,
+            "code_files": block.code_files,
+            "created": block.created,
+            "updated": block.updated,
+        }
+        for block in code_blocks
+    ]
 
-        if ctx:
-            await ctx.info(f"Found {len(code_block_list)} hypermind code blocks")
+    if ctx:
+        await ctx.info(f"Found {len(code_block_list)} hypermind code blocks")
 
-        result = json.dumps(code_block_list, indent=2)
-        return f"Found {len(code_block_list)} hypermind code blocks:\n{result}"
-    except Exception as e:
-        error_msg = f"Error listing hypermind code blocks: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = _dumps(code_block_list)
+    return f"Found {len(code_block_list)} hypermind code blocks:\n{result}"
 
 
 @mcp.tool()
+@tz_tool("getting hypermind code block")
 async def get_hypermind_code_block(code_block_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific hypermind code block by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        block = await testzeus_client.hypermind_code_blocks.get_one(code_block_id_or_name)
-        block_data = {
-            "id": block.id,
-            "name": block.name,
-            "status": block.status,
-            "tags": block.tags,
-            "code_files": block.code_files,
-            "created": str(block.created),
-            "updated": str(block.updated),
-            "tenant": block.tenant,
-            "modified_by": block.modified_by,
-        }
+    block = await testzeus_client.hypermind_code_blocks.get_one(code_block_id_or_name)
+    block_data = {
+        "id": block.id,
+        "name": block.name,
+        "status": block.status,
+        "tags": block.tags,
+        "code_files": block.code_files,
+        "created": block.created,
+        "updated": block.updated,
+        "tenant": block.tenant,
+        "modified_by": block.modified_by,
+    }
 
-        if ctx:
-            await ctx.info(f"Retrieved hypermind code block: {block.name}")
+    if ctx:
+        await ctx.info(f"Retrieved hypermind code block: {block.name}")
 
-        return f"Hypermind code block details:\n{json.dumps(block_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Hypermind code block details:\n{_dumps(block_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating hypermind code block")
 async def create_hypermind_code_block(
     name: str,
-    status: Literal["draft", "ready", "deleted"] = "draft",
+    status: EntityStatus = "draft",
     tags: list[str] | None = None,
     ctx: Context = None,
 ) -> str:
     """Create a new hypermind code block."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        block = await testzeus_client.hypermind_code_blocks.create_hypermind_code_block(
-            name=name,
-            status=status,
-            tags=tags,
-        )
+    block = await testzeus_client.hypermind_code_blocks.create_hypermind_code_block(
+        name=name,
+        status=status,
+        tags=tags,
+    )
 
-        if ctx:
-            await ctx.info(f"Created hypermind code block: {name}")
+    if ctx:
+        await ctx.info(f"Created hypermind code block: {name}")
 
-        return f"Successfully created hypermind code block '{name}' with ID: {block.id}"
-    except Exception as e:
-        error_msg = f"Error creating hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created hypermind code block '{name}' with ID: {block.id}"
 
 
 @mcp.tool()
+@tz_tool("updating hypermind code block")
 async def update_hypermind_code_block(
     code_block_id: str,
     name: str | None = None,
-    status: Literal["draft", "ready", "deleted"] | None = None,
+    status: EntityStatus | None = None,
     tags: list[str] | None = None,
     ctx: Context = None,
 ) -> str:
     """Update a hypermind code block."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    data = _provided(name=name, status=status, tags=tags)
 
-    try:
-        data = {}
-        if name:
-            data["name"] = name
-        if status:
-            data["status"] = status
-        if tags:
-            data["tags"] = tags
-
-        await testzeus_client.hypermind_code_blocks.update_hypermind_code_block(
-            code_block_id, **data
-        )
+    await testzeus_client.hypermind_code_blocks.update_hypermind_code_block(code_block_id, **data)
 
-        if ctx:
-            await ctx.info(f"Updated hypermind code block: {code_block_id}")
+    if ctx:
+        await ctx.info(f"Updated hypermind code block: {code_block_id}")
 
-        return f"Successfully updated hypermind code block with ID: {code_block_id}"
-    except Exception as e:
-        error_msg = f"Error updating hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully updated hypermind code block with ID: {code_block_id}"
 
 
 @mcp.tool()
+@tz_tool("deleting hypermind code block")
 async def delete_hypermind_code_block(code_block_id: str, ctx: Context = None) -> str:
     """Delete a hypermind code block."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.hypermind_code_blocks.delete(code_block_id)
+    await testzeus_client.hypermind_code_blocks.delete(code_block_id)
 
-        if ctx:
-            await ctx.info(f"Deleted hypermind code block: {code_block_id}")
+    if ctx:
+        await ctx.info(f"Deleted hypermind code block: {code_block_id}")
 
-        return f"Successfully deleted hypermind code block with ID: {code_block_id}"
-    except Exception as e:
-        error_msg = f"Error deleting hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully deleted hypermind code block with ID: {code_block_id}"
 
 
 @mcp.tool()
+@tz_tool("adding file to hypermind code block")
 async def add_hypermind_code_block_file(
     code_block_id: str, file_path: str, ctx: Context = None
 ) -> str:
     """Add a code file to a hypermind code block."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.hypermind_code_blocks.add_file(code_block_id, file_path)
-        if ctx:
-            await ctx.info(f"Added file to hypermind code block: {code_block_id}")
-        return f"Successfully added file to hypermind code block with ID: {code_block_id}"
-    except Exception as e:
-        error_msg = f"Error adding file to hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    manager = testzeus_client.hypermind_code_blocks
+    await _upload(manager, code_block_id, "code_files", file_path)
+    if ctx:
+        await ctx.info(f"Added file to hypermind code block: {code_block_id}")
+    return f"Successfully added file to hypermind code block with ID: {code_block_id}"
 
 
 @mcp.tool()
+@tz_tool("removing file from hypermind code block")
 async def remove_hypermind_code_block_file(
     code_block_id: str, file_path: str, ctx: Context = None
 ) -> str:
     """Remove a code file from a hypermind code block."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.hypermind_code_blocks.remove_file(code_block_id, file_path)
-        if ctx:
-            await ctx.info(f"Removed file from hypermind code block: {code_block_id}")
-        return f"Successfully removed file from hypermind code block with ID: {code_block_id}"
-    except Exception as e:
-        error_msg = f"Error removing file from hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.hypermind_code_blocks.remove_file(code_block_id, file_path)
+    if ctx:
+        await ctx.info(f"Removed file from hypermind code block: {code_block_id}")
+    return f"Successfully removed file from hypermind code block with ID: {code_block_id}"
 
 
 @mcp.tool()
+@tz_tool("removing all files from hypermind code block")
 async def remove_all_hypermind_code_block_files(code_block_id: str, ctx: Context = None) -> str:
     """Remove all code files from a hypermind code block."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.hypermind_code_blocks.remove_all_files(code_block_id)
-        if ctx:
-            await ctx.info(f"Removed all files from hypermind code block: {code_block_id}")
-        return f"Successfully removed all files from hypermind code block with ID: {code_block_id}"
-    except Exception as e:
-        error_msg = f"Error removing all files from hypermind code block: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.hypermind_code_blocks.remove_all_files(code_block_id)
+    if ctx:
+        await ctx.info(f"Removed all files from hypermind code block: {code_block_id}")
+    return f"Successfully removed all files from hypermind code block with ID: {code_block_id}"
 
 
 # ============================================================================
@@ -2111,85 +2794,64 @@ async def remove_all_hypermind_code_block_files(code_block_id: str, ctx: Context
 
 
 @mcp.tool()
+@tz_tool("listing user integrations")
 async def list_user_integrations(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all user integrations in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.user_integrations.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    integrations = result.get("items", [])
 
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.user_integrations.get_list(**params)
-        integrations = result.get("items", [])
-
-        integration_list = []
-        for integration in integrations:
-            integration_list.append(
-                {
-                    "id": integration.id,
-                    "name": integration.name,
-                    "integration_type": getattr(integration, "integration_type", None),
-                    "connection_status": getattr(integration, "connection_status", None),
-                    "project_id": getattr(integration, "project_id", None),
-                    "created": str(integration.created),
-                    "updated": str(integration.updated),
-                }
-            )
+    integration_list = [
+        {
+            "id": integration.id,
+            "name": integration.name,
+            "integration_type": getattr(integration, "integration_type", None),
+            "connection_status": getattr(integration, "connection_status", None),
+            "project_id": getattr(integration, "project_id", None),
+            "created": integration.created,
+            "updated": integration.updated,
+        }
+        for integration in integrations
+    ]
 
-        if ctx:
-            await ctx.info(f"Found {len(integration_list)} user integrations")
+    if ctx:
+        await ctx.info(f"Found {len(integration_list)} user integrations")
 
-        result = json.dumps(integration_list, indent=2)
-        return f"Found {len(integration_list)} user integrations:\n{result}"
-    except Exception as e:
-        error_msg = f"Error listing user integrations: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = _dumps(integration_list)
+    return f"Found {len(integration_list)} user integrations:\n{result}"
 
 
 @mcp.tool()
+@tz_tool("getting user integration")
 async def get_user_integration(integration_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific user integration by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        integration = await testzeus_client.user_integrations.get_one(integration_id_or_name)
-        integration_data = {
-            "id": integration.id,
-            "name": integration.name,
-            "integration_type": getattr(integration, "integration_type", None),
-            "connection_status": getattr(integration, "connection_status", None),
-            "project_id": getattr(integration, "project_id", None),
-            "auth_config_id": getattr(integration, "auth_config_id", None),
-            "connected_account_id": getattr(integration, "connected_account_id", None),
-            "scopes": getattr(integration, "scopes", None),
-            "created": str(integration.created),
-            "updated": str(integration.updated),
-            "tenant_id": getattr(integration, "tenant_id", None),
-            "user_id": getattr(integration, "user_id", None),
-        }
+    integration = await testzeus_client.user_integrations.get_one(integration_id_or_name)
+    integration_data = {
+        "id": integration.id,
+        "name": integration.name,
+        "integration_type": getattr(integration, "integration_type", None),
+        "connection_status": getattr(integration, "connection_status", None),
+        "project_id": getattr(integration, "project_id", None),
+        "auth_config_id": getattr(integration, "auth_config_id", None),
+        "connected_account_id": getattr(integration, "connected_account_id", None),
+        "scopes": getattr(integration, "scopes", None),
+        "created": integration.created,
+        "updated": integration.updated,
+        "tenant_id": getattr(integration, "tenant_id", None),
+        "user_id": getattr(integration, "user_id", None),
+    }
 
-        if ctx:
-            await ctx.info(f"Retrieved user integration: {integration.name}")
+    if ctx:
+        await ctx.info(f"Retrieved user integration: {integration.name}")
 
-        return f"User integration details:\n{json.dumps(integration_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting user integration: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"User integration details:\n{_dumps(integration_data)}"
 
 
 # ============================================================================
@@ -2198,81 +2860,61 @@ async def get_user_integration(integration_id_or_name: str, ctx: Context = None)
 
 
 @mcp.tool()
+@tz_tool("listing connected environments")
 async def list_connected_environments(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all connected environments in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.connected_environments.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    connected_envs = result.get("items", [])
 
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.connected_environments.get_list(**params)
-        connected_envs = result.get("items", [])
-
-        connected_env_list = []
-        for env in connected_envs:
-            connected_env_list.append(
-                {
-                    "id": env.id,
-                    "name": env.name,
-                    "connection": getattr(env, "connection", None),
-                    "created": str(env.created),
-                    "updated": str(env.updated),
-                }
-            )
+    connected_env_list = [
+        {
+            "id": env.id,
+            "name": env.name,
+            "connection": getattr(env, "connection", None),
+            "created": env.created,
+            "updated": env.updated,
+        }
+        for env in connected_envs
+    ]
 
-        if ctx:
-            await ctx.info(f"Found {len(connected_env_list)} connected environments")
+    if ctx:
+        await ctx.info(f"Found {len(connected_env_list)} connected environments")
 
-        result = json.dumps(connected_env_list, indent=2)
-        return f"Found {len(connected_env_list)} connected environments:\n{result}"
-    except Exception as e:
-        error_msg = f"Error listing connected environments: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = _dumps(connected_env_list)
+    return f"Found {len(connected_env_list)} connected environments:\n{result}"
 
 
 @mcp.tool()
+@tz_tool("getting connected environment")
 async def get_connected_environment(connected_env_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific connected environment by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        env = await testzeus_client.connected_environments.get_one(connected_env_id_or_name)
-        env_data = {
-            "id": env.id,
-            "name": env.name,
-            "connection": getattr(env, "connection", None),
-            "created": str(env.created),
-            "updated": str(env.updated),
-            "tenant": env.tenant,
-            "modified_by": env.modified_by,
-        }
+    env = await testzeus_client.connected_environments.get_one(connected_env_id_or_name)
+    env_data = {
+        "id": env.id,
+        "name": env.name,
+        "connection": getattr(env, "connection", None),
+        "created": env.created,
+        "updated": env.updated,
+        "tenant": env.tenant,
+        "modified_by": env.modified_by,
+    }
 
-        if ctx:
-            await ctx.info(f"Retrieved connected environment: {env.name}")
+    if ctx:
+        await ctx.info(f"Retrieved connected environment: {env.name}")
 
-        return f"Connected environment details:\n{json.dumps(env_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting connected environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Connected environment details:\n{_dumps(env_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating connected environment")
 async def create_connected_environment(
     name: str,
     connection: str | None = None,
@@ -2281,29 +2923,21 @@ async def create_connected_environment(
     ctx: Context = None,
 ) -> str:
     """Create a new connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        env = await testzeus_client.connected_environments.create_connected_environment(
-            name=name,
-            connection=connection,
-            tags=tags,
-            metadata=metadata,
-        )
+    env = await testzeus_client.connected_environments.create_connected_environment(
+        name=name,
+        connection=connection,
+        tags=tags,
+        metadata=metadata,
+    )
 
-        if ctx:
-            await ctx.info(f"Created connected environment: {name}")
+    if ctx:
+        await ctx.info(f"Created connected environment: {name}")
 
-        return f"Successfully created connected environment '{name}' with ID: {env.id}"
-    except Exception as e:
-        error_msg = f"Error creating connected environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created connected environment '{name}' with ID: {env.id}"
 
 
 @mcp.tool()
+@tz_tool("updating connected environment")
 async def update_connected_environment(
     connected_env_id: str,
     name: str | None = None,
@@ -2313,90 +2947,58 @@ async def update_connected_environment(
     ctx: Context = None,
 ) -> str:
     """Update a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    data = _provided(name=name, connection=connection, tags=tags, metadata=metadata)
 
-    try:
-        data = {}
-        if name:
-            data["name"] = name
-        if connection:
-            data["connection"] = connection
-        if tags:
-            data["tags"] = tags
-        if metadata:
-            data["metadata"] = metadata
-
-        await testzeus_client.connected_environments.update_connected_environment(
-            connected_env_id, **data
-        )
+    await testzeus_client.connected_environments.update_connected_environment(
+        connected_env_id, **data
+    )
 
-        if ctx:
-            await ctx.info(f"Updated connected environment: {connected_env_id}")
+    if ctx:
+        await ctx.info(f"Updated connected environment: {connected_env_id}")
 
-        return f"Successfully updated connected environment with ID: {connected_env_id}"
-    except Exception as e:
-        error_msg = f"Error updating connected environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully updated connected environment with ID: {connected_env_id}"
 
 
 @mcp.tool()
+@tz_tool("deleting connected environment")
 async def delete_connected_environment(connected_env_id: str, ctx: Context = None) -> str:
     """Delete a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    await testzeus_client.connected_environments.delete(connected_env_id)
 
-    try:
-        await testzeus_client.connected_environments.delete(connected_env_id)
-
-        if ctx:
-            await ctx.info(f"Deleted connected environment: {connected_env_id}")
+    if ctx:
+        await ctx.info(f"Deleted connected environment: {connected_env_id}")
 
-        return f"Successfully deleted connected environment with ID: {connected_env_id}"
-    except Exception as e:
-        error_msg = f"Error deleting connected environment: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully deleted connected environment with ID: {connected_env_id}"
 
 
 @mcp.tool()
+@tz_tool("creating tag")
 async def create_tags(name: str, value: str | None = None, ctx: Context = None) -> str:
     """Create a single tag. Returns the created tag, including its ID."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        tag = await testzeus_client.tags.create_tag(name=name, value=value)
-
-        tag_data = {
-            "id": tag.id,
-            "name": tag.name,
-            "value": tag.value,
-            "created": str(tag.created),
-        }
+    tag = await testzeus_client.tags.create_tag(name=name, value=value)
 
-        if ctx:
-            await ctx.info(f"Created tag: {name}")
+    tag_data = {
+        "id": tag.id,
+        "name": tag.name,
+        "value": tag.value,
+        "created": tag.created,
+    }
 
-        return f"Successfully created tag:\n{json.dumps(tag_data, indent=2)}"
+    if ctx:
+        await ctx.info(f"Created tag: {name}")
 
-    except Exception as e:
-        error_msg = f"Error creating tag: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created tag:\n{_dumps(tag_data)}"
 
 
 @mcp.tool()
+@tz_tool("listing tags")
 async def list_tags(
     page: int = 1,
-    per_page: int = 10,
+    per_page: PerPage = 10,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
+    max_pages: MaxPages = 1,
 ) -> str:
     """List tags with pagination, sorting, and filtering.
 
@@ -2408,107 +3010,66 @@ async def list_tags(
             Operators: =, !=, >, >=, <, <=, ~ (contains), !~ (not contains).
             A list ORs values: {"name": ["a", "b"]}. Group with {"$and": [...]} / {"$or": [...]}.
         sort: Field name to sort by; prefix with '-' for descending (e.g. "-created").
+        max_pages: Fetch this many consecutive pages starting at page (max 20).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        per_page = min(per_page, 100)
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.tags.get_list(**params)
-        tags = result.get("items", [])
-
-        tag_list = []
-        for tag in tags:
-            tag_list.append(
-                {
-                    "id": tag.id,
-                    "name": tag.name,
-                    "value": tag.value,
-                    "created": str(tag.created),
-                    "updated": str(tag.updated),
-                    "tenant": tag.tenant,
-                    "modified_by": tag.modified_by,
-                }
-            )
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "filters": filters,
+        "sort": sort,
+        "fields": _TAG_LIST_FIELDS,
+    }
+    result = await _get_pages("tags", params, max_pages)
+    tags = result.get("items", [])
 
-        if ctx:
-            await ctx.info(f"Found {len(tag_list)} tags")
+    tag_list = [_TagRow(*_tag_list_values(tag)) for tag in tags]
 
-        return f"Found {len(tag_list)} tags:\n{json.dumps(tag_list, indent=2)}"
+    if ctx:
+        await ctx.info(f"Found {len(tag_list)} tags")
 
-    except Exception as e:
-        error_msg = f"Error listing tags: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Found {len(tag_list)} tags:\n{_dumps(tag_list)}"
 
 
 @mcp.tool()
+@tz_tool("getting tag")
 async def get_tag(tag_id: str, ctx: Context = None) -> str:
     """Get a specific tag by its 15-character ID or exact name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
+    async def fetch() -> tuple[str, bool]:
         tag = await testzeus_client.tags.get_one(tag_id)
+        return f"Tag details:\n{_dumps(_tag_detail_row(tag))}", True
 
-        tag_data = {
-            "id": tag.id,
-            "name": tag.name,
-            "value": tag.value,
-            "tenant": tag.tenant,
-            "modified_by": tag.modified_by,
-            "created": str(tag.created),
-            "updated": str(tag.updated),
-        }
-
-        if ctx:
-            await ctx.info(f"Retrieved tag: {tag.name}")
+    result = await _cached_payload(("tag", tag_id), fetch)
 
-        return f"Tag details:\n{json.dumps(tag_data, indent=2)}"
+    if ctx:
+        await ctx.info(f"Retrieved tag: {tag_id}")
 
-    except Exception as e:
-        error_msg = f"Error getting tag: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return result
 
 
 @mcp.tool()
+@tz_tool("deleting tag")
 async def delete_tag(tag_id: str, ctx: Context = None) -> str:
     """Delete a tag by its 15-character ID or exact name.
 
     The response identifies exactly which tag was deleted (name and ID).
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        # Resolve first so the response can state exactly what was deleted,
-        # especially when a name (not an ID) was provided.
-        tag = await testzeus_client.tags.get_one(tag_id)
-        await testzeus_client.tags.delete(tag.id)
-
-        matched_note = "" if tag.id == tag_id else f" (matched by name from '{tag_id}')"
+    # Resolve first so the response can state exactly what was deleted,
+    # especially when a name (not an ID) was provided.
+    tag = await testzeus_client.tags.get_one(tag_id)
+    await testzeus_client.tags.delete(tag.id)
+    _invalidate_cached("tag", "tag_resource")
 
-        if ctx:
-            await ctx.info(f"Deleted tag: {tag.name} ({tag.id})")
+    matched_note = "" if tag.id == tag_id else f" (matched by name from '{tag_id}')"
 
-        return f"Successfully deleted tag '{tag.name}' with ID: {tag.id}{matched_note}"
+    if ctx:
+        await ctx.info(f"Deleted tag: {tag.name} ({tag.id})")
 
-    except Exception as e:
-        error_msg = f"Error deleting tag: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully deleted tag '{tag.name}' with ID: {tag.id}{matched_note}"
 
 
 @mcp.tool()
+@tz_tool("updating tag")
 async def update_tag(
     tag_id: str, name: str | None = None, value: str | None = None, ctx: Context = None
 ) -> str:
@@ -2516,122 +3077,94 @@ async def update_tag(
 
     At least one of name or value must be provided. Pass value="" to clear the value.
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    if name is None and value is None:
+    data = _provided(name=name, value=value)
+    if not data:
         return "Error updating tag: provide at least one of 'name' or 'value' to update"
 
-    try:
-        tag = await testzeus_client.tags.update_tag(tag_id, name=name, value=value)
-
-        tag_data = {
-            "id": tag.id,
-            "name": tag.name,
-            "value": tag.value,
-            "updated": str(tag.updated),
-        }
+    tag = await testzeus_client.tags.update_tag(tag_id, **data)
+    _invalidate_cached("tag", "tag_resource")
 
-        if ctx:
-            await ctx.info(f"Updated tag: {tag.name}")
+    tag_data = {
+        "id": tag.id,
+        "name": tag.name,
+        "value": tag.value,
+        "updated": tag.updated,
+    }
 
-        return f"Successfully updated tag:\n{json.dumps(tag_data, indent=2)}"
+    if ctx:
+        await ctx.info(f"Updated tag: {tag.name}")
 
-    except Exception as e:
-        error_msg = f"Error updating tag: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully updated tag:\n{_dumps(tag_data)}"
 
 
 # Test Run Group Management Tools
 @mcp.tool()
+@tz_tool("listing test run groups")
 async def list_test_run_groups(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all test run groups in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        per_page = min(per_page, 100)  # Cap at 100
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.test_run_groups.get_list(**params)
-        test_run_groups = result.get("items", [])
-
-        group_list = []
-        for group in test_run_groups:
-            group_list.append(
-                {
-                    "id": group.id,
-                    "name": getattr(group, "name", None),
-                    "status": group.status,
-                    "ctrf_status": getattr(group, "ctrf_status", None),
-                    "execution_mode": group.execution_mode,
-                    "test_ids": getattr(group, "test_ids", []),
-                    "tags": getattr(group, "tags", []),
-                    "environment": getattr(group, "environment", None),
-                    "created": str(group.created),
-                    "updated": str(group.updated),
-                }
-            )
-
-        if ctx:
-            await ctx.info(f"Found {len(group_list)} test run groups")
-
-        return f"Found {len(group_list)} test run groups:\n{json.dumps(group_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing test run groups: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def get_test_run_group(test_run_group_id_or_name: str, ctx: Context = None) -> str:
-    """Get a specific test run group by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    result = await testzeus_client.test_run_groups.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    test_run_groups = result.get("items", [])
 
-    try:
-        group = await testzeus_client.test_run_groups.get_one(test_run_group_id_or_name)
-        group_data = {
+    group_list = [
+        {
             "id": group.id,
-            "name": group.name,
-            "display_name": getattr(group, "display_name", None),
+            "name": getattr(group, "name", None),
             "status": group.status,
             "ctrf_status": getattr(group, "ctrf_status", None),
             "execution_mode": group.execution_mode,
             "test_ids": getattr(group, "test_ids", []),
             "tags": getattr(group, "tags", []),
             "environment": getattr(group, "environment", None),
-            "notification_channels": getattr(group, "notification_channels", []),
-            "test_report_run": getattr(group, "test_report_run", None),
-            "created": str(group.created),
-            "updated": str(group.updated),
-            "created_by": getattr(group, "created_by", None),
+            "created": group.created,
+            "updated": group.updated,
         }
+        for group in test_run_groups
+    ]
 
-        if ctx:
-            await ctx.info(f"Retrieved test run group: {group.name}")
+    if ctx:
+        await ctx.info(f"Found {len(group_list)} test run groups")
 
-        return f"Test run group details:\n{json.dumps(group_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test run group: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Found {len(group_list)} test run groups:\n{_dumps(group_list)}"
+
+
+@mcp.tool()
+@tz_tool("getting test run group")
+async def get_test_run_group(test_run_group_id_or_name: str, ctx: Context = None) -> str:
+    """Get a specific test run group by ID or name."""
+    group = await testzeus_client.test_run_groups.get_one(test_run_group_id_or_name)
+    group_data = {
+        "id": group.id,
+        "name": group.name,
+        "display_name": getattr(group, "display_name", None),
+        "status": group.status,
+        "ctrf_status": getattr(group, "ctrf_status", None),
+        "execution_mode": group.execution_mode,
+        "test_ids": getattr(group, "test_ids", []),
+        "tags": getattr(group, "tags", []),
+        "environment": getattr(group, "environment", None),
+        "notification_channels": getattr(group, "notification_channels", []),
+        "test_report_run": getattr(group, "test_report_run", None),
+        "created": group.created,
+        "updated": group.updated,
+        "created_by": getattr(group, "created_by", None),
+    }
+
+    if ctx:
+        await ctx.info(f"Retrieved test run group: {group.name}")
+
+    return f"Test run group details:\n{_dumps(group_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating test run group")
 async def create_test_run_group(
     name: str,
     test_ids: list[str] | None = None,
@@ -2641,74 +3174,51 @@ async def create_test_run_group(
     ctx: Context = None,
 ) -> str:
     """Create and execute a new test runs in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     if test_ids and tags:
         return "Error: test_ids and tags cannot be used together, provide one of them."
 
-    try:
-        group = await testzeus_client.test_run_groups.create_and_execute(
-            name=name,
-            test_ids=test_ids,
-            execution_mode="lenient",  # Hardcoded to lenient
-            environment=environment,
-            tags=tags,
-            notification_channels=notification_channels,
-        )
+    group = await testzeus_client.test_run_groups.create_and_execute(
+        name=name,
+        test_ids=test_ids,
+        execution_mode="lenient",  # Hardcoded to lenient
+        environment=environment,
+        tags=tags,
+        notification_channels=notification_channels,
+    )
+    _invalidate_cached("test_runs")
 
-        if ctx:
-            await ctx.info(f"Created test run group: {name}")
+    if ctx:
+        await ctx.info(f"Created test run group: {name}")
 
-        return f"Successfully created test run group '{name}' with ID: {group.id}"
-    except Exception as e:
-        error_msg = f"Error creating test run group: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully created test run group '{name}' with ID: {group.id}"
 
 
 @mcp.tool()
+@tz_tool("deleting test run group")
 async def delete_test_run_group(test_run_group_id_or_name: str, ctx: Context = None) -> str:
     """Delete a test run group (sets status to deleted)."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        await testzeus_client.test_run_groups.delete(test_run_group_id_or_name)
+    await testzeus_client.test_run_groups.delete(test_run_group_id_or_name)
 
-        if ctx:
-            await ctx.info(f"Deleted test run group: {test_run_group_id_or_name}")
+    if ctx:
+        await ctx.info(f"Deleted test run group: {test_run_group_id_or_name}")
 
-        return f"Successfully deleted test run group '{test_run_group_id_or_name}'"
-    except Exception as e:
-        error_msg = f"Error deleting test run group: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return f"Successfully deleted test run group '{test_run_group_id_or_name}'"
 
 
 @mcp.tool()
+@tz_tool("cancelling test run group")
 async def cancel_test_run_group(test_run_group_id_or_name: str, ctx: Context = None) -> str:
-    """Cancel all running test runs in a test run group."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        group = await testzeus_client.test_run_groups.cancel_group(test_run_group_id_or_name)
-
-        if ctx:
-            await ctx.info(f"Cancelled test run group: {test_run_group_id_or_name}")
-
-        return f"Successfully cancelled test run group '{group.name}' (ID: {group.id})"
-    except Exception as e:
-        error_msg = f"Error cancelling test run group: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    """Cancel all running test runs in a test run group."""
+    group = await testzeus_client.test_run_groups.cancel_group(test_run_group_id_or_name)
+
+    if ctx:
+        await ctx.info(f"Cancelled test run group: {test_run_group_id_or_name}")
+
+    return f"Successfully cancelled test run group '{group.name}' (ID: {group.id})"
 
 
 @mcp.tool()
+@tz_tool("downloading test run group report")
 async def download_test_run_group_report(
     test_run_group_id_or_name: str,
     output_dir: str = "downloads",
@@ -2716,219 +3226,345 @@ async def download_test_run_group_report(
     ctx: Context = None,
 ) -> str:
     """Download the report for a test run group."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    try:
-        file_path = await testzeus_client.test_run_groups.download_report(
-            test_run_group_id_or_name, output_dir, format
-        )
-
-        if file_path:
-            if ctx:
-                await ctx.info(f"Downloaded report for test run group: {test_run_group_id_or_name}")
-            return f"Successfully downloaded report to: {file_path}"
-        else:
-            return f"No report available for test run group '{test_run_group_id_or_name}'"
+    file_path = await testzeus_client.test_run_groups.download_report(
+        test_run_group_id_or_name, output_dir, format
+    )
 
-    except Exception as e:
-        error_msg = f"Error downloading test run group report: {str(e)}"
+    if file_path:
         if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+            await ctx.info(f"Downloaded report for test run group: {test_run_group_id_or_name}")
+        return f"Successfully downloaded report to: {file_path}"
+    else:
+        return f"No report available for test run group '{test_run_group_id_or_name}'"
 
 
 @mcp.tool()
+@tz_tool("downloading test run group attachments")
 async def download_test_run_group_attachments(
     test_run_group_id_or_name: str,
     output_dir: str = "downloads",
     ctx: Context = None,
 ) -> str:
     """Download all attachments for all test runs in a test run group."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    downloaded_attachments = await testzeus_client.test_run_groups.download_all_attachments(
+        test_run_group_id_or_name, output_dir
+    )
 
-    try:
-        downloaded_attachments = await testzeus_client.test_run_groups.download_all_attachments(
-            test_run_group_id_or_name, output_dir
+    total_files = sum(len(files) for files in downloaded_attachments.values())
+
+    if ctx:
+        await ctx.info(
+            f"Downloaded {total_files} attachments for test run group: {test_run_group_id_or_name}"
         )
 
-        total_files = sum(len(files) for files in downloaded_attachments.values())
+    result = {
+        "test_run_group": test_run_group_id_or_name,
+        "total_files_downloaded": total_files,
+        "downloads_by_test_run": downloaded_attachments,
+        "output_directory": output_dir,
+    }
 
-        if ctx:
-            await ctx.info(
-                f"Downloaded {total_files} attachments for test run group: "
-                f"{test_run_group_id_or_name}"
-            )
+    return f"Downloaded attachments for test run group:\n{_dumps(result)}"
 
-        result = {
-            "test_run_group": test_run_group_id_or_name,
-            "total_files_downloaded": total_files,
-            "downloads_by_test_run": downloaded_attachments,
-            "output_directory": output_dir,
-        }
 
-        return f"Downloaded attachments for test run group:\n{json.dumps(result, indent=2)}"
+# Resources for browsing TestZeus entities
+def _environment_list_row(env: Environment) -> dict[str, Any]:
+    """An ``environments://`` row."""
+    summary = {
+        "id": env.id,
+        "name": env.name,
+        "device_type": env.device_type,
+        "description": _mask_secret_values(env.data_content),
+        "uri": f"environment://{env.id}",
+    }
+    if _is_mobile_device_type(env.device_type):
+        summary["mobile_device"] = getattr(env, "mobile_device", None)
+        summary["files"] = 1 if env.mobile_supporting_data_file else 0
+    else:
+        files = env.supporting_data_files
+        summary["files"] = len(files) if files else 0
+    return summary
+
+
+def _test_data_list_row(test_data: TestData) -> dict[str, Any]:
+    """A ``test-data://`` row."""
+    return {
+        "id": test_data.id,
+        "name": test_data.name,
+        "tags": test_data.tags,
+        "data_content": _mask_secret_values(test_data.data_content),
+        "files": len(test_data.supporting_data_files or []),
+        "uri": f"test-data://{test_data.id}",
+    }
 
-    except Exception as e:
-        error_msg = f"Error downloading test run group attachments: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+
+def _tag_list_row(tag: Tag) -> dict[str, Any]:
+    """A ``tags://`` row."""
+    return {"id": tag.id, "name": tag.name, "value": tag.value, "uri": f"tag://{tag.id}"}
+
+
+def _device_list_row(device: DevicePool) -> dict[str, Any]:
+    """A ``device-pool://`` row."""
+    return {
+        "id": device.id,
+        "device_name": device.device_name,
+        "platform": device.platform,
+        "platform_version": device.platform_version,
+        "cloud_provider": device.cloud_provider,
+        "is_active": device.is_active,
+        "uri": f"device-pool://{device.id}",
+    }
+
+
+def _test_run_group_list_row(group: TestRunGroup) -> dict[str, Any]:
+    """A ``test-run-groups://`` row."""
+    return {
+        "id": group.id,
+        "name": group.name,
+        "status": group.status,
+        "ctrf_status": group.ctrf_status,
+        "execution_mode": group.execution_mode,
+        "test_count": len(group.test_ids),
+        "uri": f"test-run-group://{group.id}",
+    }
+
+
+def _code_block_list_row(block: HypermindCodeBlocks) -> dict[str, Any]:
+    """A ``hypermind-code-blocks://`` row."""
+    return {
+        "id": block.id,
+        "name": block.name,
+        "status": block.status,
+        "tags": block.tags,
+        "files_count": len(block.code_files),
+        "uri": f"hypermind-code-block://{block.id}",
+    }
+
+
+def _user_integration_list_row(integration: UserIntegration) -> dict[str, Any]:
+    """A ``user-integrations://`` row."""
+    return {
+        "id": integration.id,
+        "name": integration.name,
+        "integration_type": integration.integration_type,
+        "connection_status": integration.connection_status,
+        "uri": f"user-integration://{integration.id}",
+    }
+
+
+def _connected_environment_list_row(env: ConnectedEnvironment) -> dict[str, Any]:
+    """A ``connected-environments://`` row."""
+    return {
+        "id": env.id,
+        "name": env.name,
+        "connection": env.connection,
+        "tags": env.tags,
+        "uri": f"connected-environment://{env.id}",
+    }
+
+
+def _test_report_run_list_row(report: TestReportRun) -> dict[str, Any]:
+    """A ``test-report-runs://`` row."""
+    return {
+        "id": report.id,
+        "name": report.name,
+        "status": report.status,
+        "trigger_time": report.trigger_time,
+        "end_time": report.end_time,
+        "has_ctrf_report": bool(report.ctrf_report),
+        "has_pdf_report": bool(report.pdf_report),
+        "has_csv_report": bool(report.csv_report),
+        "has_zip_report": bool(report.zip_report),
+        "test_run_count": len(report.test_runs),
+        "uri": f"test-report-run://{report.id}",
+    }
+
+
+def _notification_channel_list_row(channel: NotificationChannel) -> dict[str, Any]:
+    """A ``notification-channels://`` row."""
+    return {
+        "id": channel.id,
+        "name": channel.name,
+        "display_name": channel.display_name,
+        "is_active": channel.is_active,
+        "is_default": channel.is_default,
+        "has_emails": bool(channel.emails),
+        "has_webhooks": bool(channel.webhooks),
+        "uri": f"notification-channel://{channel.id}",
+    }
+
+
+def _test_report_schedule_list_row(schedule: TestReportSchedule) -> dict[str, Any]:
+    """A ``test-report-schedules://`` row."""
+    return {
+        "id": schedule.id,
+        "name": schedule.name,
+        "is_active": schedule.is_active,
+        "cron_expression": schedule.cron_expression,
+        "filter_tags": schedule.filter_tags,
+        "filter_tag_pattern": schedule.filter_tag_pattern,
+        "filter_env": schedule.filter_env,
+        "filter_env_pattern": schedule.filter_env_pattern,
+        "filter_test_data": schedule.filter_test_data,
+        "filter_test_data_pattern": schedule.filter_test_data_pattern,
+        "notification_channels": schedule.notification_channels,
+        "uri": f"test-report-schedule://{schedule.id}",
+    }
+
+
+# SDK models handed to _dumps as-is; orjson calls back per item while it walks the page
+_MODEL_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    Environment: _environment_list_row,
+    TestData: _test_data_list_row,
+    Tag: _tag_list_row,
+    DevicePool: _device_list_row,
+    TestRunGroup: _test_run_group_list_row,
+    HypermindCodeBlocks: _code_block_list_row,
+    UserIntegration: _user_integration_list_row,
+    ConnectedEnvironment: _connected_environment_list_row,
+    TestReportRun: _test_report_run_list_row,
+    NotificationChannel: _notification_channel_list_row,
+    TestReportSchedule: _test_report_schedule_list_row,
+}
+
+
+def _encode_model(obj: Any) -> Any:
+    """orjson ``default`` hook serializing registered SDK models by type."""
+    encoder = _MODEL_ENCODERS.get(type(obj))
+    if encoder is None:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return encoder(obj)
 
 
-# Resources for browsing TestZeus entities
 @mcp.resource("tests://")
 async def list_tests_resource() -> str:
-    """List all tests as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    """List all tests as a browsable resource, starting with the first page."""
+    return await list_tests_resource_page(1)
 
+
+@mcp.resource("tests://page/{page}")
+@require_auth
+async def list_tests_resource_page(page: Page) -> str:
+    """List one page of tests as a browsable resource."""
     try:
-        result = await testzeus_client.tests.get_list(per_page=100)
-        tests = result.get("items", [])
-
-        test_list = []
-        for test in tests:
-            test_list.append(
-                {
-                    "id": test.id,
-                    "name": test.name,
-                    "status": test.status,
-                    "testing_type": test.testing_type,
-                    "test_feature": test.test_feature,
-                    "uri": f"test://{test.id}",
-                }
-            )
+        result = await _get_list(
+            "tests",
+            {"page": page, "per_page": _RESOURCE_PAGE_SIZE, "fields": _TEST_RESOURCE_FIELDS},
+            models=False,
+        )
+        test_list = [
+            {
+                "id": test["id"],
+                "name": test.get("name"),
+                "status": test.get("status"),
+                "testing_type": test.get("testing_type", "web"),
+                "test_feature": test.get("test_feature"),
+                "uri": f"test://{test['id']}",
+            }
+            for test in result.get("items", [])
+        ]
 
-        return json.dumps({"tests": test_list}, indent=2)
+        return _resource_page("tests", test_list, result, "tests")
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing tests: {str(e)}"
 
 
 @mcp.resource("test://{test_id}")
+@require_auth
 async def get_test_resource(test_id: str) -> str:
     """Get a specific test as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
-        test = await testzeus_client.tests.get_one(test_id)
-        test_data = {
-            "id": test.id,
-            "name": test.name,
-            "status": test.status,
-            "testing_type": test.testing_type,
-            "test_feature": test.test_feature,
-            "tags": test.tags,
-            "test_data": test.test_data,
-            "environment": test.environment,
-            "config": getattr(test, "config", None),
-            "metadata": getattr(test, "metadata", None),
-            "created": str(test.created),
-            "updated": str(test.updated),
-            "modified_by": test.modified_by,
-        }
+    async def fetch() -> tuple[str, bool]:
+        test = await _load_batched("tests", test_id)
+        test_data = _test_resource_row(test)
+        return _dumps(test_data), True
 
-        return json.dumps(test_data, indent=2)
+    try:
+        return await _cached_payload(("test_resource", test_id), fetch)
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting test: {str(e)}"
 
 
 @mcp.resource("test-runs://")
 async def list_test_runs_resource() -> str:
-    """List all test runs as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    """List all test runs as a browsable resource, starting with the first page."""
+    return await list_test_runs_resource_page(1)
+
 
+@mcp.resource("test-runs://page/{page}")
+@require_auth
+async def list_test_runs_resource_page(page: Page) -> str:
+    """List one page of test runs as a browsable resource."""
     try:
-        result = await testzeus_client.test_runs.get_list(per_page=100)
-        test_runs = result.get("items", [])
-
-        run_list = []
-        for run in test_runs:
-            run_list.append(
-                {
-                    "id": run.id,
-                    "name": run.name,
-                    "status": run.status,
-                    "test": run.test,
-                    "uri": f"test-run://{run.id}",
-                }
-            )
+        result = await _get_list(
+            "test_runs",
+            {"page": page, "per_page": _RESOURCE_PAGE_SIZE, "fields": _TEST_RUN_RESOURCE_FIELDS},
+            models=False,
+        )
+        run_list = [
+            {
+                "id": run["id"],
+                "name": run.get("name"),
+                "status": run.get("status"),
+                "test": run.get("test"),
+                "uri": f"test-run://{run['id']}",
+            }
+            for run in result.get("items", [])
+        ]
 
-        return json.dumps({"test_runs": run_list}, indent=2)
+        return _resource_page("test_runs", run_list, result, "test-runs")
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing test runs: {str(e)}"
 
 
 @mcp.resource("test-run://{test_run_id}")
+@require_auth
 async def get_test_run_resource(test_run_id: str) -> str:
     """Get a specific test run as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
-        run = await testzeus_client.test_runs.get_one(test_run_id)
-        run_data = {
-            "id": run.id,
-            "name": run.name,
-            "status": run.status,
-            "test_status": getattr(run, "test_status", None),
-            "start_time": str(getattr(run, "start_time", None)),
-            "end_time": str(getattr(run, "end_time", None)),
-            "tags": getattr(run, "tags", []),
-            "metadata": getattr(run, "metadata", None),
-            "created": str(run.created),
-            "updated": str(run.updated),
-            "modified_by": run.modified_by,
-        }
+    async def fetch() -> tuple[str, bool]:
+        run = await _load_batched("test_runs", test_run_id)
+        run_data = _test_run_resource_row(run)
+        return _dumps(run_data), run.status in _FINAL_RUN_STATUSES
 
-        return json.dumps(run_data, indent=2)
+    try:
+        return await _cached_payload(("test_run_resource", test_run_id), fetch)
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting test run: {str(e)}"
 
 
 @mcp.resource("environments://")
 async def list_environments_resource() -> str:
-    """List all environments as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    """List all environments as a browsable resource, starting with the first page."""
+    return await list_environments_resource_page(1)
 
+
+@mcp.resource("environments://page/{page}")
+@require_auth
+async def list_environments_resource_page(page: Page) -> str:
+    """List one page of environments as a browsable resource."""
     try:
-        result = await testzeus_client.environments.get_list(per_page=100)
-        environments = result.get("items", [])
-
-        env_list = []
-        for env in environments:
-            summary = {
-                "id": env.id,
-                "name": env.name,
-                "device_type": env.device_type,
-                "description": _mask_secret_values(env.data_content),
-                "uri": f"environment://{env.id}",
-            }
-            if _is_mobile_device_type(env.device_type):
-                summary["mobile_device"] = getattr(env, "mobile_device", None)
-                summary["files"] = 1 if env.mobile_supporting_data_file else 0
-            else:
-                files = env.supporting_data_files
-                summary["files"] = len(files) if files else 0
-            env_list.append(summary)
-
-        return json.dumps({"environments": env_list}, indent=2)
+        result = await _get_list(
+            "environments",
+            {"page": page, "per_page": _RESOURCE_PAGE_SIZE, "fields": _ENVIRONMENT_RESOURCE_FIELDS},
+        )
+        return _resource_page("environments", result.get("items", []), result, "environments")
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing environments: {str(e)}"
 
 
 @mcp.resource("environment://{environment_id}")
+@require_auth
 async def get_environment_resource(environment_id: str) -> str:
     """Get a specific environment as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
-        env = await testzeus_client.environments.get_one(environment_id)
+    async def fetch() -> tuple[str, bool]:
+        env = await _load_batched("environments", environment_id)
         env_data = _serialize_environment(env, detail=True)
         env_data["description"] = env_data.pop("data", None)
         env_data["files"] = (
@@ -2940,105 +3576,63 @@ async def get_environment_resource(environment_id: str) -> str:
                 else 0
             )
         )
+        return _dumps(env_data), True
 
-        return json.dumps(env_data, indent=2)
+    try:
+        return await _cached_payload(("environment_resource", environment_id), fetch)
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting environment: {str(e)}"
 
 
 @mcp.resource("device-pool://")
+@require_auth
 async def list_device_pool_resource() -> str:
     """List all devices in the pool as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         result = await testzeus_client.device_pool.get_list(per_page=100)
-        devices = result.get("items", [])
-
-        device_list = []
-        for device in devices:
-            device_list.append(
-                {
-                    "id": device.id,
-                    "device_name": device.device_name,
-                    "platform": device.platform,
-                    "platform_version": device.platform_version,
-                    "cloud_provider": device.cloud_provider,
-                    "is_active": device.is_active,
-                    "uri": f"device-pool://{device.id}",
-                }
-            )
-
-        return json.dumps({"device_pool": device_list}, indent=2)
+        return _dumps({"device_pool": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing device pool: {str(e)}"
 
 
 @mcp.resource("device-pool://{device_id}")
+@require_auth
 async def get_device_pool_resource(device_id: str) -> str:
     """Get a specific device from the pool as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         device = await testzeus_client.device_pool.get_one(device_id)
-        device_data = {
-            "id": device.id,
-            "device_name": device.device_name,
-            "platform": device.platform,
-            "platform_version": device.platform_version,
-            "cloud_provider": device.cloud_provider,
-            "device_type": device.device_type,
-            "is_active": device.is_active,
-            "concurrency_limit": device.concurrency_limit,
-            "active_sessions": device.active_sessions,
-            "automation_name": device.automation_name,
-            "device_tier": device.device_tier,
-            "created": str(device.created),
-            "updated": str(device.updated),
-        }
-
-        return json.dumps(device_data, indent=2)
+        return _dumps(_device_resource_row(device))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting device: {str(e)}"
 
 
 @mcp.resource("test-data://")
 async def list_test_data_resource() -> str:
-    """List all test data as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
+    """List all test data as a browsable resource, starting with the first page."""
+    return await list_test_data_resource_page(1)
 
-    try:
-        result = await testzeus_client.test_data.get_list(per_page=100)
-        test_data = result.get("items", [])
-
-        test_data_list = []
-        for test_data in test_data:
-            test_data_list.append(
-                {
-                    "id": test_data.id,
-                    "name": test_data.name,
-                    "tags": test_data.tags,
-                    "data_content": _mask_secret_values(test_data.data_content),
-                    "files": len(test_data.supporting_data_files or []),
-                    "uri": f"test-data://{test_data.id}",
-                }
-            )
 
-        return json.dumps({"test_data": test_data_list}, indent=2)
+@mcp.resource("test-data://page/{page}")
+@require_auth
+async def list_test_data_resource_page(page: Page) -> str:
+    """List one page of test data as a browsable resource."""
+    try:
+        result = await testzeus_client.test_data.get_list(page=page, per_page=_RESOURCE_PAGE_SIZE)
+        return _resource_page("test_data", result.get("items", []), result, "test-data")
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing test data: {str(e)}"
 
 
 @mcp.resource("test-data://{test_data_id}")
+@require_auth
 async def get_test_data_resource(test_data_id: str) -> str:
     """Get a specific test data as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
+    async def fetch() -> tuple[str, bool]:
         test_data = await testzeus_client.test_data.get_one(test_data_id)
         test_data_data = {
             "id": test_data.id,
@@ -3046,275 +3640,147 @@ async def get_test_data_resource(test_data_id: str) -> str:
             "tags": test_data.tags,
             "data_content": _mask_secret_values(test_data.data_content),
             "supporting_data_files": _format_supporting_files(test_data),
-            "created": str(test_data.created),
-            "updated": str(test_data.updated),
+            "created": test_data.created,
+            "updated": test_data.updated,
             "files_count": len(test_data.supporting_data_files or []),
             "modified_by": test_data.modified_by,
         }
+        return _dumps(test_data_data), True
 
-        return json.dumps(test_data_data, indent=2)
+    try:
+        return await _cached_payload(("test_data_resource", test_data_id), fetch)
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting test data: {str(e)}"
 
 
 @mcp.resource("tags://")
 async def list_tags_resource() -> str:
-    """List all tags as a browsable resource."""
-    if not await ensure_authenticated():
-        return "Error: Not authenticated. Use authenticate_testzeus tool first."
+    """List all tags as a browsable resource, starting with the first page."""
+    return await list_tags_resource_page(1)
 
-    try:
-        result = await testzeus_client.tags.get_list(per_page=100)
-        tags = result.get("items", [])
-
-        tag_list = []
-        for tag in tags:
-            tag_list.append(
-                {
-                    "id": tag.id,
-                    "name": tag.name,
-                    "value": tag.value,
-                    "uri": f"tag://{tag.id}",
-                }
-            )
 
-        return json.dumps({"tags": tag_list}, indent=2)
+@mcp.resource("tags://page/{page}")
+@require_auth
+async def list_tags_resource_page(page: Page) -> str:
+    """List one page of tags as a browsable resource."""
+    try:
+        result = await testzeus_client.tags.get_list(page=page, per_page=_RESOURCE_PAGE_SIZE)
+        return _resource_page("tags", result.get("items", []), result, "tags")
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing tags: {str(e)}"
 
 
 @mcp.resource("tag://{tag_id}")
+@require_auth
 async def get_tag_resource(tag_id: str) -> str:
     """Get a specific tag as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
 
-    try:
+    async def fetch() -> tuple[str, bool]:
         tag = await testzeus_client.tags.get_one(tag_id)
-        tag_data = {
-            "id": tag.id,
-            "name": tag.name,
-            "value": tag.value,
-            "created": str(tag.created),
-            "updated": str(tag.updated),
-            "tenant": tag.tenant,
-            "modified_by": tag.modified_by,
-        }
+        return _dumps(_tag_detail_row(tag)), True
 
-        return json.dumps(tag_data, indent=2)
+    try:
+        return await _cached_payload(("tag_resource", tag_id), fetch)
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting tag: {str(e)}"
 
 
 @mcp.resource("test-run-groups://")
+@require_auth
 async def list_test_run_groups_resource() -> str:
     """List all test run groups as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         result = await testzeus_client.test_run_groups.get_list(per_page=100)
-        test_run_groups = result.get("items", [])
-
-        group_list = []
-        for group in test_run_groups:
-            group_list.append(
-                {
-                    "id": group.id,
-                    "name": group.name,
-                    "status": group.status,
-                    "ctrf_status": getattr(group, "ctrf_status", None),
-                    "execution_mode": group.execution_mode,
-                    "test_count": len(getattr(group, "test_ids", [])),
-                    "uri": f"test-run-group://{group.id}",
-                }
-            )
-
-        return json.dumps({"test_run_groups": group_list}, indent=2)
+        return _dumps({"test_run_groups": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing test run groups: {str(e)}"
 
 
 @mcp.resource("test-run-group://{test_run_group_id}")
+@require_auth
 async def get_test_run_group_resource(test_run_group_id: str) -> str:
     """Get a specific test run group as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         group = await testzeus_client.test_run_groups.get_one(test_run_group_id)
-        group_data = {
-            "id": group.id,
-            "name": group.name,
-            "status": group.status,
-            "ctrf_status": getattr(group, "ctrf_status", None),
-            "execution_mode": group.execution_mode,
-            "test_ids": getattr(group, "test_ids", []),
-            "tags": getattr(group, "tags", []),
-            "environment": getattr(group, "environment", None),
-            "notification_channels": getattr(group, "notification_channels", []),
-            "test_report_run": getattr(group, "test_report_run", None),
-            "created": str(group.created),
-            "updated": str(group.updated),
-            "created_by": getattr(group, "created_by", None),
-        }
-
-        return json.dumps(group_data, indent=2)
+        return _dumps(_test_run_group_resource_row(group))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting test run group: {str(e)}"
 
 
 @mcp.resource("hypermind-code-blocks://")
+@require_auth
 async def list_hypermind_code_blocks_resource() -> str:
     """List all hypermind code blocks as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         result = await testzeus_client.hypermind_code_blocks.get_list(per_page=100)
-        code_blocks = result.get("items", [])
-
-        block_list = []
-        for block in code_blocks:
-            block_list.append(
-                {
-                    "id": block.id,
-                    "name": block.name,
-                    "status": block.status,
-                    "tags": block.tags,
-                    "files_count": len(block.code_files),
-                    "uri": f"hypermind-code-block://{block.id}",
-                }
-            )
-
-        return json.dumps({"hypermind_code_blocks": block_list}, indent=2)
+        return _dumps({"hypermind_code_blocks": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing hypermind code blocks: {str(e)}"
 
 
 @mcp.resource("hypermind-code-block://{code_block_id}")
+@require_auth
 async def get_hypermind_code_block_resource(code_block_id: str) -> str:
     """Get a specific hypermind code block as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         block = await testzeus_client.hypermind_code_blocks.get_one(code_block_id)
-        block_data = {
-            "id": block.id,
-            "name": block.name,
-            "status": block.status,
-            "tags": block.tags,
-            "code_files": block.code_files,
-            "created": str(block.created),
-            "updated": str(block.updated),
-            "modified_by": block.modified_by,
-        }
-
-        return json.dumps(block_data, indent=2)
+        return _dumps(_code_block_resource_row(block))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting hypermind code block: {str(e)}"
 
 
 @mcp.resource("user-integrations://")
+@require_auth
 async def list_user_integrations_resource() -> str:
     """List all user integrations as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         result = await testzeus_client.user_integrations.get_list(per_page=100)
-        integrations = result.get("items", [])
-
-        integration_list = []
-        for integration in integrations:
-            integration_list.append(
-                {
-                    "id": integration.id,
-                    "name": integration.name,
-                    "integration_type": getattr(integration, "integration_type", None),
-                    "connection_status": getattr(integration, "connection_status", None),
-                    "uri": f"user-integration://{integration.id}",
-                }
-            )
-
-        return json.dumps({"user_integrations": integration_list}, indent=2)
+        return _dumps({"user_integrations": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing user integrations: {str(e)}"
 
 
 @mcp.resource("user-integration://{integration_id}")
+@require_auth
 async def get_user_integration_resource(integration_id: str) -> str:
     """Get a specific user integration as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         integration = await testzeus_client.user_integrations.get_one(integration_id)
-        integration_data = {
-            "id": integration.id,
-            "name": integration.name,
-            "integration_type": getattr(integration, "integration_type", None),
-            "connection_status": getattr(integration, "connection_status", None),
-            "project_id": getattr(integration, "project_id", None),
-            "auth_config_id": getattr(integration, "auth_config_id", None),
-            "connected_account_id": getattr(integration, "connected_account_id", None),
-            "scopes": getattr(integration, "scopes", None),
-            "created": str(integration.created),
-            "updated": str(integration.updated),
-        }
-
-        return json.dumps(integration_data, indent=2)
+        return _dumps(_user_integration_resource_row(integration))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting user integration: {str(e)}"
 
 
 @mcp.resource("connected-environments://")
+@require_auth
 async def list_connected_environments_resource() -> str:
     """List all connected environments as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         result = await testzeus_client.connected_environments.get_list(per_page=100)
-        connected_envs = result.get("items", [])
-
-        env_list = []
-        for env in connected_envs:
-            env_list.append(
-                {
-                    "id": env.id,
-                    "name": env.name,
-                    "connection": getattr(env, "connection", None),
-                    "tags": env.tags,
-                    "uri": f"connected-environment://{env.id}",
-                }
-            )
-
-        return json.dumps({"connected_environments": env_list}, indent=2)
+        return _dumps({"connected_environments": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing connected environments: {str(e)}"
 
 
 @mcp.resource("connected-environment://{connected_env_id}")
+@require_auth
 async def get_connected_environment_resource(connected_env_id: str) -> str:
     """Get a specific connected environment as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
     try:
         env = await testzeus_client.connected_environments.get_one(connected_env_id)
-        env_data = {
-            "id": env.id,
-            "name": env.name,
-            "connection": getattr(env, "connection", None),
-            "created": str(env.created),
-            "updated": str(env.updated),
-            "modified_by": env.modified_by,
-        }
-
-        return json.dumps(env_data, indent=2)
+        return _dumps(_connected_environment_resource_row(env))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting connected environment: {str(e)}"
 
 
@@ -3324,98 +3790,28 @@ async def get_connected_environment_resource(connected_env_id: str) -> str:
 
 
 @mcp.tool()
+@tz_tool("listing test report schedules")
 async def list_test_report_schedules(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all test report schedules in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        per_page = min(per_page, 100)  # Cap at 100
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.test_report_schedules.get_list(**params)
-        schedules = result.get("items", [])
-
-        schedule_list = []
-        for schedule in schedules:
-            schedule_list.append(
-                {
-                    "id": schedule.id,
-                    "name": schedule.name,
-                    "is_active": getattr(schedule, "is_active", False),
-                    "cron_expression": getattr(schedule, "cron_expression", None),
-                    "filter_name_pattern": getattr(schedule, "filter_name_pattern", None),
-                    "filter_time_intervals": getattr(schedule, "filter_time_intervals", None),
-                    "filter_tags": getattr(schedule, "filter_tags", []),
-                    "filter_tag_pattern": getattr(schedule, "filter_tag_pattern", None),
-                    "filter_env": getattr(schedule, "filter_env", []),
-                    "filter_env_pattern": getattr(schedule, "filter_env_pattern", None),
-                    "filter_test_data": getattr(schedule, "filter_test_data", []),
-                    "filter_test_data_pattern": getattr(schedule, "filter_test_data_pattern", None),
-                    "notification_channels": getattr(schedule, "notification_channels", []),
-                    "created": str(schedule.created),
-                    "updated": str(schedule.updated),
-                }
-            )
-
-        if ctx:
-            await ctx.info(f"Retrieved {len(schedule_list)} test report schedules")
-
-        return json.dumps(
-            {
-                "test_report_schedules": schedule_list,
-                "page": page,
-                "per_page": per_page,
-                "total": result.get("totalItems", len(schedule_list)),
-            },
-            indent=2,
-            cls=DateTimeEncoder,
-        )
-    except Exception as e:
-        error_msg = f"Error listing test report schedules: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def get_test_report_schedule(schedule_id_or_name: str, ctx: Context = None) -> str:
-    """Get a specific test report schedule by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.test_report_schedules.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    schedules = result.get("items", [])
 
-    try:
-        schedule = await testzeus_client.test_report_schedules.get_one(schedule_id_or_name)
-        schedule_data = {
+    schedule_list = [
+        {
             "id": schedule.id,
             "name": schedule.name,
             "is_active": getattr(schedule, "is_active", False),
+            "cron_expression": getattr(schedule, "cron_expression", None),
             "filter_name_pattern": getattr(schedule, "filter_name_pattern", None),
             "filter_time_intervals": getattr(schedule, "filter_time_intervals", None),
-            "cron_expression": getattr(schedule, "cron_expression", None),
             "filter_tags": getattr(schedule, "filter_tags", []),
             "filter_tag_pattern": getattr(schedule, "filter_tag_pattern", None),
             "filter_env": getattr(schedule, "filter_env", []),
@@ -3423,24 +3819,58 @@ async def get_test_report_schedule(schedule_id_or_name: str, ctx: Context = None
             "filter_test_data": getattr(schedule, "filter_test_data", []),
             "filter_test_data_pattern": getattr(schedule, "filter_test_data_pattern", None),
             "notification_channels": getattr(schedule, "notification_channels", []),
-            "created": str(schedule.created),
-            "updated": str(schedule.updated),
-            "tenant": schedule.tenant,
-            "created_by": getattr(schedule, "created_by", None),
+            "created": schedule.created,
+            "updated": schedule.updated,
         }
+        for schedule in schedules
+    ]
+
+    if ctx:
+        await ctx.info(f"Retrieved {len(schedule_list)} test report schedules")
+
+    return _dumps(
+        {
+            "test_report_schedules": schedule_list,
+            "page": page,
+            "per_page": per_page,
+            "total": result.get("totalItems", len(schedule_list)),
+        }
+    )
 
-        if ctx:
-            await ctx.info(f"Retrieved test report schedule: {schedule.name}")
 
-        return json.dumps(schedule_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error getting test report schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+@mcp.tool()
+@tz_tool("getting test report schedule")
+async def get_test_report_schedule(schedule_id_or_name: str, ctx: Context = None) -> str:
+    """Get a specific test report schedule by ID or name."""
+    schedule = await testzeus_client.test_report_schedules.get_one(schedule_id_or_name)
+    schedule_data = {
+        "id": schedule.id,
+        "name": schedule.name,
+        "is_active": getattr(schedule, "is_active", False),
+        "filter_name_pattern": getattr(schedule, "filter_name_pattern", None),
+        "filter_time_intervals": getattr(schedule, "filter_time_intervals", None),
+        "cron_expression": getattr(schedule, "cron_expression", None),
+        "filter_tags": getattr(schedule, "filter_tags", []),
+        "filter_tag_pattern": getattr(schedule, "filter_tag_pattern", None),
+        "filter_env": getattr(schedule, "filter_env", []),
+        "filter_env_pattern": getattr(schedule, "filter_env_pattern", None),
+        "filter_test_data": getattr(schedule, "filter_test_data", []),
+        "filter_test_data_pattern": getattr(schedule, "filter_test_data_pattern", None),
+        "notification_channels": getattr(schedule, "notification_channels", []),
+        "created": schedule.created,
+        "updated": schedule.updated,
+        "tenant": schedule.tenant,
+        "created_by": getattr(schedule, "created_by", None),
+    }
+
+    if ctx:
+        await ctx.info(f"Retrieved test report schedule: {schedule.name}")
+
+    return _dumps(schedule_data)
 
 
 @mcp.tool()
+@tz_tool("creating test report schedule")
 async def create_test_report_schedule(
     name: str,
     is_active: bool = True,
@@ -3481,51 +3911,36 @@ async def create_test_report_schedule(
     Returns:
         JSON string with created schedule details
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        schedule = await testzeus_client.test_report_schedules.create_test_report_schedule(
-            name=name,
-            is_active=is_active,
-            filter_name_pattern=filter_name_pattern,
-            filter_time_intervals=filter_time_intervals,
-            cron_expression=cron_expression,
-            filter_tags=filter_tags,
-            filter_tag_pattern=filter_tag_pattern,
-            filter_env=filter_env,
-            filter_env_pattern=filter_env_pattern,
-            filter_test_data=filter_test_data,
-            filter_test_data_pattern=filter_test_data_pattern,
-            notification_channels=notification_channels,
-        )
+    schedule = await testzeus_client.test_report_schedules.create_test_report_schedule(
+        name=name,
+        is_active=is_active,
+        filter_name_pattern=filter_name_pattern,
+        filter_time_intervals=filter_time_intervals,
+        cron_expression=cron_expression,
+        filter_tags=filter_tags,
+        filter_tag_pattern=filter_tag_pattern,
+        filter_env=filter_env,
+        filter_env_pattern=filter_env_pattern,
+        filter_test_data=filter_test_data,
+        filter_test_data_pattern=filter_test_data_pattern,
+        notification_channels=notification_channels,
+    )
 
-        schedule_data = {
-            "id": schedule.id,
-            "name": schedule.name,
-            "is_active": getattr(schedule, "is_active", False),
-            "created": str(schedule.created),
-        }
+    schedule_data = {
+        "id": schedule.id,
+        "name": schedule.name,
+        "is_active": getattr(schedule, "is_active", False),
+        "created": schedule.created,
+    }
 
-        if ctx:
-            await ctx.info(f"Created test report schedule: {schedule.name}")
+    if ctx:
+        await ctx.info(f"Created test report schedule: {schedule.name}")
 
-        return json.dumps(schedule_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error creating test report schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps(schedule_data)
 
 
 @mcp.tool()
+@tz_tool("updating test report schedule")
 async def update_test_report_schedule(
     schedule_id_or_name: str,
     name: str | None = None,
@@ -3567,79 +3982,45 @@ async def update_test_report_schedule(
     Returns:
         JSON string with updated schedule details
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        schedule = await testzeus_client.test_report_schedules.update_test_report_schedule(
-            id_or_name=schedule_id_or_name,
-            name=name,
-            is_active=is_active,
-            filter_name_pattern=filter_name_pattern,
-            filter_time_intervals=filter_time_intervals,
-            cron_expression=cron_expression,
-            filter_tags=filter_tags,
-            filter_tag_pattern=filter_tag_pattern,
-            filter_env=filter_env,
-            filter_env_pattern=filter_env_pattern,
-            filter_test_data=filter_test_data,
-            filter_test_data_pattern=filter_test_data_pattern,
-            notification_channels=notification_channels,
-        )
+    schedule = await testzeus_client.test_report_schedules.update_test_report_schedule(
+        id_or_name=schedule_id_or_name,
+        name=name,
+        is_active=is_active,
+        filter_name_pattern=filter_name_pattern,
+        filter_time_intervals=filter_time_intervals,
+        cron_expression=cron_expression,
+        filter_tags=filter_tags,
+        filter_tag_pattern=filter_tag_pattern,
+        filter_env=filter_env,
+        filter_env_pattern=filter_env_pattern,
+        filter_test_data=filter_test_data,
+        filter_test_data_pattern=filter_test_data_pattern,
+        notification_channels=notification_channels,
+    )
 
-        schedule_data = {
-            "id": schedule.id,
-            "name": schedule.name,
-            "is_active": getattr(schedule, "is_active", False),
-            "updated": str(schedule.updated),
-        }
+    schedule_data = {
+        "id": schedule.id,
+        "name": schedule.name,
+        "is_active": getattr(schedule, "is_active", False),
+        "updated": schedule.updated,
+    }
 
-        if ctx:
-            await ctx.info(f"Updated test report schedule: {schedule.name}")
+    if ctx:
+        await ctx.info(f"Updated test report schedule: {schedule.name}")
 
-        return json.dumps(schedule_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error updating test report schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps(schedule_data)
 
 
 @mcp.tool()
+@tz_tool("deleting test report schedule")
 async def delete_test_report_schedule(schedule_id_or_name: str, ctx: Context = None) -> str:
     """Delete a test report schedule (sets status to deleted)."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        await testzeus_client.test_report_schedules.delete(schedule_id_or_name)
-
-        if ctx:
-            await ctx.info(f"Deleted test report schedule: {schedule_id_or_name}")
+    await testzeus_client.test_report_schedules.delete(schedule_id_or_name)
 
-        return json.dumps(
-            {"message": f"Test report schedule {schedule_id_or_name} deleted successfully"},
-            indent=2,
-        )
-    except Exception as e:
-        error_msg = f"Error deleting test report schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    if ctx:
+        await ctx.info(f"Deleted test report schedule: {schedule_id_or_name}")
+
+    return _dumps({"message": f"Test report schedule {schedule_id_or_name} deleted successfully"})
 
 
 # ============================================================================
@@ -3648,144 +4029,90 @@ async def delete_test_report_schedule(schedule_id_or_name: str, ctx: Context = N
 
 
 @mcp.tool()
+@tz_tool("listing test report runs")
 async def list_test_report_runs(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all test report runs in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        per_page = min(per_page, 100)  # Cap at 100
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.test_report_runs.get_list(**params)
-        reports = result.get("items", [])
-
-        report_list = []
-        for report in reports:
-            report_list.append(
-                {
-                    "id": report.id,
-                    "name": report.display_name,
-                    "status": report.status,
-                    "end_time": str(getattr(report, "end_time", None)),
-                    "ctrf_report_findings": getattr(report, "ctrf_report_findings", None),
-                    "created": str(report.created),
-                    "updated": str(report.updated),
-                }
-            )
-
-        if ctx:
-            await ctx.info(f"Retrieved {len(report_list)} test report runs")
+    result = await testzeus_client.test_report_runs.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    reports = result.get("items", [])
 
-        return json.dumps(
-            {
-                "test_report_runs": report_list,
-                "page": page,
-                "per_page": per_page,
-                "total": result.get("totalItems", len(report_list)),
-            },
-            indent=2,
-            cls=DateTimeEncoder,
-        )
-    except Exception as e:
-        error_msg = f"Error listing test report runs: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    report_list = [
+        {
+            "id": report.id,
+            "name": report.display_name,
+            "status": report.status,
+            "end_time": getattr(report, "end_time", None),
+            "ctrf_report_findings": getattr(report, "ctrf_report_findings", None),
+            "created": report.created,
+            "updated": report.updated,
+        }
+        for report in reports
+    ]
+
+    if ctx:
+        await ctx.info(f"Retrieved {len(report_list)} test report runs")
+
+    return _dumps(
+        {
+            "test_report_runs": report_list,
+            "page": page,
+            "per_page": per_page,
+            "total": result.get("totalItems", len(report_list)),
+        }
+    )
 
 
 @mcp.tool()
+@tz_tool("getting test report run")
 async def get_test_report_run(report_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific test report run by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        report = await testzeus_client.test_report_runs.get_one(report_id_or_name)
-        report_data = {
-            "id": report.id,
-            "name": report.name,
-            "status": report.status,
-            "schedule": getattr(report, "schedule", None),
-            "test_run_group": getattr(report, "test_run_group", None),
-            "end_time": str(getattr(report, "end_time", None)),
-            "ctrf_report": getattr(report, "ctrf_report", None),
-            "pdf_report": getattr(report, "pdf_report", None),
-            "csv_report": getattr(report, "csv_report", None),
-            "zip_report": getattr(report, "zip_report", None),
-            "ctrf_report_findings": getattr(report, "ctrf_report_findings", None),
-            "test_runs": getattr(report, "test_runs", []),
-            "created": str(report.created),
-            "updated": str(report.updated),
-            "tenant": report.tenant,
-            "modified_by": getattr(report, "modified_by", None),
-        }
+    report = await testzeus_client.test_report_runs.get_one(report_id_or_name)
+    report_data = {
+        "id": report.id,
+        "name": report.name,
+        "status": report.status,
+        "schedule": getattr(report, "schedule", None),
+        "test_run_group": getattr(report, "test_run_group", None),
+        "end_time": getattr(report, "end_time", None),
+        "ctrf_report": getattr(report, "ctrf_report", None),
+        "pdf_report": getattr(report, "pdf_report", None),
+        "csv_report": getattr(report, "csv_report", None),
+        "zip_report": getattr(report, "zip_report", None),
+        "ctrf_report_findings": getattr(report, "ctrf_report_findings", None),
+        "test_runs": getattr(report, "test_runs", []),
+        "created": report.created,
+        "updated": report.updated,
+        "tenant": report.tenant,
+        "modified_by": getattr(report, "modified_by", None),
+    }
 
-        if ctx:
-            await ctx.info(f"Retrieved test report run: {report.name}")
+    if ctx:
+        await ctx.info(f"Retrieved test report run: {report.name}")
 
-        return json.dumps(report_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error getting test report run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps(report_data)
 
 
 @mcp.tool()
+@tz_tool("deleting test report run")
 async def delete_test_report_run(report_id_or_name: str, ctx: Context = None) -> str:
     """Delete a test report run."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        await testzeus_client.test_report_runs.delete(report_id_or_name)
+    await testzeus_client.test_report_runs.delete(report_id_or_name)
 
-        if ctx:
-            await ctx.info(f"Deleted test report run: {report_id_or_name}")
+    if ctx:
+        await ctx.info(f"Deleted test report run: {report_id_or_name}")
 
-        return json.dumps(
-            {"message": f"Test report run {report_id_or_name} deleted successfully"},
-            indent=2,
-        )
-    except Exception as e:
-        error_msg = f"Error deleting test report run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps({"message": f"Test report run {report_id_or_name} deleted successfully"})
 
 
 @mcp.tool()
+@tz_tool("downloading test report")
 async def download_test_report(
     report_id_or_name: str,
     output_dir: str = "downloads",
@@ -3803,55 +4130,37 @@ async def download_test_report(
     Returns:
         JSON string with download details
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
     if format not in ["ctrf", "pdf", "csv", "zip"]:
         error_msg = "format must be one of: 'ctrf', 'pdf', 'csv', 'zip'"
         if ctx:
             await ctx.error(error_msg)
         return error_msg
 
-    try:
-        file_path = await testzeus_client.test_report_runs.download_report(
-            id_or_name=report_id_or_name,
-            output_dir=output_dir,
-            format=format,
-        )
-
-        if file_path is None:
-            error_msg = (
-                f"Test report run {report_id_or_name} is not completed or report not available"
-            )
-            if ctx:
-                await ctx.error(error_msg)
-            return error_msg
-
-        download_data = {
-            "report_id": report_id_or_name,
-            "format": format,
-            "file_path": str(file_path),
-            "output_dir": output_dir,
-            "message": f"Successfully downloaded {format} report to {file_path}",
-        }
-
-        if ctx:
-            await ctx.info(f"Downloaded {format} report for {report_id_or_name} to {file_path}")
+    file_path = await testzeus_client.test_report_runs.download_report(
+        id_or_name=report_id_or_name,
+        output_dir=output_dir,
+        format=format,
+    )
 
-        return json.dumps(download_data, indent=2)
-    except Exception as e:
-        error_msg = f"Error downloading test report: {str(e)}"
+    if file_path is None:
+        error_msg = f"Test report run {report_id_or_name} is not completed or report not available"
         if ctx:
             await ctx.error(error_msg)
         return error_msg
 
+    download_data = {
+        "report_id": report_id_or_name,
+        "format": format,
+        "file_path": str(file_path),
+        "output_dir": output_dir,
+        "message": f"Successfully downloaded {format} report to {file_path}",
+    }
+
+    if ctx:
+        await ctx.info(f"Downloaded {format} report for {report_id_or_name} to {file_path}")
+
+    return _dumps(download_data)
+
 
 # ============================================================================
 # TEST REPORT RUN RESOURCES
@@ -3859,77 +4168,26 @@ async def download_test_report(
 
 
 @mcp.resource("test-report-runs://list")
+@require_auth
 async def list_test_report_runs_resource() -> str:
     """List all test report runs as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        return json.dumps({"error": "Authentication failed - unable to connect to TestZeus"})
-
     try:
         result = await testzeus_client.test_report_runs.get_list(per_page=100)
-        reports = result.get("items", [])
-
-        report_list = []
-        for report in reports:
-            report_list.append(
-                {
-                    "id": report.id,
-                    "name": report.name,
-                    "status": report.status,
-                    "trigger_time": str(getattr(report, "trigger_time", None)),
-                    "end_time": str(getattr(report, "end_time", None)),
-                    "has_ctrf_report": bool(getattr(report, "ctrf_report", None)),
-                    "has_pdf_report": bool(getattr(report, "pdf_report", None)),
-                    "has_csv_report": bool(getattr(report, "csv_report", None)),
-                    "has_zip_report": bool(getattr(report, "zip_report", None)),
-                    "test_run_count": len(getattr(report, "test_runs", [])),
-                    "uri": f"test-report-run://{report.id}",
-                }
-            )
-
-        return json.dumps({"test_report_runs": report_list}, indent=2)
+        return _dumps({"test_report_runs": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing test report runs: {str(e)}"
 
 
 @mcp.resource("test-report-run://{report_id}")
+@require_auth
 async def get_test_report_run_resource(report_id: str) -> str:
     """Get a specific test report run as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        return json.dumps({"error": "Authentication failed - unable to connect to TestZeus"})
-
     try:
         report = await testzeus_client.test_report_runs.get_one(report_id)
-        report_data = {
-            "id": report.id,
-            "name": report.name,
-            "display_name": getattr(report, "display_name", None),
-            "status": report.status,
-            "schedule": getattr(report, "schedule", None),
-            "test_run_group": getattr(report, "test_run_group", None),
-            "trigger_time": str(getattr(report, "trigger_time", None)),
-            "end_time": str(getattr(report, "end_time", None)),
-            "ctrf_report": getattr(report, "ctrf_report", None),
-            "pdf_report": getattr(report, "pdf_report", None),
-            "csv_report": getattr(report, "csv_report", None),
-            "zip_report": getattr(report, "zip_report", None),
-            "ctrf_report_findings": getattr(report, "ctrf_report_findings", None),
-            "test_runs": getattr(report, "test_runs", []),
-            "created": str(report.created),
-            "updated": str(report.updated),
-            "tenant": report.tenant,
-            "modified_by": getattr(report, "modified_by", None),
-        }
-
-        return json.dumps(report_data, indent=2)
+        return _dumps(_test_report_run_resource_row(report))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting test report run: {str(e)}"
 
 
@@ -3939,86 +4197,22 @@ async def get_test_report_run_resource(report_id: str) -> str:
 
 
 @mcp.tool()
+@tz_tool("listing notification channels")
 async def list_notification_channels(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all notification channels in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        per_page = min(per_page, 100)  # Cap at 100
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.notification_channels.get_list(**params)
-        channels = result.get("items", [])
-
-        channel_list = []
-        for channel in channels:
-            channel_list.append(
-                {
-                    "id": channel.id,
-                    "name": getattr(channel, "name", None),
-                    "display_name": getattr(channel, "display_name", None),
-                    "is_active": getattr(channel, "is_active", False),
-                    "is_default": getattr(channel, "is_default", False),
-                    "emails": getattr(channel, "emails", {}),
-                    "webhooks": getattr(channel, "webhooks", {}),
-                    "created": str(channel.created),
-                    "updated": str(channel.updated),
-                }
-            )
-
-        if ctx:
-            await ctx.info(f"Retrieved {len(channel_list)} notification channels")
-
-        return json.dumps(
-            {
-                "notification_channels": channel_list,
-                "page": page,
-                "per_page": per_page,
-                "total": result.get("totalItems", len(channel_list)),
-            },
-            indent=2,
-            cls=DateTimeEncoder,
-        )
-    except Exception as e:
-        error_msg = f"Error listing notification channels: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def get_notification_channel(channel_id_or_name: str, ctx: Context = None) -> str:
-    """Get a specific notification channel by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.notification_channels.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    channels = result.get("items", [])
 
-    try:
-        channel = await testzeus_client.notification_channels.get_one(channel_id_or_name)
-        channel_data = {
+    channel_list = [
+        {
             "id": channel.id,
             "name": getattr(channel, "name", None),
             "display_name": getattr(channel, "display_name", None),
@@ -4026,25 +4220,51 @@ async def get_notification_channel(channel_id_or_name: str, ctx: Context = None)
             "is_default": getattr(channel, "is_default", False),
             "emails": getattr(channel, "emails", {}),
             "webhooks": getattr(channel, "webhooks", {}),
-            "created": str(channel.created),
-            "updated": str(channel.updated),
-            "modified_by": getattr(channel, "modified_by", None),
+            "created": channel.created,
+            "updated": channel.updated,
+        }
+        for channel in channels
+    ]
+
+    if ctx:
+        await ctx.info(f"Retrieved {len(channel_list)} notification channels")
+
+    return _dumps(
+        {
+            "notification_channels": channel_list,
+            "page": page,
+            "per_page": per_page,
+            "total": result.get("totalItems", len(channel_list)),
         }
+    )
 
-        if ctx:
-            await ctx.info(
-                f"Retrieved notification channel: {getattr(channel, 'name', channel.id)}"
-            )
 
-        return json.dumps(channel_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error getting notification channel: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+@mcp.tool()
+@tz_tool("getting notification channel")
+async def get_notification_channel(channel_id_or_name: str, ctx: Context = None) -> str:
+    """Get a specific notification channel by ID or name."""
+    channel = await testzeus_client.notification_channels.get_one(channel_id_or_name)
+    channel_data = {
+        "id": channel.id,
+        "name": getattr(channel, "name", None),
+        "display_name": getattr(channel, "display_name", None),
+        "is_active": getattr(channel, "is_active", False),
+        "is_default": getattr(channel, "is_default", False),
+        "emails": getattr(channel, "emails", {}),
+        "webhooks": getattr(channel, "webhooks", {}),
+        "created": channel.created,
+        "updated": channel.updated,
+        "modified_by": getattr(channel, "modified_by", None),
+    }
+
+    if ctx:
+        await ctx.info(f"Retrieved notification channel: {getattr(channel, 'name', channel.id)}")
+
+    return _dumps(channel_data)
 
 
 @mcp.tool()
+@tz_tool("creating notification channel")
 async def create_notification_channel(
     name: str,
     emails: list[str],
@@ -4066,47 +4286,32 @@ async def create_notification_channel(
     Returns:
         JSON string with created channel details
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        channel = await testzeus_client.notification_channels.create_notification_channel(
-            name=f"{name}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            display_name=name,
-            emails=emails,
-            webhooks=webhooks,
-            is_active=is_active,
-            is_default=is_default,
-        )
+    channel = await testzeus_client.notification_channels.create_notification_channel(
+        name=f"{name}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        display_name=name,
+        emails=emails,
+        webhooks=webhooks,
+        is_active=is_active,
+        is_default=is_default,
+    )
 
-        channel_data = {
-            "id": channel.id,
-            "name": getattr(channel, "name", None),
-            "display_name": getattr(channel, "display_name", None),
-            "is_active": getattr(channel, "is_active", False),
-            "is_default": getattr(channel, "is_default", False),
-            "created": str(channel.created),
-        }
+    channel_data = {
+        "id": channel.id,
+        "name": getattr(channel, "name", None),
+        "display_name": getattr(channel, "display_name", None),
+        "is_active": getattr(channel, "is_active", False),
+        "is_default": getattr(channel, "is_default", False),
+        "created": channel.created,
+    }
 
-        if ctx:
-            await ctx.info(f"Created notification channel: {getattr(channel, 'name', channel.id)}")
+    if ctx:
+        await ctx.info(f"Created notification channel: {getattr(channel, 'name', channel.id)}")
 
-        return json.dumps(channel_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error creating notification channel: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps(channel_data)
 
 
 @mcp.tool()
+@tz_tool("updating notification channel")
 async def update_notification_channel(
     channel_id_or_name: str,
     name: str | None = None,
@@ -4130,78 +4335,45 @@ async def update_notification_channel(
     Returns:
         JSON string with updated channel details
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        channel = await testzeus_client.notification_channels.update_notification_channel(
-            id_or_name=channel_id_or_name,
-            name=f"{name}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            display_name=name,
-            emails=emails,
-            webhooks=webhooks,
-            is_active=is_active,
-            is_default=is_default,
-        )
+    channel = await testzeus_client.notification_channels.update_notification_channel(
+        id_or_name=channel_id_or_name,
+        name=f"{name}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        display_name=name,
+        emails=emails,
+        webhooks=webhooks,
+        is_active=is_active,
+        is_default=is_default,
+    )
 
-        channel_data = {
-            "id": channel.id,
-            "name": getattr(channel, "name", None),
-            "display_name": getattr(channel, "display_name", None),
-            "is_active": getattr(channel, "is_active", False),
-            "is_default": getattr(channel, "is_default", False),
-            "updated": str(channel.updated),
-        }
+    channel_data = {
+        "id": channel.id,
+        "name": getattr(channel, "name", None),
+        "display_name": getattr(channel, "display_name", None),
+        "is_active": getattr(channel, "is_active", False),
+        "is_default": getattr(channel, "is_default", False),
+        "updated": channel.updated,
+    }
 
-        if ctx:
-            await ctx.info(f"Updated notification channel: {getattr(channel, 'name', channel.id)}")
+    if ctx:
+        await ctx.info(f"Updated notification channel: {getattr(channel, 'name', channel.id)}")
 
-        return json.dumps(channel_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error updating notification channel: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps(channel_data)
 
 
 @mcp.tool()
+@tz_tool("deleting notification channel")
 async def delete_notification_channel(channel_id_or_name: str, ctx: Context = None) -> str:
     """Delete a notification channel."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-    try:
-        await testzeus_client.notification_channels.delete(channel_id_or_name)
+    await testzeus_client.notification_channels.delete(channel_id_or_name)
 
-        if ctx:
-            await ctx.info(f"Deleted notification channel: {channel_id_or_name}")
+    if ctx:
+        await ctx.info(f"Deleted notification channel: {channel_id_or_name}")
 
-        return json.dumps(
-            {"message": f"Notification channel {channel_id_or_name} deleted successfully"},
-            indent=2,
-        )
-    except Exception as e:
-        error_msg = f"Error deleting notification channel: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps({"message": f"Notification channel {channel_id_or_name} deleted successfully"})
 
 
 @mcp.tool()
+@tz_tool("removing {config_type} config")
 async def remove_notification_config(
     channel_id_or_name: str,
     config_type: str,
@@ -4217,47 +4389,31 @@ async def remove_notification_config(
     Returns:
         JSON string with updated channel details
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        error_msg = "Authentication failed - unable to connect to TestZeus"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
     if config_type not in ["webhook", "slack"]:
         error_msg = "config_type must be one of: 'webhook', 'slack'"
         if ctx:
             await ctx.error(error_msg)
         return error_msg
 
-    try:
-        channel = await testzeus_client.notification_channels.remove_config(
-            id_or_name=channel_id_or_name,
-            config_type=config_type,
-        )
+    channel = await testzeus_client.notification_channels.remove_config(
+        id_or_name=channel_id_or_name,
+        config_type=config_type,
+    )
 
-        channel_data = {
-            "id": channel.id,
-            "name": getattr(channel, "name", None),
-            "message": f"Removed {config_type} configuration",
-            "updated": str(channel.updated),
-        }
+    channel_data = {
+        "id": channel.id,
+        "name": getattr(channel, "name", None),
+        "message": f"Removed {config_type} configuration",
+        "updated": channel.updated,
+    }
 
-        if ctx:
-            await ctx.info(
-                f"Removed {config_type} config from notification channel: "
-                f"{getattr(channel, 'name', channel.id)}"
-            )
+    if ctx:
+        await ctx.info(
+            f"Removed {config_type} config from notification channel: "
+            f"{getattr(channel, 'name', channel.id)}"
+        )
 
-        return json.dumps(channel_data, indent=2, cls=DateTimeEncoder)
-    except Exception as e:
-        error_msg = f"Error removing {config_type} config: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    return _dumps(channel_data)
 
 
 # ============================================================================
@@ -4266,66 +4422,26 @@ async def remove_notification_config(
 
 
 @mcp.resource("notification-channels://list")
+@require_auth
 async def list_notification_channels_resource() -> str:
     """List all notification channels as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        return json.dumps({"error": "Authentication failed - unable to connect to TestZeus"})
-
     try:
         result = await testzeus_client.notification_channels.get_list(per_page=100)
-        channels = result.get("items", [])
-
-        channel_list = []
-        for channel in channels:
-            channel_list.append(
-                {
-                    "id": channel.id,
-                    "name": getattr(channel, "name", None),
-                    "display_name": getattr(channel, "display_name", None),
-                    "is_active": getattr(channel, "is_active", False),
-                    "is_default": getattr(channel, "is_default", False),
-                    "has_emails": bool(getattr(channel, "emails", {})),
-                    "has_webhooks": bool(getattr(channel, "webhooks", {})),
-                    "uri": f"notification-channel://{channel.id}",
-                }
-            )
-
-        return json.dumps({"notification_channels": channel_list}, indent=2)
+        return _dumps({"notification_channels": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing notification channels: {str(e)}"
 
 
 @mcp.resource("notification-channel://{channel_id}")
+@require_auth
 async def get_notification_channel_resource(channel_id: str) -> str:
     """Get a specific notification channel as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        return json.dumps({"error": "Authentication failed - unable to connect to TestZeus"})
-
     try:
         channel = await testzeus_client.notification_channels.get_one(channel_id)
-        channel_data = {
-            "id": channel.id,
-            "name": getattr(channel, "name", None),
-            "display_name": getattr(channel, "display_name", None),
-            "is_active": getattr(channel, "is_active", False),
-            "is_default": getattr(channel, "is_default", False),
-            "emails": getattr(channel, "emails", {}),
-            "webhooks": getattr(channel, "webhooks", {}),
-            "created": str(channel.created),
-            "updated": str(channel.updated),
-            "modified_by": getattr(channel, "modified_by", None),
-        }
-
-        return json.dumps(channel_data, indent=2)
+        return _dumps(_notification_channel_resource_row(channel))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting notification channel: {str(e)}"
 
 
@@ -4335,76 +4451,26 @@ async def get_notification_channel_resource(channel_id: str) -> str:
 
 
 @mcp.resource("test-report-schedules://list")
+@require_auth
 async def list_test_report_schedules_resource() -> str:
     """List all test report schedules as a browsable resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        return json.dumps({"error": "Authentication failed - unable to connect to TestZeus"})
-
     try:
         result = await testzeus_client.test_report_schedules.get_list(per_page=100)
-        schedules = result.get("items", [])
-
-        schedule_list = []
-        for schedule in schedules:
-            schedule_list.append(
-                {
-                    "id": schedule.id,
-                    "name": schedule.name,
-                    "is_active": getattr(schedule, "is_active", False),
-                    "cron_expression": getattr(schedule, "cron_expression", None),
-                    "filter_tags": getattr(schedule, "filter_tags", []),
-                    "filter_tag_pattern": getattr(schedule, "filter_tag_pattern", None),
-                    "filter_env": getattr(schedule, "filter_env", []),
-                    "filter_env_pattern": getattr(schedule, "filter_env_pattern", None),
-                    "filter_test_data": getattr(schedule, "filter_test_data", []),
-                    "filter_test_data_pattern": getattr(schedule, "filter_test_data_pattern", None),
-                    "notification_channels": getattr(schedule, "notification_channels", []),
-                    "uri": f"test-report-schedule://{schedule.id}",
-                }
-            )
-
-        return json.dumps({"test_report_schedules": schedule_list}, indent=2)
+        return _dumps({"test_report_schedules": result.get("items", [])})
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error listing test report schedules: {str(e)}"
 
 
 @mcp.resource("test-report-schedule://{schedule_id}")
+@require_auth
 async def get_test_report_schedule_resource(schedule_id: str) -> str:
     """Get a specific test report schedule as a resource."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-
-    # Check if authentication was successful
-    if testzeus_client is None:
-        return json.dumps({"error": "Authentication failed - unable to connect to TestZeus"})
-
     try:
         schedule = await testzeus_client.test_report_schedules.get_one(schedule_id)
-        schedule_data = {
-            "id": schedule.id,
-            "name": schedule.name,
-            "is_active": getattr(schedule, "is_active", False),
-            "filter_name_pattern": getattr(schedule, "filter_name_pattern", None),
-            "filter_time_intervals": getattr(schedule, "filter_time_intervals", None),
-            "cron_expression": getattr(schedule, "cron_expression", None),
-            "filter_tags": getattr(schedule, "filter_tags", []),
-            "filter_tag_pattern": getattr(schedule, "filter_tag_pattern", None),
-            "filter_env": getattr(schedule, "filter_env", []),
-            "filter_env_pattern": getattr(schedule, "filter_env_pattern", None),
-            "filter_test_data": getattr(schedule, "filter_test_data", []),
-            "filter_test_data_pattern": getattr(schedule, "filter_test_data_pattern", None),
-            "notification_channels": getattr(schedule, "notification_channels", []),
-            "created": str(schedule.created),
-            "updated": str(schedule.updated),
-            "created_by": getattr(schedule, "created_by", None),
-        }
-
-        return json.dumps(schedule_data, indent=2)
+        return _dumps(_test_report_schedule_resource_row(schedule))
     except Exception as e:
+        _reset_auth_if_unauthorized(e)
         return f"Error getting test report schedule: {str(e)}"
 
 
@@ -4418,243 +4484,160 @@ async def get_test_report_schedule_resource(schedule_id: str) -> str:
 
 
 @mcp.tool()
+@tz_tool("listing knowledge bases")
 async def list_knowledge_bases(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all knowledge bases in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        params = {"page": page, "per_page": min(per_page, 100)}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.knowledge_bases.get_list(**params)
-        items = result.get("items", [])
-        kb_list = [
-            {
-                "id": kb.id,
-                "name": getattr(kb, "name", None),
-                "source": getattr(kb, "source", None),
-                "description": getattr(kb, "description", None),
-                "status": getattr(kb, "status", None),
-            }
-            for kb in items
-        ]
-        if ctx:
-            await ctx.info(f"Found {len(kb_list)} knowledge bases")
-        return f"Found {len(kb_list)} knowledge bases:\n{json.dumps(kb_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing knowledge bases: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def get_knowledge_base(knowledge_base_id_or_name: str, ctx: Context = None) -> str:
-    """Get a specific knowledge base by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        kb = await testzeus_client.knowledge_bases.get_one(knowledge_base_id_or_name)
-        kb_data = {
+    result = await testzeus_client.knowledge_bases.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    items = result.get("items", [])
+    kb_list = [
+        {
             "id": kb.id,
             "name": getattr(kb, "name", None),
             "source": getattr(kb, "source", None),
             "description": getattr(kb, "description", None),
             "status": getattr(kb, "status", None),
-            "tenant": getattr(kb, "tenant", None),
-            "modified_by": getattr(kb, "modified_by", None),
-            "created": str(getattr(kb, "created", None)),
-            "updated": str(getattr(kb, "updated", None)),
-        }
-        if ctx:
-            await ctx.info(f"Retrieved knowledge base: {kb_data['name']}")
-        return f"Knowledge base details:\n{json.dumps(kb_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting knowledge base: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+        }
+        for kb in items
+    ]
+    if ctx:
+        await ctx.info(f"Found {len(kb_list)} knowledge bases")
+    return f"Found {len(kb_list)} knowledge bases:\n{_dumps(kb_list)}"
+
+
+@mcp.tool()
+@tz_tool("getting knowledge base")
+async def get_knowledge_base(knowledge_base_id_or_name: str, ctx: Context = None) -> str:
+    """Get a specific knowledge base by ID or name."""
+    kb = await testzeus_client.knowledge_bases.get_one(knowledge_base_id_or_name)
+    kb_data = {
+        "id": kb.id,
+        "name": getattr(kb, "name", None),
+        "source": getattr(kb, "source", None),
+        "description": getattr(kb, "description", None),
+        "status": getattr(kb, "status", None),
+        "tenant": getattr(kb, "tenant", None),
+        "modified_by": getattr(kb, "modified_by", None),
+        "created": getattr(kb, "created", None),
+        "updated": getattr(kb, "updated", None),
+    }
+    if ctx:
+        await ctx.info(f"Retrieved knowledge base: {kb_data['name']}")
+    return f"Knowledge base details:\n{_dumps(kb_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating knowledge base")
 async def create_knowledge_base(
     name: str,
     source: str | None = None,
     description: str | None = None,
-    status: Literal["draft", "ready", "deleted"] = "draft",
+    status: EntityStatus = "draft",
     ctx: Context = None,
 ) -> str:
     """Create a new knowledge base."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {"name": name, "status": status}
-        if source is not None:
-            data["source"] = source
-        if description is not None:
-            data["description"] = description
-        kb = await testzeus_client.knowledge_bases.create(data)
-        if ctx:
-            await ctx.info(f"Created knowledge base: {name}")
-        return f"Successfully created knowledge base '{name}' with ID: {kb.id}"
-    except Exception as e:
-        error_msg = f"Error creating knowledge base: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data: dict[str, Any] = {"name": name, "status": status}
+    if source is not None:
+        data["source"] = source
+    if description is not None:
+        data["description"] = description
+    kb = await testzeus_client.knowledge_bases.create(data)
+    if ctx:
+        await ctx.info(f"Created knowledge base: {name}")
+    return f"Successfully created knowledge base '{name}' with ID: {kb.id}"
 
 
 @mcp.tool()
+@tz_tool("updating knowledge base")
 async def update_knowledge_base(
     knowledge_base_id: str,
     name: str | None = None,
     source: str | None = None,
     description: str | None = None,
-    status: Literal["draft", "ready", "deleted"] | None = None,
+    status: EntityStatus | None = None,
     ctx: Context = None,
 ) -> str:
     """Update a knowledge base."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {}
-        if name:
-            data["name"] = name
-        if source is not None:
-            data["source"] = source
-        if description is not None:
-            data["description"] = description
-        if status:
-            data["status"] = status
-        await testzeus_client.knowledge_bases.update(knowledge_base_id, data)
-        if ctx:
-            await ctx.info(f"Updated knowledge base: {knowledge_base_id}")
-        return f"Successfully updated knowledge base with ID: {knowledge_base_id}"
-    except Exception as e:
-        error_msg = f"Error updating knowledge base: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data = _provided(name=name, source=source, description=description, status=status)
+    await testzeus_client.knowledge_bases.update(knowledge_base_id, data)
+    if ctx:
+        await ctx.info(f"Updated knowledge base: {knowledge_base_id}")
+    return f"Successfully updated knowledge base with ID: {knowledge_base_id}"
 
 
 @mcp.tool()
+@tz_tool("deleting knowledge base")
 async def delete_knowledge_base(knowledge_base_id: str, ctx: Context = None) -> str:
     """Delete a knowledge base."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        await testzeus_client.knowledge_bases.delete(knowledge_base_id)
-        if ctx:
-            await ctx.info(f"Deleted knowledge base: {knowledge_base_id}")
-        return f"Successfully deleted knowledge base with ID: {knowledge_base_id}"
-    except Exception as e:
-        error_msg = f"Error deleting knowledge base: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.knowledge_bases.delete(knowledge_base_id)
+    if ctx:
+        await ctx.info(f"Deleted knowledge base: {knowledge_base_id}")
+    return f"Successfully deleted knowledge base with ID: {knowledge_base_id}"
 
 
 # ------------------------------- Extensions --------------------------------
 
 
 @mcp.tool()
+@tz_tool("listing extensions")
 async def list_extensions(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
     filters: dict[str, Any] | None = None,
     sort: str | list[str] | None = None,
 ) -> str:
     """List all extensions in TestZeus."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        params = {"page": page, "per_page": min(per_page, 100)}
-        if filters:
-            params["filters"] = filters
-        if sort:
-            params["sort"] = sort
-        result = await testzeus_client.extensions.get_list(**params)
-        items = result.get("items", [])
-        ext_list = [
-            {
-                "id": ext.id,
-                "name": getattr(ext, "name", None),
-                "data_content": getattr(ext, "data_content", None),
-                "response": getattr(ext, "response", None),
-                "submit": getattr(ext, "submit", None),
-            }
-            for ext in items
-        ]
-        if ctx:
-            await ctx.info(f"Found {len(ext_list)} extensions")
-        return f"Found {len(ext_list)} extensions:\n{json.dumps(ext_list, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error listing extensions: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
-
-
-@mcp.tool()
-async def get_extension(extension_id_or_name: str, ctx: Context = None) -> str:
-    """Get a specific extension by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        ext = await testzeus_client.extensions.get_one(extension_id_or_name)
-        ext_data = {
+    result = await testzeus_client.extensions.get_list(
+        page=page, per_page=per_page, filters=filters, sort=sort
+    )
+    items = result.get("items", [])
+    ext_list = [
+        {
             "id": ext.id,
             "name": getattr(ext, "name", None),
             "data_content": getattr(ext, "data_content", None),
             "response": getattr(ext, "response", None),
-            "metadata": getattr(ext, "metadata", None),
             "submit": getattr(ext, "submit", None),
-            "tenant": getattr(ext, "tenant", None),
-            "modified_by": getattr(ext, "modified_by", None),
-            "created": str(getattr(ext, "created", None)),
-            "updated": str(getattr(ext, "updated", None)),
         }
-        if ctx:
-            await ctx.info(f"Retrieved extension: {ext_data['name']}")
-        return f"Extension details:\n{json.dumps(ext_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting extension: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+        for ext in items
+    ]
+    if ctx:
+        await ctx.info(f"Found {len(ext_list)} extensions")
+    return f"Found {len(ext_list)} extensions:\n{_dumps(ext_list)}"
+
+
+@mcp.tool()
+@tz_tool("getting extension")
+async def get_extension(extension_id_or_name: str, ctx: Context = None) -> str:
+    """Get a specific extension by ID or name."""
+    ext = await testzeus_client.extensions.get_one(extension_id_or_name)
+    ext_data = {
+        "id": ext.id,
+        "name": getattr(ext, "name", None),
+        "data_content": getattr(ext, "data_content", None),
+        "response": getattr(ext, "response", None),
+        "metadata": getattr(ext, "metadata", None),
+        "submit": getattr(ext, "submit", None),
+        "tenant": getattr(ext, "tenant", None),
+        "modified_by": getattr(ext, "modified_by", None),
+        "created": getattr(ext, "created", None),
+        "updated": getattr(ext, "updated", None),
+    }
+    if ctx:
+        await ctx.info(f"Retrieved extension: {ext_data['name']}")
+    return f"Extension details:\n{_dumps(ext_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating extension")
 async def create_extension(
     name: str,
     data_content: str | None = None,
@@ -4663,29 +4646,19 @@ async def create_extension(
     ctx: Context = None,
 ) -> str:
     """Create a new extension."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {"name": name, "submit": submit}
-        if data_content is not None:
-            data["data_content"] = data_content
-        if metadata is not None:
-            data["metadata"] = metadata
-        ext = await testzeus_client.extensions.create(data)
-        if ctx:
-            await ctx.info(f"Created extension: {name}")
-        return f"Successfully created extension '{name}' with ID: {ext.id}"
-    except Exception as e:
-        error_msg = f"Error creating extension: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data: dict[str, Any] = {"name": name, "submit": submit}
+    if data_content is not None:
+        data["data_content"] = data_content
+    if metadata is not None:
+        data["metadata"] = metadata
+    ext = await testzeus_client.extensions.create(data)
+    if ctx:
+        await ctx.info(f"Created extension: {name}")
+    return f"Successfully created extension '{name}' with ID: {ext.id}"
 
 
 @mcp.tool()
+@tz_tool("updating extension")
 async def update_extension(
     extension_id: str,
     name: str | None = None,
@@ -4695,56 +4668,28 @@ async def update_extension(
     ctx: Context = None,
 ) -> str:
     """Update an extension."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {}
-        if name:
-            data["name"] = name
-        if data_content is not None:
-            data["data_content"] = data_content
-        if submit is not None:
-            data["submit"] = submit
-        if metadata is not None:
-            data["metadata"] = metadata
-        await testzeus_client.extensions.update(extension_id, data)
-        if ctx:
-            await ctx.info(f"Updated extension: {extension_id}")
-        return f"Successfully updated extension with ID: {extension_id}"
-    except Exception as e:
-        error_msg = f"Error updating extension: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data = _provided(name=name, data_content=data_content, submit=submit, metadata=metadata)
+    await testzeus_client.extensions.update(extension_id, data)
+    if ctx:
+        await ctx.info(f"Updated extension: {extension_id}")
+    return f"Successfully updated extension with ID: {extension_id}"
 
 
 @mcp.tool()
+@tz_tool("deleting extension")
 async def delete_extension(extension_id: str, ctx: Context = None) -> str:
     """Delete an extension."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        await testzeus_client.extensions.delete(extension_id)
-        if ctx:
-            await ctx.info(f"Deleted extension: {extension_id}")
-        return f"Successfully deleted extension with ID: {extension_id}"
-    except Exception as e:
-        error_msg = f"Error deleting extension: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.extensions.delete(extension_id)
+    if ctx:
+        await ctx.info(f"Deleted extension: {extension_id}")
+    return f"Successfully deleted extension with ID: {extension_id}"
 
 
 # ---------------------------- AI test generator ----------------------------
 
 
 @mcp.tool()
+@tz_tool("generating test")
 async def generate_test(
     user_prompt: str,
     test_feature: str | None = None,
@@ -4759,34 +4704,23 @@ async def generate_test(
 
     Creates a tests_ai_generator record; with submit=True the platform runs generation.
     """
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {
-            "user_prompt": user_prompt,
-            "reasoning_effort": reasoning_effort,
-            "submit": submit,
-        }
-        if test_feature is not None:
-            data["test_feature"] = test_feature
-        if environment is not None:
-            data["environment"] = environment
-        if test_data is not None:
-            data["test_data"] = test_data
-        if num_of_testcases is not None:
-            data["num_of_testcases"] = num_of_testcases
-        gen = await testzeus_client.tests_ai_generator.create(data)
-        if ctx:
-            await ctx.info("Submitted AI test generation request")
-        return f"Successfully submitted AI test generation request with ID: {gen.id}"
-    except Exception as e:
-        error_msg = f"Error generating test: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data: dict[str, Any] = {
+        "user_prompt": user_prompt,
+        "reasoning_effort": reasoning_effort,
+        "submit": submit,
+    }
+    if test_feature is not None:
+        data["test_feature"] = test_feature
+    if environment is not None:
+        data["environment"] = environment
+    if test_data is not None:
+        data["test_data"] = test_data
+    if num_of_testcases is not None:
+        data["num_of_testcases"] = num_of_testcases
+    gen = await testzeus_client.tests_ai_generator.create(data)
+    if ctx:
+        await ctx.info("Submitted AI test generation request")
+    return f"Successfully submitted AI test generation request with ID: {gen.id}"
 
 
 # --------------------------- Test suite schedules --------------------------
@@ -4794,38 +4728,29 @@ async def generate_test(
 
 
 @mcp.tool()
+@tz_tool("getting test suite schedule")
 async def get_test_suite_schedule(schedule_id_or_name: str, ctx: Context = None) -> str:
     """Get a specific test suite schedule by ID or name."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        sc = await testzeus_client.test_suite_schedules.get_one(schedule_id_or_name)
-        sc_data = {
-            "id": sc.id,
-            "name": getattr(sc, "name", None),
-            "display_name": getattr(sc, "display_name", None),
-            "test_suite": getattr(sc, "test_suite", None),
-            "cron_expression": getattr(sc, "cron_expression", None),
-            "is_active": getattr(sc, "is_active", None),
-            "environment": getattr(sc, "environment", None),
-            "notification_channels": getattr(sc, "notification_channels", None),
-            "next_run_at": str(getattr(sc, "next_run_at", None)),
-            "last_run_at": str(getattr(sc, "last_run_at", None)),
-        }
-        if ctx:
-            await ctx.info(f"Retrieved test suite schedule: {sc_data['name']}")
-        return f"Test suite schedule details:\n{json.dumps(sc_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test suite schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    sc = await testzeus_client.test_suite_schedules.get_one(schedule_id_or_name)
+    sc_data = {
+        "id": sc.id,
+        "name": getattr(sc, "name", None),
+        "display_name": getattr(sc, "display_name", None),
+        "test_suite": getattr(sc, "test_suite", None),
+        "cron_expression": getattr(sc, "cron_expression", None),
+        "is_active": getattr(sc, "is_active", None),
+        "environment": getattr(sc, "environment", None),
+        "notification_channels": getattr(sc, "notification_channels", None),
+        "next_run_at": getattr(sc, "next_run_at", None),
+        "last_run_at": getattr(sc, "last_run_at", None),
+    }
+    if ctx:
+        await ctx.info(f"Retrieved test suite schedule: {sc_data['name']}")
+    return f"Test suite schedule details:\n{_dumps(sc_data)}"
 
 
 @mcp.tool()
+@tz_tool("creating test suite schedule")
 async def create_test_suite_schedule(
     name: str,
     test_suite: str,
@@ -4838,38 +4763,28 @@ async def create_test_suite_schedule(
     ctx: Context = None,
 ) -> str:
     """Create a new test suite schedule (cron-based)."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {
-            "name": name,
-            "test_suite": test_suite,
-            "cron_expression": cron_expression,
-            "is_active": is_active,
-        }
-        if environment is not None:
-            data["environment"] = environment
-        if notification_channels is not None:
-            data["notification_channels"] = notification_channels
-        if display_name is not None:
-            data["display_name"] = display_name
-        if input_values is not None:
-            data["input_values"] = input_values
-        sc = await testzeus_client.test_suite_schedules.create(data)
-        if ctx:
-            await ctx.info(f"Created test suite schedule: {name}")
-        return f"Successfully created test suite schedule '{name}' with ID: {sc.id}"
-    except Exception as e:
-        error_msg = f"Error creating test suite schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data: dict[str, Any] = {
+        "name": name,
+        "test_suite": test_suite,
+        "cron_expression": cron_expression,
+        "is_active": is_active,
+    }
+    if environment is not None:
+        data["environment"] = environment
+    if notification_channels is not None:
+        data["notification_channels"] = notification_channels
+    if display_name is not None:
+        data["display_name"] = display_name
+    if input_values is not None:
+        data["input_values"] = input_values
+    sc = await testzeus_client.test_suite_schedules.create(data)
+    if ctx:
+        await ctx.info(f"Created test suite schedule: {name}")
+    return f"Successfully created test suite schedule '{name}' with ID: {sc.id}"
 
 
 @mcp.tool()
+@tz_tool("updating test suite schedule")
 async def update_test_suite_schedule(
     schedule_id: str,
     name: str | None = None,
@@ -4883,58 +4798,30 @@ async def update_test_suite_schedule(
     ctx: Context = None,
 ) -> str:
     """Update a test suite schedule."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        data: dict[str, Any] = {}
-        if name:
-            data["name"] = name
-        if test_suite:
-            data["test_suite"] = test_suite
-        if cron_expression:
-            data["cron_expression"] = cron_expression
-        if environment is not None:
-            data["environment"] = environment
-        if is_active is not None:
-            data["is_active"] = is_active
-        if notification_channels is not None:
-            data["notification_channels"] = notification_channels
-        if display_name is not None:
-            data["display_name"] = display_name
-        if input_values is not None:
-            data["input_values"] = input_values
-        await testzeus_client.test_suite_schedules.update(schedule_id, data)
-        if ctx:
-            await ctx.info(f"Updated test suite schedule: {schedule_id}")
-        return f"Successfully updated test suite schedule with ID: {schedule_id}"
-    except Exception as e:
-        error_msg = f"Error updating test suite schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    data = _provided(
+        name=name,
+        test_suite=test_suite,
+        cron_expression=cron_expression,
+        environment=environment,
+        is_active=is_active,
+        notification_channels=notification_channels,
+        display_name=display_name,
+        input_values=input_values,
+    )
+    await testzeus_client.test_suite_schedules.update(schedule_id, data)
+    if ctx:
+        await ctx.info(f"Updated test suite schedule: {schedule_id}")
+    return f"Successfully updated test suite schedule with ID: {schedule_id}"
 
 
 @mcp.tool()
+@tz_tool("deleting test suite schedule")
 async def delete_test_suite_schedule(schedule_id: str, ctx: Context = None) -> str:
     """Delete a test suite schedule."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        await testzeus_client.test_suite_schedules.delete(schedule_id)
-        if ctx:
-            await ctx.info(f"Deleted test suite schedule: {schedule_id}")
-        return f"Successfully deleted test suite schedule with ID: {schedule_id}"
-    except Exception as e:
-        error_msg = f"Error deleting test suite schedule: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.test_suite_schedules.delete(schedule_id)
+    if ctx:
+        await ctx.info(f"Deleted test suite schedule: {schedule_id}")
+    return f"Successfully deleted test suite schedule with ID: {schedule_id}"
 
 
 # ------------------------ Test suite node runs (get) -----------------------
@@ -4942,34 +4829,24 @@ async def delete_test_suite_schedule(schedule_id: str, ctx: Context = None) -> s
 
 
 @mcp.tool()
+@tz_tool("getting test suite node run")
 async def get_test_suite_node_run(node_run_id: str, ctx: Context = None) -> str:
     """Get a specific test suite node run by ID."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
-    try:
-        nr = await testzeus_client.test_suite_node_runs.get_one(node_run_id)
-        nr_data = {
-            "id": nr.id,
-            "test_suite_run": getattr(nr, "test_suite_run", None),
-            "node_id": getattr(nr, "node_id", None),
-            "status": getattr(nr, "status", None),
-            "test_run": getattr(nr, "test_run", None),
-            "retry_count": getattr(nr, "retry_count", None),
-            "max_retries": getattr(nr, "max_retries", None),
-            "started_at": str(getattr(nr, "started_at", None)),
-            "completed_at": str(getattr(nr, "completed_at", None)),
-        }
-        if ctx:
-            await ctx.info(f"Retrieved test suite node run: {node_run_id}")
-        return f"Test suite node run details:\n{json.dumps(nr_data, indent=2)}"
-    except Exception as e:
-        error_msg = f"Error getting test suite node run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    nr = await testzeus_client.test_suite_node_runs.get_one(node_run_id)
+    nr_data = {
+        "id": nr.id,
+        "test_suite_run": getattr(nr, "test_suite_run", None),
+        "node_id": getattr(nr, "node_id", None),
+        "status": getattr(nr, "status", None),
+        "test_run": getattr(nr, "test_run", None),
+        "retry_count": getattr(nr, "retry_count", None),
+        "max_retries": getattr(nr, "max_retries", None),
+        "started_at": getattr(nr, "started_at", None),
+        "completed_at": getattr(nr, "completed_at", None),
+    }
+    if ctx:
+        await ctx.info(f"Retrieved test suite node run: {node_run_id}")
+    return f"Test suite node run details:\n{_dumps(nr_data)}"
 
 
 # ---------------------- Connected-environment file ops ---------------------
@@ -4977,141 +4854,81 @@ async def get_test_suite_node_run(node_run_id: str, ctx: Context = None) -> str:
 
 
 @mcp.tool()
+@tz_tool("adding connected environment code file")
 async def add_connected_environment_code_file(
     connected_environment_id: str, file_path: str, ctx: Context = None
 ) -> str:
     """Add a code file to a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
     cid = connected_environment_id
-    try:
-        await testzeus_client.connected_environments.add_code_file(cid, file_path)
-        if ctx:
-            await ctx.info(f"Added code file to connected environment: {cid}")
-        return f"Successfully added code file to connected environment {cid}"
-    except Exception as e:
-        error_msg = f"Error adding connected environment code file: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await _upload(testzeus_client.connected_environments, cid, "code_files", file_path)
+    if ctx:
+        await ctx.info(f"Added code file to connected environment: {cid}")
+    return f"Successfully added code file to connected environment {cid}"
 
 
 @mcp.tool()
+@tz_tool("removing connected environment code file")
 async def remove_connected_environment_code_file(
     connected_environment_id: str, file_name: str, ctx: Context = None
 ) -> str:
     """Remove a code file from a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
     cid = connected_environment_id
-    try:
-        await testzeus_client.connected_environments.remove_code_file(cid, file_name)
-        if ctx:
-            await ctx.info(f"Removed code file from connected environment: {cid}")
-        return f"Successfully removed code file from connected environment {cid}"
-    except Exception as e:
-        error_msg = f"Error removing connected environment code file: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.connected_environments.remove_code_file(cid, file_name)
+    if ctx:
+        await ctx.info(f"Removed code file from connected environment: {cid}")
+    return f"Successfully removed code file from connected environment {cid}"
 
 
 @mcp.tool()
+@tz_tool("removing all connected environment code files")
 async def remove_all_connected_environment_code_files(
     connected_environment_id: str, ctx: Context = None
 ) -> str:
     """Remove all code files from a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
     cid = connected_environment_id
-    try:
-        await testzeus_client.connected_environments.remove_all_code_files(cid)
-        if ctx:
-            await ctx.info(f"Removed all code files from connected environment: {cid}")
-        return f"Successfully removed all code files from connected environment {cid}"
-    except Exception as e:
-        error_msg = f"Error removing all connected environment code files: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.connected_environments.remove_all_code_files(cid)
+    if ctx:
+        await ctx.info(f"Removed all code files from connected environment: {cid}")
+    return f"Successfully removed all code files from connected environment {cid}"
 
 
 @mcp.tool()
+@tz_tool("adding connected environment metadata file")
 async def add_connected_environment_metadata_file(
     connected_environment_id: str, file_path: str, ctx: Context = None
 ) -> str:
     """Add a metadata file to a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
     cid = connected_environment_id
-    try:
-        await testzeus_client.connected_environments.add_metadata_file(cid, file_path)
-        if ctx:
-            await ctx.info(f"Added metadata file to connected environment: {cid}")
-        return f"Successfully added metadata file to connected environment {cid}"
-    except Exception as e:
-        error_msg = f"Error adding connected environment metadata file: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await _upload(testzeus_client.connected_environments, cid, "metadata_files", file_path)
+    if ctx:
+        await ctx.info(f"Added metadata file to connected environment: {cid}")
+    return f"Successfully added metadata file to connected environment {cid}"
 
 
 @mcp.tool()
+@tz_tool("removing connected environment metadata file")
 async def remove_connected_environment_metadata_file(
     connected_environment_id: str, file_name: str, ctx: Context = None
 ) -> str:
     """Remove a metadata file from a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
     cid = connected_environment_id
-    try:
-        await testzeus_client.connected_environments.remove_metadata_file(cid, file_name)
-        if ctx:
-            await ctx.info(f"Removed metadata file from connected environment: {cid}")
-        return f"Successfully removed metadata file from connected environment {cid}"
-    except Exception as e:
-        error_msg = f"Error removing connected environment metadata file: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.connected_environments.remove_metadata_file(cid, file_name)
+    if ctx:
+        await ctx.info(f"Removed metadata file from connected environment: {cid}")
+    return f"Successfully removed metadata file from connected environment {cid}"
 
 
 @mcp.tool()
+@tz_tool("removing all connected environment metadata files")
 async def remove_all_connected_environment_metadata_files(
     connected_environment_id: str, ctx: Context = None
 ) -> str:
     """Remove all metadata files from a connected environment."""
-    if not await ensure_authenticated():
-        await authenticate_testzeus()
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
-
     cid = connected_environment_id
-    try:
-        await testzeus_client.connected_environments.remove_all_metadata_files(cid)
-        if ctx:
-            await ctx.info(f"Removed all metadata files from connected environment: {cid}")
-        return f"Successfully removed all metadata files from connected environment {cid}"
-    except Exception as e:
-        error_msg = f"Error removing all connected environment metadata files: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    await testzeus_client.connected_environments.remove_all_metadata_files(cid)
+    if ctx:
+        await ctx.info(f"Removed all metadata files from connected environment: {cid}")
+    return f"Successfully removed all metadata files from connected environment {cid}"
 
 
 # =====================================================================
@@ -5128,12 +4945,10 @@ async def _prepare_agent_harness() -> str | None:
     authenticated and the installed SDK exposes the agent_harness manager. Captures
     authenticate_testzeus()'s return so wrong-credential failures surface clearly.
     """
-    if not await ensure_authenticated():
+    if not _auth_is_fresh() and not await ensure_authenticated():
         auth_result = await authenticate_testzeus()
         if not await ensure_authenticated():
             return auth_result
-    if testzeus_client is None:
-        return "Authentication failed - unable to connect to TestZeus"
     if not hasattr(testzeus_client, "agent_harness"):
         return (
             "Agent Harness requires a newer testzeus-sdk. Upgrade with: pip install -U testzeus-sdk"
@@ -5142,9 +4957,10 @@ async def _prepare_agent_harness() -> str | None:
 
 
 @mcp.tool()
+@tz_tool("listing adversary agents")
 async def list_adversary_agents(
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     status: str | None = None,
     search: str | None = None,
     ctx: Context = None,
@@ -5154,58 +4970,48 @@ async def list_adversary_agents(
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.list_agents(
-            page=page,
-            per_page=min(per_page, 100),
-            status=status,
-            search=search,
-        )
-        items = result.get("items", []) if isinstance(result, dict) else result
-        agent_list = [
-            {
-                "id": a.get("id"),
-                "name": a.get("name"),
-                "status": a.get("status"),
-                "pathways_count": a.get("pathways_count"),
-            }
-            for a in items
-        ]
-        if ctx:
-            await ctx.info(f"Found {len(agent_list)} agents")
-        payload = json.dumps(agent_list, indent=2, cls=DateTimeEncoder)
-        return f"Found {len(agent_list)} agents:\n{payload}"
-    except Exception as e:
-        error_msg = f"Error listing adversary agents: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.list_agents(
+        page=page,
+        per_page=per_page,
+        status=status,
+        search=search,
+    )
+    items = result.get("items", []) if isinstance(result, dict) else result
+    agent_list = [
+        {
+            "id": a.get("id"),
+            "name": a.get("name"),
+            "status": a.get("status"),
+            "pathways_count": a.get("pathways_count"),
+        }
+        for a in items
+    ]
+    if ctx:
+        await ctx.info(f"Found {len(agent_list)} agents")
+    payload = _dumps(agent_list)
+    return f"Found {len(agent_list)} agents:\n{payload}"
 
 
 @mcp.tool()
+@tz_tool("getting adversary agent")
 async def get_adversary_agent(agent_id: str, ctx: Context = None) -> str:
     """Get details for a single Agent Harness agent by ID."""
     guard = await _prepare_agent_harness()
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.get_agent(agent_id)
-        if ctx:
-            await ctx.info(f"Retrieved agent {agent_id}")
-        return f"Agent details:\n{json.dumps(result, indent=2, cls=DateTimeEncoder)}"
-    except Exception as e:
-        error_msg = f"Error getting adversary agent: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.get_agent(agent_id)
+    if ctx:
+        await ctx.info(f"Retrieved agent {agent_id}")
+    return f"Agent details:\n{_dumps(result)}"
 
 
 @mcp.tool()
+@tz_tool("listing adversary pathways")
 async def list_adversary_pathways(
     agent_id: str | None = None,
     page: int = 1,
-    per_page: int = 50,
+    per_page: PerPage = 50,
     ctx: Context = None,
 ) -> str:
     """List adversarial test pathways, optionally scoped to a single agent."""
@@ -5213,35 +5019,30 @@ async def list_adversary_pathways(
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.list_pathways(
-            agent_id=agent_id,
-            page=page,
-            per_page=min(per_page, 100),
-        )
-        items = result.get("items", []) if isinstance(result, dict) else result
-        pathway_list = [
-            {
-                "id": getattr(p, "id", None),
-                "name": getattr(p, "name", None),
-                "objective": getattr(p, "objective", None),
-                "risk_level": getattr(p, "risk_level", None),
-                "agent_id": getattr(p, "agent_id", None),
-            }
-            for p in items
-        ]
-        if ctx:
-            await ctx.info(f"Found {len(pathway_list)} pathways")
-        payload = json.dumps(pathway_list, indent=2, cls=DateTimeEncoder)
-        return f"Found {len(pathway_list)} pathways:\n{payload}"
-    except Exception as e:
-        error_msg = f"Error listing adversary pathways: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.list_pathways(
+        agent_id=agent_id,
+        page=page,
+        per_page=per_page,
+    )
+    items = result.get("items", []) if isinstance(result, dict) else result
+    pathway_list = [
+        {
+            "id": getattr(p, "id", None),
+            "name": getattr(p, "name", None),
+            "objective": getattr(p, "objective", None),
+            "risk_level": getattr(p, "risk_level", None),
+            "agent_id": getattr(p, "agent_id", None),
+        }
+        for p in items
+    ]
+    if ctx:
+        await ctx.info(f"Found {len(pathway_list)} pathways")
+    payload = _dumps(pathway_list)
+    return f"Found {len(pathway_list)} pathways:\n{payload}"
 
 
 @mcp.tool()
+@tz_tool("generating adversary pathways")
 async def generate_adversary_pathways(
     agent_profile: str,
     directional_prompt: str,
@@ -5256,27 +5057,22 @@ async def generate_adversary_pathways(
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.generate_pathways(
-            agent_profile=agent_profile,
-            directional_prompt=directional_prompt,
-            name=name,
-            agent_name=agent_name,
-            num_pathways=num_pathways,
-            allow_destructive=allow_destructive,
-        )
-        if ctx:
-            await ctx.info("Started pathway generation")
-        payload = json.dumps(result.data, indent=2, cls=DateTimeEncoder)
-        return f"Pathway generation started:\n{payload}"
-    except Exception as e:
-        error_msg = f"Error generating adversary pathways: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.generate_pathways(
+        agent_profile=agent_profile,
+        directional_prompt=directional_prompt,
+        name=name,
+        agent_name=agent_name,
+        num_pathways=num_pathways,
+        allow_destructive=allow_destructive,
+    )
+    if ctx:
+        await ctx.info("Started pathway generation")
+    payload = _dumps(result.data)
+    return f"Pathway generation started:\n{payload}"
 
 
 @mcp.tool()
+@tz_tool("running adversary simulation")
 async def run_adversary_simulation(
     agent_id: str,
     pathway_ids: list[str],
@@ -5292,82 +5088,111 @@ async def run_adversary_simulation(
     if not pathway_ids:
         return "Error running adversary simulation: provide at least one pathway_id"
 
-    try:
-        result = await testzeus_client.agent_harness.run(
-            agent_id,
-            pathway_ids,
-            name=name,
-            agent_name=agent_name,
-            run_as_profile=run_as_profile,
-        )
-        group_id = getattr(result, "id", None)
-        if ctx:
-            await ctx.info(f"Started simulation run (group {group_id})")
-        payload = json.dumps(result.data, indent=2, cls=DateTimeEncoder)
-        return f"Simulation run started (group {group_id}):\n{payload}"
-    except Exception as e:
-        error_msg = f"Error running adversary simulation: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.run(
+        agent_id,
+        pathway_ids,
+        name=name,
+        agent_name=agent_name,
+        run_as_profile=run_as_profile,
+    )
+    group_id = getattr(result, "id", None)
+    if ctx:
+        await ctx.info(f"Started simulation run (group {group_id})")
+    payload = _dumps(result.data)
+    return f"Simulation run started (group {group_id}):\n{payload}"
 
 
 @mcp.tool()
+@tz_tool("getting adversary run status")
 async def get_adversary_run_status(group_id: str, ctx: Context = None) -> str:
     """Get status and results for an adversarial simulation run group."""
     guard = await _prepare_agent_harness()
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.get_status(group_id)
-        if ctx:
-            await ctx.info(f"Retrieved status for group {group_id}")
-        return f"Run status:\n{json.dumps(result, indent=2, cls=DateTimeEncoder)}"
-    except Exception as e:
-        error_msg = f"Error getting adversary run status: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.get_status(group_id)
+    if ctx:
+        await ctx.info(f"Retrieved status for group {group_id}")
+    return f"Run status:\n{_dumps(result)}"
 
 
 @mcp.tool()
+@tz_tool("cancelling adversary run")
 async def cancel_adversary_run(group_id: str, ctx: Context = None) -> str:
     """Cancel a running adversarial simulation group."""
     guard = await _prepare_agent_harness()
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.cancel(group_id)
-        if ctx:
-            await ctx.info(f"Cancelled simulation group {group_id}")
-        payload = json.dumps(result, indent=2, cls=DateTimeEncoder)
-        return f"Cancelled simulation group {group_id}:\n{payload}"
-    except Exception as e:
-        error_msg = f"Error cancelling adversary run: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.cancel(group_id)
+    if ctx:
+        await ctx.info(f"Cancelled simulation group {group_id}")
+    payload = _dumps(result)
+    return f"Cancelled simulation group {group_id}:\n{payload}"
 
 
 @mcp.tool()
+@tz_tool("getting Salesforce run-as profiles")
 async def get_salesforce_run_as_profiles(connection_id: str, ctx: Context = None) -> str:
     """Get Salesforce user profiles for the Run-As-User (RBAC) picker."""
     guard = await _prepare_agent_harness()
     if guard:
         return guard
 
-    try:
-        result = await testzeus_client.agent_harness.get_sf_profiles(connection_id)
-        if ctx:
-            await ctx.info(f"Retrieved Salesforce profiles for connection {connection_id}")
-        return f"Salesforce profiles:\n{json.dumps(result, indent=2, cls=DateTimeEncoder)}"
-    except Exception as e:
-        error_msg = f"Error getting Salesforce run-as profiles: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        return error_msg
+    result = await testzeus_client.agent_harness.get_sf_profiles(connection_id)
+    if ctx:
+        await ctx.info(f"Retrieved Salesforce profiles for connection {connection_id}")
+    return f"Salesforce profiles:\n{_dumps(result)}"
+
+
+RecordKind = Literal["test", "test_run", "environment", "test_data", "tag"]
+# get_records kinds: the SDK manager each is fetched from and the row it is returned as
+_RECORD_KINDS: dict[str, tuple[str, Callable[[Any], dict[str, Any]]]] = {
+    "test": ("tests", _test_detail_row),
+    "test_run": ("test_runs", _test_run_resource_row),
+    "environment": ("environments", functools.partial(_serialize_environment, detail=True)),
+    "test_data": ("test_data", _test_data_detail_row),
+    "tag": ("tags", _tag_detail_row),
+}
+
+
+@mcp.tool()
+@tz_tool("getting {kind} records")
+async def get_records(kind: RecordKind, ids_or_names: list[str], ctx: Context = None) -> str:
+    """Get several records of one kind by ID or name in one call.
+
+    IDs are resolved together with a single list request. Each entry reports either
+    the record or the error for that ID or name.
+    """
+    collection, build_row = _RECORD_KINDS[kind]
+
+    async def fetch(id_or_name: str) -> dict[str, Any]:
+        return build_row(await _load_batched(collection, id_or_name))
+
+    outcomes = await _for_each(ids_or_names, fetch)
+    found = _count_ok(outcomes)
+
+    if ctx:
+        await ctx.info(f"Retrieved {found} of {len(outcomes)} {kind} records")
+
+    return f"Retrieved {found} of {len(outcomes)} {kind} records:\n{_dumps(outcomes)}"
+
+
+def _remove_disabled_tools() -> None:
+    """Unregister the tools named in TESTZEUS_DISABLED_TOOLS (comma-separated).
+
+    Every registered tool's schema is sent to the model, so deployments that never use
+    some tools can keep them out of its context.
+    """
+    for name in os.getenv("TESTZEUS_DISABLED_TOOLS", "").split(","):
+        if name := name.strip():
+            try:
+                mcp.remove_tool(name)
+            except ToolError:
+                logger.warning("TESTZEUS_DISABLED_TOOLS names an unknown tool: %s", name)
+
+
+_remove_disabled_tools()
 
 
 # Server run function for backwards compatibility
@@ -5377,4 +5202,8 @@ async def run():
 
 
 if __name__ == "__main__":
+    # Pick the event loop the same way the console script does
+    from testzeus_mcp_server.__main__ import _install_uvloop
+
+    _install_uvloop()
     mcp.run()